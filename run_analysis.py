@@ -20,8 +20,9 @@ def main():
     print("1. 상세 통계 분석 (추천)")
     print("2. 기본 성능 테스트")
     print("3. 커스텀 분석")
+    print("4. 보드 비교 매트릭스 (Uno / Nano / ESP32)")
     
-    choice = input("\n선택하세요 (1-3, 기본값: 1): ").strip() or "1"
+    choice = input("\n선택하세요 (1-4, 기본값: 1): ").strip() or "1"
     
     try:
         if choice == "1":
@@ -67,6 +68,35 @@ def main():
                 print(f"\n✅ 커스텀 분석 완료!")
                 print(f"📄 보고서: custom_analysis_{seed}_{iterations}.txt")
             
+        elif choice == "4":
+            print("\n🔌 보드 비교 매트릭스 생성...")
+            
+            from board_profiles import BOARD_PROFILES
+            print(f"사용 가능한 보드: {', '.join(BOARD_PROFILES)}")
+            boards = input("보드 목록 (쉼표 구분, 기본값: 전체): ").strip()
+            boards = [b.strip() for b in boards.split(",") if b.strip()] or None
+            
+            iterations = input("반복 횟수 (기본값: 1000): ").strip()
+            iterations = int(iterations) if iterations.isdigit() else 1000
+            
+            from real_arduino_sim import sweep_real_implementations_across_boards
+            from multi_implementation_sim import MultiImplementationSimulator
+            simulator = MultiImplementationSimulator(
+                os.path.join(project_root, 'config', 'arduino_implementations.yaml')
+            )
+            sweeps = {
+                "real": sweep_real_implementations_across_boards(boards, iterations),
+                "simple": simulator.run_board_sweep(boards, iterations),
+            }
+            
+            import json
+            os.makedirs(os.path.join(project_root, 'reports'), exist_ok=True)
+            report_file = os.path.join(project_root, 'reports', f"board_sweep_{iterations}.json")
+            with open(report_file, "w", encoding="utf-8") as f:
+                json.dump(sweeps, f, indent=2, ensure_ascii=False)
+            print(f"\n✅ 보드 비교 완료!")
+            print(f"📄 결과: {report_file}")
+            
         else:
             print("❌ 잘못된 선택입니다.")
             
@@ -0,0 +1,138 @@
+"""
+Arduino ADC Simulation
+analogRead() 노이즈 모델 - NumPy 블록으로 미리 생성한 노이즈를 버퍼에서 공급
+
+노이즈 구성 (모두 LSB 단위):
+- gaussian: 열잡음 등 백색 가우시안 노이즈
+- quantization: 입력이 LSB 격자에 맞지 않아 생기는 ±0.5 LSB 균등 노이즈
+- drift: 기준 전압/온도 변화에 따른 느린 랜덤 워크 (±drift_limit로 제한)
+
+같은 시드라면 analogRead() 반복 호출과 analogReadBurst()는 같은 값을 반환한다.
+"""
+
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class AdcNoiseModel:
+    """ADC 노이즈 설정 (기본값: 표준편차 2 LSB 가우시안만 적용)"""
+
+    noise_std: float = 2.0
+    quantization: bool = False
+    drift_std: float = 0.0  # 샘플당 드리프트 변화량 표준편차
+    drift_limit: float = 8.0
+    block_size: int = DEFAULT_BLOCK_SIZE
+
+
+class AdcChannel:
+    """핀 1개의 노이즈 버퍼와 현재 입력값 기준 변환 결과 캐시"""
+
+    __slots__ = ("noise", "pos", "drift", "base", "last_base", "readings")
+
+    def __init__(self):
+        self.noise = np.empty(0)
+        self.pos = 0
+        self.drift = 0.0
+        self.base = None  # readings를 계산한 입력값
+        self.last_base = None  # 직전 read()의 입력값
+        self.readings: List[int] = []
+
+
+class AdcSimulator:
+    """핀별 노이즈 블록을 관리하는 ADC 시뮬레이터"""
+
+    def __init__(
+        self,
+        pin_count: int,
+        max_value: int,
+        model: Optional[AdcNoiseModel] = None,
+        seed: Optional[int] = None,
+    ):
+        self.model = model or AdcNoiseModel()
+        self.max_value = max_value
+        self.rng = np.random.default_rng(seed)
+        self.channels = [AdcChannel() for _ in range(pin_count)]
+
+    def _generate_noise(self, channel: AdcChannel, n: int) -> np.ndarray:
+        """노이즈 n개 생성 (드리프트 상태 이어서)"""
+        model = self.model
+        noise = self.rng.normal(0.0, model.noise_std, n)
+        if model.quantization:
+            noise += self.rng.uniform(-0.5, 0.5, n)
+        if model.drift_std > 0:
+            drift = channel.drift + np.cumsum(self.rng.normal(0.0, model.drift_std, n))
+            np.clip(drift, -model.drift_limit, model.drift_limit, out=drift)
+            channel.drift = float(drift[-1])
+            noise += drift
+        return noise
+
+    def _convert(self, base: float, noise: np.ndarray) -> np.ndarray:
+        """입력값 + 노이즈를 ADC 출력 범위의 정수로 변환"""
+        return np.clip(np.trunc(base + noise), 0, self.max_value).astype(np.int64)
+
+    def _refill(self, channel: AdcChannel):
+        channel.noise = self._generate_noise(channel, self.model.block_size)
+        channel.pos = 0
+        channel.base = None
+
+    def read(self, pin: int, base: float) -> int:
+        """analogRead() 1회 (버퍼에서 공급)"""
+        channel = self.channels[pin]
+        if channel.pos >= len(channel.noise):
+            self._refill(channel)
+        if channel.base != base:
+            if channel.last_base != base:
+                # 입력값이 바뀐 직후에는 한 개만 변환 (매 호출 바뀌는 입력 대비)
+                channel.last_base = base
+                value = int(base + channel.noise[channel.pos])
+                channel.pos += 1
+                return min(max(value, 0), self.max_value)
+            # 같은 입력값이 이어지면 남은 버퍼를 한 번에 변환
+            channel.readings = [0] * channel.pos + self._convert(
+                base, channel.noise[channel.pos :]
+            ).tolist()
+            channel.base = base
+
+        value = channel.readings[channel.pos]
+        channel.pos += 1
+        return value
+
+    def read_burst(self, pin: int, base: float, n: int) -> np.ndarray:
+        """analogRead() n회와 같은 결과를 배열로 반환"""
+        channel = self.channels[pin]
+        buffered = channel.noise[channel.pos : channel.pos + n]
+        channel.pos += len(buffered)
+
+        missing = n - len(buffered)
+        if missing > 0:
+            # 부족분은 read()와 같은 블록 순서로 생성하고 마지막 블록은 버퍼로 보관
+            blocks = [buffered]
+            while missing > 0:
+                self._refill(channel)
+                channel.pos = min(missing, len(channel.noise))
+                blocks.append(channel.noise[: channel.pos])
+                missing -= channel.pos
+            buffered = np.concatenate(blocks)
+
+        return self._convert(base, buffered)
+
+    def getstate(self) -> Any:
+        """RNG와 채널 버퍼 상태 캡처 (버퍼 배열은 수정되지 않으므로 공유)"""
+        return (
+            self.rng.bit_generator.state,
+            tuple((ch.noise, ch.pos, ch.drift) for ch in self.channels),
+        )
+
+    def setstate(self, state: Any):
+        rng_state, channels = state
+        self.rng.bit_generator.state = rng_state
+        for channel, (noise, pos, drift) in zip(self.channels, channels):
+            channel.noise = noise
+            channel.pos = pos
+            channel.drift = drift
+            channel.base = channel.last_base = None
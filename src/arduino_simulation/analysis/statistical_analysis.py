@@ -13,7 +13,7 @@ Statistical Analysis for Arduino Implementations
 import os
 import sys
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -24,8 +24,11 @@ import yaml
 # 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from arduino_mock import ArduinoUnoR4WiFiMock
+from arduino_mock import MockPool
+from markov_analysis import derive_markov_model, format_probabilities
 from real_arduino_sim import RealArduinoImplementationGenerator
+from sequence_analysis import analyze_sequence
+from trit_sequence import TritSequence
 
 
 class StatisticalAnalyzer:
@@ -35,6 +38,9 @@ class StatisticalAnalyzer:
         self.implementations = self._load_implementations()
         self.results = {}
 
+        # 구현마다 Mock을 새로 만들지 않고 조용히 초기화해서 재사용
+        self.mock_pool = MockPool()
+
     def _load_implementations(self) -> List[Dict[str, Any]]:
         """구현 목록 로드"""
         try:
@@ -74,29 +80,33 @@ class StatisticalAnalyzer:
 
             try:
                 # 시뮬레이션 실행
-                arduino = ArduinoUnoR4WiFiMock(seed=seed)
-                generator = RealArduinoImplementationGenerator(impl, arduino)
+                with self.mock_pool.mock(seed) as arduino:
+                    generator = RealArduinoImplementationGenerator(
+                        impl, arduino, verbose=False
+                    )
 
-                # 숫자 생성
-                generated_numbers = []
-                previous = -1
+                    # 숫자 생성
+                    generated_numbers = TritSequence()  # 바이트당 5개 압축 저장
+                    previous = -1
 
-                for _ in range(iterations):
-                    number = generator.generate_number(previous)
-                    generated_numbers.append(number)
-                    previous = number
+                    for _ in range(iterations):
+                        number = generator.generate_number(previous)
+                        generated_numbers.append(number)
+                        previous = number
 
-                # 통계 분석
+                # 통계 분석 (실측 + 전이 행렬 기반 정확한 값)
                 stats = self._analyze_sequence(generated_numbers, impl["name"])
+                analytic = self._derive_analytic(impl, iterations)
                 all_results[impl["id"]] = {
                     "name": impl["name"],
                     "type": impl["type"],
                     "sequence": generated_numbers,
                     "stats": stats,
+                    "analytic": analytic,
                 }
 
                 # 결과 출력
-                self._print_implementation_stats(impl["name"], stats)
+                self._print_implementation_stats(impl["name"], stats, analytic)
 
             except Exception as e:
                 print(f"❌ Error analyzing {impl['name']}: {e}")
@@ -107,23 +117,22 @@ class StatisticalAnalyzer:
 
         return all_results
 
-    def _analyze_sequence(self, sequence: List[int], name: str) -> Dict[str, Any]:
+    def _analyze_sequence(
+        self, sequence: Union[List[int], TritSequence], name: str
+    ) -> Dict[str, Any]:
         """시퀀스의 상세 통계 분석"""
-        total = len(sequence)
+        # 빈도, 전이, 위반 수를 한 번에 집계
+        counts = analyze_sequence(sequence)
+        total = counts.total
 
         # 1. 전체 빈도 분석
-        frequencies = {i: sequence.count(i) for i in range(3)}
+        frequencies = counts.distribution_dict()
         freq_percentages = {
             i: round(count / total, 3) for i, count in frequencies.items()
         }
 
         # 2. 조건부 확률 분석
-        transitions = defaultdict(lambda: defaultdict(int))
-
-        for i in range(1, len(sequence)):
-            prev = sequence[i - 1]
-            curr = sequence[i]
-            transitions[prev][curr] += 1
+        transitions = counts.transition_rows()
 
         # 조건부 확률 계산
         conditional_probs = {}
@@ -142,9 +151,7 @@ class StatisticalAnalyzer:
         bias_analysis = self._analyze_bias(conditional_probs)
 
         # 4. 제약 조건 검증
-        violations = sum(
-            1 for i in range(1, len(sequence)) if sequence[i] == sequence[i - 1]
-        )
+        violations = counts.violations
 
         # 5. 균등성 검증 (카이제곱 검정)
         expected = total / 3
@@ -160,9 +167,24 @@ class StatisticalAnalyzer:
             "bias_analysis": bias_analysis,
             "violations": violations,
             "chi_square": chi_square,
-            "transitions": dict(transitions),
+            "transitions": transitions,
         }
 
+    def _derive_analytic(
+        self, impl: Dict[str, Any], iterations: int
+    ) -> Optional[Dict[str, Any]]:
+        """전이 행렬, 정상 분포, 기대 위반 수, 엔트로피 (마르코프 체인이 아니면 None)"""
+        try:
+            model = derive_markov_model(
+                lambda arduino: RealArduinoImplementationGenerator(
+                    impl, arduino, verbose=False
+                )
+            )
+        except ValueError as e:
+            print(f"  Analytic model unavailable: {e}")
+            return None
+        return model.to_dict(iterations) if model else None
+
     def _analyze_bias(
         self, conditional_probs: Dict[int, List[float]]
     ) -> Dict[str, Any]:
@@ -196,16 +218,33 @@ class StatisticalAnalyzer:
 
         return bias_results
 
-    def _print_implementation_stats(self, name: str, stats: Dict[str, Any]):
-        """구현별 통계 출력"""
+    def _print_implementation_stats(
+        self,
+        name: str,
+        stats: Dict[str, Any],
+        analytic: Optional[Dict[str, Any]] = None,
+    ):
+        """구현별 통계 출력 (analytic이 있으면 정확한 값을 나란히 표시)"""
         print(f"  Overall Frequencies: {stats['freq_percentages']}")
+        if analytic:
+            stationary = format_probabilities(analytic["stationary_distribution"])
+            print(f"    Exact stationary: {stationary}")
         print("  Conditional Probabilities:")
         for prev in range(3):
             probs = stats["conditional_probs"][prev]
             bias_info = stats["bias_analysis"].get(f"prev_{prev}", {})
             bias_type = bias_info.get("type", "Unknown")
-            print(f"    Prev {prev}: {probs} - {bias_type}")
+            exact = ""
+            if analytic:
+                row = format_probabilities(analytic["transition_matrix"][prev])
+                exact = f" (exact {row})"
+            print(f"    Prev {prev}: {probs}{exact} - {bias_type}")
         print(f"  Violations: {stats['violations']}")
+        if analytic:
+            print(
+                f"    Expected: {analytic['expected_violations']:.1f}, "
+                f"entropy rate {analytic['entropy_rate_bits']:.3f} bits/gen"
+            )
         print(f"  Chi-square: {stats['chi_square']:.3f}")
 
     def _generate_comprehensive_report(self, results: Dict[str, Any]):
@@ -11,13 +11,27 @@ Hardware Specifications:
 - Digital Pins: 14 (6 PWM)
 - Analog Inputs: 6 (12-bit ADC)
 - Operating Voltage: 5V
+
+board 인자로 Uno / Nano / ESP32 프로필 선택 가능 (board_profiles.py)
 """
 
-import random
+import math
 import time
-from dataclasses import dataclass
-from enum import Enum
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from enum import Enum, Flag
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
+
+import numpy as np
+from adc_sim import AdcNoiseModel, AdcSimulator
+from board_profiles import DEFAULT_BOARD, HardwareSpecs, get_board_profile
+from cost_model import CycleCostTable, get_cost_table
+from eeprom_sim import DEFAULT_FILL_VALUE, EEPROMBackend, RamEEPROM, create_eeprom
+from rng_backends import RandomBackend, create_rng_backend
+from scheduler import EventScheduler, LatencyStats, ScheduledEvent
+from serial_sim import SerialPort, SerialSink, create_serial_sink
+from stack_sim import CallStack
 
 
 class PinMode(Enum):
@@ -26,98 +40,293 @@ class PinMode(Enum):
     INPUT_PULLUP = 2
 
 
-@dataclass
-class HardwareSpecs:
-    """Arduino Uno R4 WiFi 하드웨어 사양"""
+class InterruptMode(Enum):
+    """attachInterrupt() 트리거 조건 (AVR 코어 값)"""
+
+    LOW = 0  # LOW 상태에서 핀이 갱신될 때마다 (레벨 트리거 근사)
+    CHANGE = 1
+    FALLING = 2
+    RISING = 3
+
+
+class ClockMode(Enum):
+    """시간 함수의 기준 클럭"""
+
+    REALTIME = "realtime"  # 벽시계 기준 (delay()가 실제로 sleep)
+    VIRTUAL = "virtual"  # instruction_count 기반 사이클 클럭
+
+
+class ResetScope(Flag):
+    """reset()으로 초기화할 상태 범위"""
+
+    COUNTERS = 1  # 성능 카운터, 가상 클럭, Serial 통계
+    RNG = 2  # random() 및 ADC 노이즈 스트림 (시드부터 다시 시작)
+    PINS = 4  # 디지털/아날로그/PWM 핀 상태
+    MEMORY = 8  # SRAM/Flash 사용량, 콜 스택, RAM EEPROM 내용
+    INTERRUPTS = 16  # 인터럽트 핸들러, 타이머, 대기 이벤트
+    ALL = COUNTERS | RNG | PINS | MEMORY | INTERRUPTS
+
 
-    # MCU 사양
-    mcu_name: str = "Renesas RA4M1"
-    architecture: str = "ARM Cortex-M4"
-    clock_speed_hz: int = 48_000_000  # 48MHz
+class InstrumentationLevel(Enum):
+    """핫 패스 함수의 성능 계측 수준"""
 
-    # 메모리 사양
-    flash_memory_bytes: int = 256 * 1024  # 256KB
-    sram_bytes: int = 32 * 1024  # 32KB
-    eeprom_bytes: int = 8 * 1024  # 8KB (emulated)
+    OFF = "off"  # 계측 없는 빠른 버전으로 교체
+    AGGREGATE = "aggregate"  # 사이클은 바로, 호출 수는 통계 조회 시 일괄 반영
+    FULL = "full"  # 호출마다 함수별 카운트 (기존 동작)
 
-    # I/O 사양
-    digital_pins: int = 14
-    analog_pins: int = 6
-    pwm_pins: List[int] = None
 
-    # ADC 사양
-    adc_resolution: int = 12  # 12-bit ADC
-    adc_max_value: int = 4095  # 2^12 - 1
+# 계측 수준에 따라 교체되는 핫 패스 함수
+# (메서드 이름, function_calls/비용 모델 키, 계측 없는 구현의 속성 경로)
+_HOT_PATH_FUNCTIONS = (
+    ("random_range", "random", "rng.random_range"),
+    ("millis", "millis", "_millis_impl"),
+    ("micros", "micros", "_micros_impl"),
+    ("digitalWrite", "digitalWrite", "_digital_write_impl"),
+    ("digitalRead", "digitalRead", "_digital_read_impl"),
+)
 
-    # 전압 사양
-    operating_voltage: float = 5.0  # 5V
-    analog_reference: float = 5.0  # 5V
 
-    def __post_init__(self):
-        if self.pwm_pins is None:
-            self.pwm_pins = [3, 5, 6, 9, 10, 11]  # PWM 지원 핀
+@dataclass(frozen=True)
+class MockSnapshot:
+    """
+    ArduinoUnoR4WiFiMock 전체 상태 스냅샷 (restore()/fork()로 복원)
+    eeprom은 EEPROM 백엔드와 공유할 수 있는 (데이터, 쓰기 횟수) 버퍼이므로
+    직접 수정하지 않는다.
+    """
+
+    random_seed: int
+    rng_state: Any
+    adc_state: Any
+    digital_pins_mode: tuple
+    digital_pins_value: tuple
+    analog_pins_value: tuple
+    pwm_values: tuple
+    eeprom: Tuple[np.ndarray, np.ndarray]
+    sram_usage: int
+    flash_usage: int
+    instruction_count: int
+    cycle_base: int
+    function_calls: Dict[str, int]
+    serial_state: tuple
+    interrupts_enabled: bool
+    interrupt_handlers: Dict[int, tuple]
+    scheduler_state: tuple
+    isr_stats: Dict[str, LatencyStats]
+    stack: CallStack
 
 
 class ArduinoUnoR4WiFiMock:
     """Arduino Uno R4 WiFi 정확한 하드웨어 시뮬레이션"""
 
-    def __init__(self, seed: Optional[int] = None):
-        self.specs = HardwareSpecs()
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        clock_mode: ClockMode = ClockMode.REALTIME,
+        time_dilation: float = 0.0,
+        rng_backend: Union[str, RandomBackend] = "mt19937",
+        instrumentation: InstrumentationLevel = InstrumentationLevel.FULL,
+        serial_sink: Union[str, SerialSink, TextIO] = "console",
+        cost_table: Union[str, CycleCostTable, None] = None,
+        eeprom: Union[str, EEPROMBackend] = "ram",
+        eeprom_fill_value: int = DEFAULT_FILL_VALUE,
+        adc_noise: Optional[AdcNoiseModel] = None,
+        board: Union[str, HardwareSpecs] = DEFAULT_BOARD,
+        verbose: bool = True,
+    ):
+        self.verbose = verbose
+
+        # 보드 프로필 (클럭, 메모리, I/O, 비용 테이블, RNG 종류)
+        self.specs = (
+            board if isinstance(board, HardwareSpecs) else get_board_profile(board)
+        )
+
+        # 함수별 사이클 비용 (config/cycle_costs.yaml, 기본: 보드 프로필의 테이블)
+        self.costs = (
+            cost_table
+            if isinstance(cost_table, CycleCostTable)
+            else get_cost_table(cost_table or self.specs.cost_table)
+        )
+        self.function_costs = self.costs.functions
 
         # 시간 관련
         self.start_time = time.time()
         self.micros_start = time.perf_counter()
 
-        # 랜덤 시드 설정
-        if seed is not None:
-            random.seed(seed)
-            self._random_seed = seed
-        else:
-            self._random_seed = int(time.time())
-            random.seed(self._random_seed)
+        # 가상 클럭: millis()/micros()는 누적 사이클에서 계산
+        # time_dilation은 시뮬레이션 1초당 실제로 sleep할 초 (0 = CPU 속도, 1 = 실시간)
+        self.clock_mode = ClockMode(clock_mode)
+        self.time_dilation = max(0.0, float(time_dilation))
+        self._cycle_base = 0  # reset_performance_counters() 이전까지 누적된 사이클
+
+        # 랜덤 시드 설정 (인스턴스 전용 생성기 - 전역 random 모듈과 분리)
+        # rng: Arduino random() 백엔드 ("board"면 보드 코어의 random() 구현)
+        # adc: ADC 노이즈 전용 블록 생성기 (random() 스트림을 소비하지 않음)
+        self._random_seed = seed if seed is not None else int(time.time())
+        self._initial_seed = self._random_seed  # reset() 기준 시드
+        if rng_backend == "board":
+            rng_backend = self.specs.rng_flavour
+        self.rng = create_rng_backend(rng_backend, self._random_seed)
+        self.adc = AdcSimulator(
+            self.specs.analog_pins,
+            self.specs.adc_max_value,
+            model=adc_noise,
+            seed=self._random_seed,
+        )
 
         # 메모리 시뮬레이션
-        self.sram_usage = 0
+        self.sram_usage = 0  # 전역/static 변수 (allocate_sram)
         self.flash_usage = 0
-        self.eeprom_data = bytearray(self.specs.eeprom_bytes)
-
-        # 핀 상태 관리
-        self.digital_pins_mode = [PinMode.INPUT] * self.specs.digital_pins
-        self.digital_pins_value = [0] * self.specs.digital_pins
-        self.analog_pins_value = [0] * self.specs.analog_pins
+        self.stack = CallStack()  # 함수 호출 프레임 (push_stack_frame)
+        # EEPROM 백엔드 ("ram": 스냅샷과 copy-on-write 공유, "mmap:<경로>": 파일 유지)
+        # 새 셀 값은 0x00 (실제 칩처럼 지워진 0xFF는 eeprom_fill_value=ERASED_VALUE)
+        self.eeprom = create_eeprom(
+            eeprom, self.specs.eeprom_bytes, fill_value=eeprom_fill_value
+        )
 
-        # PWM 상태
-        self.pwm_values = dict.fromkeys(self.specs.pwm_pins, 0)
+        # 핀 상태 관리 (디지털/아날로그/PWM)
+        self._reset_pins()
 
-        # Serial 출력 버퍼
-        self.serial_output = []
-        self.serial_baud_rate = 9600
+        # Serial (64바이트 TX 링 버퍼 + 교체 가능한 출력 싱크)
+        self.serial = SerialPort(
+            self.specs.clock_speed_hz,
+            sink=create_serial_sink(serial_sink),
+            copy_cycles_per_byte=self.function_costs["serial_copy_per_byte"],
+        )
 
         # 성능 카운터
         self.instruction_count = 0
         self.function_calls = {}
 
-        # 인터럽트 시뮬레이션
-        self.interrupts_enabled = True
-        self.interrupt_handlers = {}
+        # 인터럽트 시뮬레이션 (가상 클럭 기준 이벤트 스케줄러)
+        self.isr_stats: Dict[str, LatencyStats] = {}
+        self._reset_interrupts()
+
+        # 계측 수준 (AGGREGATE: _lazy_calls에 호출 수만 누적)
+        self.instrumentation = InstrumentationLevel.FULL
+        self._lazy_calls = [0] * len(_HOT_PATH_FUNCTIONS)
+        self.set_instrumentation(instrumentation)
 
-        print("Arduino Uno R4 WiFi Mock initialized")
+        if not verbose:
+            return
+        print(f"{self.specs.board_name} Mock initialized")
         print(
             f"MCU: {self.specs.mcu_name} @ {self.specs.clock_speed_hz/1_000_000:.0f}MHz"
         )
         print(
             f"SRAM: {self.specs.sram_bytes//1024}KB, Flash: {self.specs.flash_memory_bytes//1024}KB"
         )
-        print(f"Random seed: {self._random_seed}")
+        print(f"Random seed: {self._random_seed} ({self.rng.name} backend)")
+        print(f"Cycle costs: {self.costs.board}")
+        if self.clock_mode is ClockMode.VIRTUAL:
+            print(f"Clock: virtual (time dilation {self.time_dilation:g}x)")
+
+    def _reset_pins(self):
+        self.digital_pins_mode = [PinMode.INPUT] * self.specs.digital_pins
+        self.digital_pins_value = [0] * self.specs.digital_pins
+        self.analog_pins_value = [0] * self.specs.analog_pins
+        self.pwm_values = dict.fromkeys(self.specs.pwm_pins, 0)
+
+    def _reset_interrupts(self):
+        # _event_threshold: 다음 이벤트 시점을 instruction_count 기준으로 환산한 값
+        self.interrupts_enabled = True
+        self.interrupt_handlers = {}  # 인터럽트 번호 -> (ISR, InterruptMode)
+        self.scheduler = EventScheduler()
+        self._timers: Dict[int, ScheduledEvent] = {}
+        self._next_timer_id = 0
+        self._pending_pin_isrs = set()
+        self._in_isr = False
+        self._event_threshold = math.inf
 
     def _count_instruction(self, cycles: int = 1):
-        """명령어 사이클 카운트 (성능 측정용)"""
+        """명령어 사이클 카운트 (성능 측정용), 시간이 된 인터럽트는 여기서 선점"""
         self.instruction_count += cycles
+        if self.instruction_count >= self._event_threshold:
+            self._dispatch_events()
+
+    def charge_cycles(self, cycles: int):
+        """
+        Mock 함수 밖에서 실행된 코드의 사이클 청구
+        (구현 코드의 연산 비용 등, 계측 OFF에서는 무시)
+        """
+        if self.instrumentation is not InstrumentationLevel.OFF:
+            self._count_instruction(cycles)
 
     def _count_function_call(self, func_name: str):
         """함수 호출 횟수 카운트"""
         self.function_calls[func_name] = self.function_calls.get(func_name, 0) + 1
 
+    def _elapsed_cycles(self) -> int:
+        """부팅 이후 누적된 가상 클럭 사이클"""
+        return self._cycle_base + self.instruction_count
+
+    # ==================== 계측 수준 ====================
+
+    def set_instrumentation(self, level: InstrumentationLevel):
+        """
+        핫 패스 함수(random, millis, micros, digitalWrite, digitalRead) 계측 수준 변경
+        OFF/AGGREGATE에서는 인스턴스 속성으로 메서드를 교체해 호출 오버헤드 제거
+        (OFF의 random_range는 self.rng에 직접 바인딩 - rng 교체 시 다시 호출)
+        AGGREGATE는 사이클을 바로 더해 인터럽트가 FULL과 같은 시점에 실행되고,
+        OFF는 핫 패스에서 가상 시간이 흐르지 않으므로 예약된 이벤트와 함께 쓸 수 없다.
+        """
+        level = InstrumentationLevel(level)
+        if level is InstrumentationLevel.OFF and len(self.scheduler):
+            raise ValueError(
+                "Instrumentation OFF does not advance virtual time; "
+                "detach timers and pending pin inputs first"
+            )
+        self._flush_lazy_counts()
+
+        for slot, (method_name, counter_name, impl_name) in enumerate(
+            _HOT_PATH_FUNCTIONS
+        ):
+            self.__dict__.pop(method_name, None)  # FULL: 클래스 메서드 사용
+            impl = attrgetter(impl_name)(self)
+            if level is InstrumentationLevel.OFF:
+                setattr(self, method_name, impl)
+            elif level is InstrumentationLevel.AGGREGATE:
+                cost = self.function_costs[counter_name]
+                setattr(self, method_name, self._make_lazy_counted(impl, slot, cost))
+
+        self.instrumentation = level
+
+    def _make_lazy_counted(self, impl, slot: int, cost: int):
+        """
+        호출 수는 지연 누적하는 AGGREGATE 버전 생성
+        사이클은 바로 더하고 다음 이벤트 시점과 비교 (도래한 인터럽트는 호출 전에 실행)
+        """
+        lazy_calls = self._lazy_calls
+        mock = self
+
+        def counted(*args):
+            lazy_calls[slot] += 1
+            mock.instruction_count += cost
+            if mock.instruction_count >= mock._event_threshold:
+                mock._dispatch_events()
+            return impl(*args)
+
+        return counted
+
+    def _flush_lazy_counts(self):
+        """AGGREGATE 모드에서 누적된 호출 수를 function_calls에 일괄 반영"""
+        lazy_calls = self._lazy_calls
+        for slot, (_, counter_name, _) in enumerate(_HOT_PATH_FUNCTIONS):
+            count = lazy_calls[slot]
+            if count:
+                self.function_calls[counter_name] = (
+                    self.function_calls.get(counter_name, 0) + count
+                )
+                lazy_calls[slot] = 0
+
+    def _cycles_to_units(self, units_per_second: int) -> int:
+        """누적 사이클을 ms/us 단위로 변환 (32비트 오버플로 반영)"""
+        ticks = self._elapsed_cycles() * units_per_second // self.specs.clock_speed_hz
+        return ticks % (2**32)
+
+    def get_simulated_time_seconds(self) -> float:
+        """가상 클럭 기준 경과 시간 (초)"""
+        return self._elapsed_cycles() / self.specs.clock_speed_hz
+
     # ==================== 시간 관련 함수 ====================
 
     def millis(self) -> int:
@@ -126,7 +335,14 @@ class ArduinoUnoR4WiFiMock:
         48MHz 클럭 기준으로 정확한 타이밍 계산
         """
         self._count_function_call("millis")
-        self._count_instruction(4)  # millis() 함수 호출 오버헤드
+        self._count_instruction(self.function_costs["millis"])
+
+        return self._millis_impl()
+
+    def _millis_impl(self) -> int:
+        """millis() 값 계산 (계측 없음)"""
+        if self.clock_mode is ClockMode.VIRTUAL:
+            return self._cycles_to_units(1000)
 
         elapsed_seconds = time.time() - self.start_time
         # 48MHz 클럭 기준으로 밀리초 계산
@@ -139,7 +355,14 @@ class ArduinoUnoR4WiFiMock:
         48MHz 클럭 기준 마이크로초 정밀도
         """
         self._count_function_call("micros")
-        self._count_instruction(6)  # micros() 함수 호출 오버헤드
+        self._count_instruction(self.function_costs["micros"])
+
+        return self._micros_impl()
+
+    def _micros_impl(self) -> int:
+        """micros() 값 계산 (계측 없음)"""
+        if self.clock_mode is ClockMode.VIRTUAL:
+            return self._cycles_to_units(1_000_000)
 
         elapsed_seconds = time.perf_counter() - self.micros_start
         # 48MHz 클럭 기준으로 마이크로초 계산
@@ -149,31 +372,38 @@ class ArduinoUnoR4WiFiMock:
     def delay(self, ms: int):
         """
         Arduino delay() 함수 시뮬레이션
-        실제 시간 지연 + 클럭 사이클 계산
+        클럭 사이클 계산 + 실제 시간 지연 (가상 클럭에서는 time_dilation 배율)
         """
         self._count_function_call("delay")
-        # delay() 함수는 많은 클럭 사이클 소모
+        # delay() 함수는 많은 클럭 사이클 소모 (대기 중 인터럽트는 제시간에 실행)
         cycles = ms * (self.specs.clock_speed_hz // 1000)
-        self._count_instruction(cycles)
+        self._advance_cycles(cycles)
 
-        time.sleep(ms / 1000.0)
+        self._sleep(ms / 1000.0)
 
     def delayMicroseconds(self, us: int):
         """Arduino delayMicroseconds() 함수 시뮬레이션"""
         self._count_function_call("delayMicroseconds")
         cycles = us * (self.specs.clock_speed_hz // 1_000_000)
-        self._count_instruction(cycles)
+        self._advance_cycles(cycles)
 
-        time.sleep(us / 1_000_000.0)
+        self._sleep(us / 1_000_000.0)
+
+    def _sleep(self, seconds: float):
+        """클럭 모드에 맞춰 실제 시간 지연"""
+        if self.clock_mode is ClockMode.VIRTUAL:
+            seconds *= self.time_dilation
+        if seconds > 0:
+            time.sleep(seconds)
 
     # ==================== 랜덤 함수 ====================
 
     def randomSeed(self, seed: int):
         """Arduino randomSeed() 함수 시뮬레이션"""
         self._count_function_call("randomSeed")
-        self._count_instruction(10)
+        self._count_instruction(self.function_costs["randomSeed"])
 
-        random.seed(seed)
+        self.rng.seed(seed)
         self._random_seed = seed
 
     def random_range(self, min_val: int, max_val: int) -> int:
@@ -182,23 +412,40 @@ class ArduinoUnoR4WiFiMock:
         Arduino는 max 값을 포함하지 않음 (exclusive)
         """
         self._count_function_call("random")
-        self._count_instruction(20)  # 랜덤 생성은 상대적으로 무거운 연산
-
-        if min_val >= max_val:
-            return min_val
+        self._count_instruction(self.function_costs["random"])
 
-        return random.randint(min_val, max_val - 1)
+        return self.rng.random_range(min_val, max_val)
 
     def random_max(self, max_val: int) -> int:
         """Arduino random(max) 함수 시뮬레이션"""
         return self.random_range(0, max_val)
 
+    def random_range_batch(self, min_val: int, max_val: int, n: int) -> np.ndarray:
+        """
+        random(min, max)를 n번 호출한 것과 동일한 결과를 NumPy 배열로 반환
+        카운터는 한 번에 갱신 (n번 단일 호출과 같은 합계)
+        """
+        n = max(0, int(n))
+        if self.instrumentation is not InstrumentationLevel.OFF:
+            self.function_calls["random"] = self.function_calls.get("random", 0) + n
+            self._count_instruction(self.function_costs["random"] * n)
+
+        return self.rng.random_range_batch(min_val, max_val, n)
+
+    def get_random_state(self) -> Any:
+        """랜덤 생성기 상태 캡처 (set_random_state()로 복원)"""
+        return self.rng.getstate()
+
+    def set_random_state(self, state: Any):
+        """캡처한 랜덤 생성기 상태 복원"""
+        self.rng.setstate(state)
+
     # ==================== 디지털 I/O ====================
 
     def pinMode(self, pin: int, mode: PinMode):
         """Arduino pinMode() 함수 시뮬레이션"""
         self._count_function_call("pinMode")
-        self._count_instruction(5)
+        self._count_instruction(self.function_costs["pinMode"])
 
         if 0 <= pin < self.specs.digital_pins:
             self.digital_pins_mode[pin] = mode
@@ -206,17 +453,28 @@ class ArduinoUnoR4WiFiMock:
     def digitalWrite(self, pin: int, value: int):
         """Arduino digitalWrite() 함수 시뮬레이션"""
         self._count_function_call("digitalWrite")
-        self._count_instruction(8)
+        self._count_instruction(self.function_costs["digitalWrite"])
+
+        self._digital_write_impl(pin, value)
 
+    def _digital_write_impl(self, pin: int, value: int):
+        """digitalWrite() 핀 상태 갱신 (계측 없음)"""
         if 0 <= pin < self.specs.digital_pins:
             if self.digital_pins_mode[pin] == PinMode.OUTPUT:
+                old_value = self.digital_pins_value[pin]
                 self.digital_pins_value[pin] = 1 if value else 0
+                if pin in self.interrupt_handlers:
+                    self._on_pin_edge(pin, old_value, self.digital_pins_value[pin])
 
     def digitalRead(self, pin: int) -> int:
         """Arduino digitalRead() 함수 시뮬레이션"""
         self._count_function_call("digitalRead")
-        self._count_instruction(6)
+        self._count_instruction(self.function_costs["digitalRead"])
 
+        return self._digital_read_impl(pin)
+
+    def _digital_read_impl(self, pin: int) -> int:
+        """digitalRead() 핀 값 조회 (계측 없음)"""
         if 0 <= pin < self.specs.digital_pins:
             if self.digital_pins_mode[pin] in [PinMode.INPUT, PinMode.INPUT_PULLUP]:
                 # 실제 하드웨어에서는 노이즈나 플로팅 상태 시뮬레이션
@@ -233,23 +491,32 @@ class ArduinoUnoR4WiFiMock:
         12-bit ADC (0-4095) 시뮬레이션
         """
         self._count_function_call("analogRead")
-        # ADC 변환은 상당한 시간 소요 (약 100 클럭 사이클)
-        self._count_instruction(100)
+        # ADC 변환은 상당한 시간 소요 (보드별 비용 모델 참조)
+        self._count_instruction(self.function_costs["analogRead"])
 
         if 0 <= pin < self.specs.analog_pins:
-            # 기본값에 ADC 노이즈 추가 (실제 하드웨어 특성 반영)
-            base_value = self.analog_pins_value[pin]
-            noise = random.gauss(0, 2)  # 평균 0, 표준편차 2의 가우시안 노이즈
-
-            result = int(base_value + noise)
-            return max(0, min(self.specs.adc_max_value, result))
+            # 기본값에 ADC 노이즈 추가 (미리 생성한 노이즈 블록에서 공급)
+            return self.adc.read(pin, self.analog_pins_value[pin])
 
         return 0
 
+    def analogReadBurst(self, pin: int, n: int) -> np.ndarray:
+        """
+        analogRead(pin)를 n번 호출한 것과 같은 결과를 NumPy 배열로 반환
+        카운터는 한 번에 갱신 (n번 단일 호출과 같은 합계)
+        """
+        n = max(0, int(n))
+        self.function_calls["analogRead"] = self.function_calls.get("analogRead", 0) + n
+        self._count_instruction(self.function_costs["analogRead"] * n)
+
+        if 0 <= pin < self.specs.analog_pins:
+            return self.adc.read_burst(pin, self.analog_pins_value[pin], n)
+        return np.zeros(n, dtype=np.int64)
+
     def analogWrite(self, pin: int, value: int):
         """Arduino analogWrite() (PWM) 함수 시뮬레이션"""
         self._count_function_call("analogWrite")
-        self._count_instruction(12)
+        self._count_instruction(self.function_costs["analogWrite"])
 
         if pin in self.specs.pwm_pins:
             # PWM 값은 0-255 범위
@@ -258,31 +525,439 @@ class ArduinoUnoR4WiFiMock:
 
     # ==================== Serial 통신 ====================
 
+    @property
+    def serial_baud_rate(self) -> int:
+        return self.serial.baud_rate
+
+    @property
+    def serial_output(self) -> List[str]:
+        """싱크가 보관 중인 최근 Serial 출력"""
+        return self.serial.sink.history()
+
     def Serial_begin(self, baud_rate: int = 9600):
         """Arduino Serial.begin() 함수 시뮬레이션"""
         self._count_function_call("Serial.begin")
-        self._count_instruction(50)  # Serial 초기화는 상당한 오버헤드
+        self._count_instruction(self.function_costs["Serial.begin"])
 
-        self.serial_baud_rate = baud_rate
-        self.serial_output.clear()
-        print(f"Serial initialized at {baud_rate} baud")
+        self.serial.begin(baud_rate)
+        if self.verbose:
+            print(f"Serial initialized at {baud_rate} baud")
 
     def Serial_print(self, value: Any):
-        """Arduino Serial.print() 함수 시뮬레이션"""
+        """
+        Arduino Serial.print() 함수 시뮬레이션
+        TX 버퍼 복사 비용 + 버퍼가 가득 찬 경우 전송 대기 시간 (baud rate 의존)
+        """
         self._count_function_call("Serial.print")
-        # Serial 출력은 상당한 시간 소요 (baud rate 의존)
-        char_count = len(str(value))
-        cycles = char_count * (self.specs.clock_speed_hz // self.serial_baud_rate) * 10
+        cycles = self.serial.write(str(value), self._elapsed_cycles())
         self._count_instruction(cycles)
 
-        output = str(value)
-        self.serial_output.append(output)
-        print(output, end="")
-
     def Serial_println(self, value: Any = ""):
         """Arduino Serial.println() 함수 시뮬레이션"""
         self.Serial_print(str(value) + "\n")
 
+    def Serial_flush(self):
+        """Arduino Serial.flush() - TX 버퍼가 모두 전송될 때까지 대기"""
+        self._count_function_call("Serial.flush")
+        self._count_instruction(self.serial.flush(self._elapsed_cycles()))
+
+    def Serial_availableForWrite(self) -> int:
+        """Arduino Serial.availableForWrite() 함수 시뮬레이션"""
+        self._count_function_call("Serial.availableForWrite")
+        self._count_instruction(self.function_costs["Serial.availableForWrite"])
+        return self.serial.available_for_write(self._elapsed_cycles())
+
+    # ==================== EEPROM ====================
+
+    @property
+    def eeprom_data(self) -> Union[bytearray, memoryview]:
+        """
+        EEPROM 내용 (수정 가능, 쓰기 횟수에는 반영되지 않음)
+        ram 백엔드는 기존과 같은 bytearray, mmap 백엔드는 파일을 보는 memoryview
+        """
+        return self.eeprom.buffer
+
+    def _count_eeprom_writes(self, programmed: int):
+        """프로그래밍한 셀 수만큼 쓰기 비용 + 쓰기 완료 대기 시간 청구"""
+        self._count_instruction(
+            programmed
+            * (
+                self.function_costs["EEPROM.write"]
+                + self.function_costs["EEPROM.write_latency"]
+            )
+        )
+
+    def EEPROM_read(self, address: int) -> int:
+        """Arduino EEPROM.read() 함수 시뮬레이션"""
+        self._count_function_call("EEPROM.read")
+        self._count_instruction(self.function_costs["EEPROM.read"])
+
+        if 0 <= address < self.eeprom.size:
+            return self.eeprom.read(address)
+        return 0
+
+    def EEPROM_write(self, address: int, value: int):
+        """Arduino EEPROM.write() 함수 시뮬레이션 (셀 쓰기 시간 포함)"""
+        self._count_function_call("EEPROM.write")
+
+        if 0 <= address < self.eeprom.size:
+            self.eeprom.write(address, value)
+            self._count_eeprom_writes(1)
+
+    def EEPROM_update(self, address: int, value: int):
+        """Arduino EEPROM.update() - 값이 다를 때만 쓰기"""
+        if self.EEPROM_read(address) != value & 0xFF:
+            self.EEPROM_write(address, value)
+
+    def EEPROM_get(self, address: int, length: int) -> np.ndarray:
+        """EEPROM.get() 대량 읽기 - length 바이트를 uint8 배열로 반환"""
+        self._count_function_call("EEPROM.get")
+        self._count_instruction(self.function_costs["EEPROM.read"] * length)
+
+        return self.eeprom.read_block(address, length)
+
+    def EEPROM_put(self, address: int, data: Any) -> int:
+        """
+        EEPROM.put() 대량 쓰기 - 값이 바뀐 셀만 프로그래밍 (update 방식)
+        프로그래밍한 셀 수 반환
+        """
+        data = np.asarray(data, dtype=np.uint8).ravel()
+        self._count_function_call("EEPROM.put")
+        self._count_instruction(self.function_costs["EEPROM.read"] * data.size)
+
+        programmed = self.eeprom.write_block(address, data, update=True)
+        self._count_eeprom_writes(programmed)
+        return programmed
+
+    def EEPROM_put_sequence(self, addresses: Any, values: Any, update: bool = True):
+        """
+        (주소, 값) 쓰기 n회를 순서대로 실행한 결과를 한 번에 계산
+        예: 부팅마다 previous_number를 같은 셀에 저장하는 패턴 n회
+        update=False면 EEPROM.write(), True면 EEPROM.update() 호출과 같은 비용
+        프로그래밍한 셀 수 반환
+        """
+        values = np.asarray(values).ravel()
+        calls = values.size
+        self.function_calls["EEPROM.write"] = (
+            self.function_calls.get("EEPROM.write", 0) + calls
+        )
+        if update:
+            self.function_calls["EEPROM.read"] = (
+                self.function_calls.get("EEPROM.read", 0) + calls
+            )
+            self._count_instruction(self.function_costs["EEPROM.read"] * calls)
+
+        programmed = self.eeprom.write_sequence(addresses, values, update=update)
+        self._count_eeprom_writes(programmed)
+        return programmed
+
+    # ==================== 인터럽트 / 타이머 ====================
+
+    def digitalPinToInterrupt(self, pin: int) -> int:
+        """Arduino digitalPinToInterrupt() - 모든 디지털 핀이 외부 인터럽트 지원"""
+        return pin
+
+    def attachInterrupt(self, interrupt: int, isr, mode: InterruptMode):
+        """Arduino attachInterrupt() - 핀 변화 시 ISR 실행"""
+        self._count_function_call("attachInterrupt")
+        self.interrupt_handlers[interrupt] = (isr, InterruptMode(mode))
+
+    def detachInterrupt(self, interrupt: int):
+        """Arduino detachInterrupt() 함수 시뮬레이션"""
+        self._count_function_call("detachInterrupt")
+        self.interrupt_handlers.pop(interrupt, None)
+
+    def noInterrupts(self):
+        """Arduino noInterrupts() - 인터럽트는 대기 상태로 남음"""
+        self.interrupts_enabled = False
+        self._update_event_threshold()
+
+    def interrupts(self):
+        """Arduino interrupts() - 대기 중이던 인터럽트 즉시 실행"""
+        self.interrupts_enabled = True
+        self._update_event_threshold()
+        if self.instruction_count >= self._event_threshold:
+            self._dispatch_events()
+
+    def attachTimerInterrupt(self, period_us: float, isr) -> int:
+        """
+        주기 타이머 인터럽트 등록 (TimerOne 등 타이머 라이브러리에 해당)
+        해제용 타이머 ID 반환
+        """
+        self._require_virtual_time("attachTimerInterrupt()")
+        self._count_function_call("attachTimerInterrupt")
+        period = max(1, round(period_us * self.specs.clock_speed_hz / 1_000_000))
+        timer_id = self._next_timer_id
+        self._next_timer_id += 1
+
+        self._timers[timer_id] = self.scheduler.schedule(
+            self._cycle_base + self.instruction_count + period,
+            "timer",
+            f"timer{timer_id}",
+            isr,
+            period=period,
+            args=(timer_id,),
+        )
+        self._update_event_threshold()
+        return timer_id
+
+    def _require_virtual_time(self, what: str):
+        """OFF는 핫 패스가 사이클을 세지 않아 예약 이벤트가 제시간에 실행될 수 없음"""
+        if self.instrumentation is InstrumentationLevel.OFF:
+            raise ValueError(
+                f"{what} needs cycle accounting; use instrumentation "
+                "'aggregate' or 'full'"
+            )
+
+    def detachTimerInterrupt(self, timer_id: int):
+        """타이머 인터럽트 해제"""
+        self._count_function_call("detachTimerInterrupt")
+        event = self._timers.pop(timer_id, None)
+        if event is not None:
+            self.scheduler.cancel(event)
+            self._update_event_threshold()
+
+    def set_pin_input(self, pin: int, value: int, delay_us: float = 0):
+        """
+        외부 신호로 입력 핀 값 변경 (delay_us 후, 가상 클럭 기준)
+        attachInterrupt()로 등록된 핀이면 변화 시점 기준으로 ISR 대기
+        """
+        cycle = self._cycle_base + self.instruction_count
+        if delay_us <= 0:
+            self._apply_pin_input(pin, 1 if value else 0, cycle)
+            return
+
+        self._require_virtual_time("set_pin_input(delay_us > 0)")
+        cycle += round(delay_us * self.specs.clock_speed_hz / 1_000_000)
+        self.scheduler.schedule(
+            cycle, "pin_change", f"pin{pin}", args=(pin, 1 if value else 0)
+        )
+        self._update_event_threshold()
+
+    def _apply_pin_input(self, pin: int, value: int, cycle: int):
+        """입력 핀 값 변경 및 핀 인터럽트 트리거"""
+        if not 0 <= pin < self.specs.digital_pins:
+            return
+        old_value = self.digital_pins_value[pin]
+        self.digital_pins_value[pin] = value
+        if pin in self.interrupt_handlers:
+            self._on_pin_edge(pin, old_value, value, cycle)
+
+    def _on_pin_edge(self, pin: int, old: int, new: int, cycle: Optional[int] = None):
+        """핀 변화가 트리거 조건에 맞으면 ISR 대기 (같은 핀의 대기 ISR은 하나로 합침)"""
+        isr, mode = self.interrupt_handlers[pin]
+        if old == new and mode is not InterruptMode.LOW:
+            return
+        triggered = (
+            mode is InterruptMode.CHANGE
+            or (mode is InterruptMode.RISING and new)
+            or (mode in (InterruptMode.FALLING, InterruptMode.LOW) and not new)
+        )
+        if not triggered or pin in self._pending_pin_isrs:
+            return
+
+        if cycle is None:
+            cycle = self._cycle_base + self.instruction_count
+        self._pending_pin_isrs.add(pin)
+        self.scheduler.schedule(cycle, "pin_isr", f"pin{pin}", isr, args=(pin,))
+        self._update_event_threshold()
+        if self.instruction_count >= self._event_threshold:
+            self._dispatch_events()
+
+    def _update_event_threshold(self):
+        """다음 이벤트 시점을 instruction_count 기준으로 다시 계산"""
+        if self.interrupts_enabled and not self._in_isr:
+            self._event_threshold = self.scheduler.next_cycle - self._cycle_base
+        else:
+            self._event_threshold = math.inf
+
+    def _dispatch_events(self):
+        """
+        현재 시점까지 도래한 이벤트 실행 (loop() 선점)
+        ISR 중첩은 허용하지 않으며, ISR 실행 중 새로 도래한 이벤트는
+        다음 Mock 호출 시점에 실행된다 (AVR: RETI 후 명령 1개 실행 보장).
+        """
+        scheduler = self.scheduler
+        deadline = self._cycle_base + self.instruction_count
+        self._in_isr = True
+        self._event_threshold = math.inf
+        try:
+            while self.interrupts_enabled and scheduler.next_cycle <= deadline:
+                event = scheduler.pop()
+                now = self._cycle_base + self.instruction_count
+                due = event.cycle
+
+                if event.kind == "pin_change":
+                    self._apply_pin_input(*event.args, due)
+                    continue
+
+                stats = self.isr_stats.get(event.name)
+                if stats is None:
+                    stats = self.isr_stats[event.name] = LatencyStats()
+
+                if event.period:
+                    # 밀린 주기는 대기 인터럽트 하나로 합쳐짐 (타이머 플래그 1개)
+                    next_cycle = due + event.period
+                    if next_cycle <= now:
+                        missed = (now - next_cycle) // event.period
+                        stats.overruns += missed
+                        next_cycle += missed * event.period
+                    scheduler.reschedule(event, next_cycle)
+                elif event.kind == "pin_isr":
+                    self._pending_pin_isrs.discard(event.args[0])
+
+                # 지연 시간: 이벤트 시점부터 디스패치까지 (고정 진입 비용 제외)
+                self.instruction_count += self.function_costs["ISR.overhead"]
+                stats.add(now - due)
+                event.callback()
+        finally:
+            self._in_isr = False
+            self._update_event_threshold()
+
+    def _advance_cycles(self, cycles: int):
+        """
+        cycles만큼 대기 (delay 계열)
+        대기 중 도래하는 인터럽트는 해당 시점에 실행하고,
+        ISR 실행 시간은 대기 시간에 포함된다.
+        """
+        end = self.instruction_count + cycles
+        while self._event_threshold <= end:
+            if self._event_threshold > self.instruction_count:
+                self.instruction_count = self._event_threshold
+            self._dispatch_events()
+        if self.instruction_count < end:
+            self.instruction_count = end
+
+    def get_interrupt_stats(self) -> Dict[str, Any]:
+        """ISR별 실행 횟수, 지연 시간, 지터 통계"""
+        return {
+            name: stats.to_dict(self.specs.clock_speed_hz)
+            for name, stats in self.isr_stats.items()
+        }
+
+    # ==================== 스냅샷 ====================
+
+    def snapshot(self) -> MockSnapshot:
+        """
+        현재 상태 스냅샷 (RNG, 핀, EEPROM, 카운터, SRAM 사용량, Serial)
+        EEPROM은 복사하지 않고 공유하며, 이후 첫 쓰기 때만 복사된다.
+        """
+        self._flush_lazy_counts()
+
+        return MockSnapshot(
+            random_seed=self._random_seed,
+            rng_state=self.rng.getstate(),
+            adc_state=self.adc.getstate(),
+            digital_pins_mode=tuple(self.digital_pins_mode),
+            digital_pins_value=tuple(self.digital_pins_value),
+            analog_pins_value=tuple(self.analog_pins_value),
+            pwm_values=tuple(self.pwm_values.items()),
+            eeprom=self.eeprom.snapshot(),
+            sram_usage=self.sram_usage,
+            flash_usage=self.flash_usage,
+            instruction_count=self.instruction_count,
+            cycle_base=self._cycle_base,
+            function_calls=self.function_calls.copy(),
+            serial_state=self.serial.getstate(),
+            interrupts_enabled=self.interrupts_enabled,
+            interrupt_handlers=self.interrupt_handlers.copy(),
+            scheduler_state=self.scheduler.getstate(),
+            isr_stats={name: replace(s) for name, s in self.isr_stats.items()},
+            stack=self.stack.copy(),
+        )
+
+    def restore(self, snapshot: MockSnapshot):
+        """스냅샷 상태로 복원 (같은 스냅샷으로 여러 번 복원 가능)"""
+        self._lazy_calls[:] = [0] * len(self._lazy_calls)
+
+        self._random_seed = snapshot.random_seed
+        self.rng.setstate(snapshot.rng_state)
+        self.adc.setstate(snapshot.adc_state)
+
+        self.digital_pins_mode = list(snapshot.digital_pins_mode)
+        self.digital_pins_value = list(snapshot.digital_pins_value)
+        self.analog_pins_value = list(snapshot.analog_pins_value)
+        self.pwm_values = dict(snapshot.pwm_values)
+
+        self.eeprom.restore(snapshot.eeprom)
+
+        self.sram_usage = snapshot.sram_usage
+        self.flash_usage = snapshot.flash_usage
+        self.instruction_count = snapshot.instruction_count
+        self._cycle_base = snapshot.cycle_base
+        self.function_calls = snapshot.function_calls.copy()
+        self.serial.setstate(snapshot.serial_state)
+
+        self.interrupts_enabled = snapshot.interrupts_enabled
+        self.interrupt_handlers = snapshot.interrupt_handlers.copy()
+        self.scheduler.setstate(snapshot.scheduler_state)
+        self.isr_stats = {name: replace(s) for name, s in snapshot.isr_stats.items()}
+        self.stack = snapshot.stack.copy()
+        pending = self.scheduler.events()
+        self._timers = {e.args[0]: e for e in pending if e.kind == "timer"}
+        self._next_timer_id = max(self._timers, default=-1) + 1
+        self._pending_pin_isrs = {e.args[0] for e in pending if e.kind == "pin_isr"}
+        self._update_event_threshold()
+
+    def fork(
+        self,
+        snapshot: Optional[MockSnapshot] = None,
+        serial_sink: Union[str, SerialSink, TextIO] = "discard",
+    ) -> "ArduinoUnoR4WiFiMock":
+        """
+        같은 설정의 새 Mock을 만들어 스냅샷 상태로 복원 (기본: 현재 상태)
+        원본과 분기 Mock은 이후 서로 영향을 주지 않는다.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+
+        branch = ArduinoUnoR4WiFiMock(
+            seed=snapshot.random_seed,
+            clock_mode=self.clock_mode,
+            time_dilation=self.time_dilation,
+            rng_backend=type(self.rng)(),
+            instrumentation=self.instrumentation,
+            serial_sink=serial_sink,
+            cost_table=self.costs,
+            adc_noise=self.adc.model,
+            board=self.specs,
+            verbose=self.verbose,
+        )
+        branch.restore(snapshot)
+        return branch
+
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """
+        파일 체크포인트용 상태 (RNG, 카운터, SRAM 사용량 - JSON 저장 가능)
+        핀/EEPROM/인터럽트는 포함하지 않음 (대량 시뮬레이션 재개용)
+        """
+        self._flush_lazy_counts()
+        return {
+            "rng_backend": self.rng.name,
+            "random_seed": self._random_seed,
+            "rng_state": self.rng.getstate(),
+            "instruction_count": self.instruction_count,
+            "cycle_base": self._cycle_base,
+            "function_calls": self.function_calls.copy(),
+            "sram_usage": self.sram_usage,
+        }
+
+    def set_checkpoint_state(self, state: Dict[str, Any]):
+        """get_checkpoint_state() 상태 복원 (같은 RNG 백엔드여야 함)"""
+        if state["rng_backend"] != self.rng.name:
+            raise ValueError(
+                f"Checkpoint uses RNG backend '{state['rng_backend']}', "
+                f"mock uses '{self.rng.name}'"
+            )
+        self._lazy_calls[:] = [0] * len(self._lazy_calls)
+        self._random_seed = state["random_seed"]
+        self.rng.setstate(state["rng_state"])
+        self.instruction_count = state["instruction_count"]
+        self._cycle_base = state["cycle_base"]
+        self.function_calls = dict(state["function_calls"])
+        self.sram_usage = state["sram_usage"]
+        self._update_event_threshold()
+
     # ==================== 메모리 관리 ====================
 
     def allocate_sram(self, bytes_needed: int) -> bool:
@@ -300,10 +975,35 @@ class ArduinoUnoR4WiFiMock:
         """사용 가능한 SRAM 메모리 반환"""
         return self.specs.sram_bytes - self.sram_usage
 
+    def push_stack_frame(self, frame_bytes: int) -> bool:
+        """함수 호출 프레임 push (전역 변수 영역과 만나면 오버플로우로 집계, False)"""
+        return self.stack.push(frame_bytes, self.specs.sram_bytes - self.sram_usage)
+
+    def pop_stack_frame(self, frame_bytes: int):
+        """함수 반환 (프레임 pop)"""
+        self.stack.pop(frame_bytes)
+
+    def record_stack_samples(self, frames: np.ndarray, frame_bytes: int):
+        """
+        샘플마다 frame_bytes 프레임을 frames[i]개 쌓았다 모두 반환한 것을 일괄 기록
+        (push_stack_frame/pop_stack_frame/end_stack_sample 반복과 같은 결과)
+        """
+        free_bytes = self.specs.sram_bytes - self.sram_usage
+        self.stack.record_samples(frames, frame_bytes, self.sram_usage, free_bytes)
+
+    def end_stack_sample(self):
+        """샘플 1회(숫자 생성 1회 등)의 최대 스택 깊이/SRAM 사용량 기록"""
+        self.stack.end_sample(self.sram_usage)
+
+    def get_stack_stats(self) -> Dict[str, Any]:
+        """스택 깊이 및 SRAM 사용량 히스토그램"""
+        return self.stack.to_dict(self.sram_usage, self.specs.sram_bytes)
+
     # ==================== 성능 모니터링 ====================
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """성능 통계 반환"""
+        self._flush_lazy_counts()
         elapsed_time = time.time() - self.start_time
 
         return {
@@ -317,22 +1017,84 @@ class ArduinoUnoR4WiFiMock:
             "sram_usage_percent": (self.sram_usage / self.specs.sram_bytes) * 100,
             "free_memory_bytes": self.get_free_memory(),
             "clock_speed_hz": self.specs.clock_speed_hz,
+            "board": self.specs.board_name,
+            "clock_mode": self.clock_mode.value,
+            "simulated_time_seconds": self.get_simulated_time_seconds(),
             "random_seed": self._random_seed,
+            "rng_backend": self.rng.name,
+            "instrumentation": self.instrumentation.value,
+            "cost_model_board": self.costs.board,
+            "eeprom": self.eeprom.wear_report(),
+            "interrupts": self.get_interrupt_stats(),
+            "stack": self.get_stack_stats(),
+            "serial": self.serial.get_stats(),
         }
 
     def reset_performance_counters(self):
-        """성능 카운터 리셋"""
+        """성능 카운터 리셋 (가상 클럭은 계속 진행)"""
+        self._flush_lazy_counts()
+        self._cycle_base += self.instruction_count
         self.instruction_count = 0
         self.function_calls.clear()
+        self.isr_stats.clear()
+        self.stack.clear_stats()
+        self._update_event_threshold()
         self.start_time = time.time()
         self.micros_start = time.perf_counter()
 
+    def reset(self, scope: ResetScope = ResetScope.ALL, seed: Optional[int] = None):
+        """
+        새로 생성한 것과 같은 상태로 초기화 (출력 없음, Mock 재사용용)
+        seed를 지정하면 생성 시 시드 대신 사용 (이후 reset()에도 적용)
+        seed를 지정하면 scope에 RNG가 없어도 random()/ADC 스트림을 다시 시드
+        """
+        if seed is not None:
+            self._initial_seed = seed
+            scope |= ResetScope.RNG
+
+        if scope & ResetScope.COUNTERS:
+            self._lazy_calls[:] = [0] * len(self._lazy_calls)
+            self._cycle_base = 0
+            self.instruction_count = 0
+            self.function_calls.clear()
+            self.isr_stats.clear()
+            self.serial.begin(9600)
+            self.start_time = time.time()
+            self.micros_start = time.perf_counter()
+
+        if scope & ResetScope.RNG:
+            # 백엔드 객체는 유지 (계측 OFF는 rng 메서드에 직접 바인딩되어 있음)
+            self._random_seed = self._initial_seed
+            self.rng.seed(self._random_seed)
+            self.adc = AdcSimulator(
+                self.specs.analog_pins,
+                self.specs.adc_max_value,
+                model=self.adc.model,
+                seed=self._random_seed,
+            )
+
+        if scope & ResetScope.PINS:
+            self._reset_pins()
+
+        if scope & ResetScope.MEMORY:
+            self.sram_usage = 0
+            self.flash_usage = 0
+            self.stack = CallStack()
+            if isinstance(self.eeprom, RamEEPROM):
+                self.eeprom = RamEEPROM(
+                    self.eeprom.size, self.eeprom.endurance, self.eeprom.fill_value
+                )
+
+        if scope & ResetScope.INTERRUPTS:
+            self._reset_interrupts()
+        self._update_event_threshold()
+
     # ==================== 하드웨어 정보 ====================
 
     def get_hardware_info(self) -> Dict[str, Any]:
         """하드웨어 정보 반환"""
         return {
-            "board_name": "Arduino Uno R4 WiFi",
+            "board_name": self.specs.board_name,
             "mcu": self.specs.mcu_name,
             "architecture": self.specs.architecture,
             "clock_speed_mhz": self.specs.clock_speed_hz / 1_000_000,
@@ -350,9 +1112,100 @@ class ArduinoUnoR4WiFiMock:
 # ==================== 편의 함수들 ====================
 
 
-def create_arduino_mock(seed: Optional[int] = None) -> ArduinoUnoR4WiFiMock:
+def create_arduino_mock(
+    seed: Optional[int] = None,
+    clock_mode: ClockMode = ClockMode.REALTIME,
+    time_dilation: float = 0.0,
+    rng_backend: Union[str, RandomBackend] = "mt19937",
+    instrumentation: InstrumentationLevel = InstrumentationLevel.FULL,
+    serial_sink: Union[str, SerialSink, TextIO] = "console",
+    cost_table: Union[str, CycleCostTable, None] = None,
+    eeprom: Union[str, EEPROMBackend] = "ram",
+    eeprom_fill_value: int = DEFAULT_FILL_VALUE,
+    adc_noise: Optional[AdcNoiseModel] = None,
+    board: Union[str, HardwareSpecs] = DEFAULT_BOARD,
+    verbose: bool = True,
+) -> ArduinoUnoR4WiFiMock:
     """Arduino Mock 인스턴스 생성 편의 함수"""
-    return ArduinoUnoR4WiFiMock(seed=seed)
+    return ArduinoUnoR4WiFiMock(
+        seed=seed,
+        clock_mode=clock_mode,
+        time_dilation=time_dilation,
+        rng_backend=rng_backend,
+        instrumentation=instrumentation,
+        serial_sink=serial_sink,
+        cost_table=cost_table,
+        eeprom=eeprom,
+        eeprom_fill_value=eeprom_fill_value,
+        adc_noise=adc_noise,
+        board=board,
+        verbose=verbose,
+    )
+
+
+# ==================== Mock 풀 ====================
+
+
+class MockPool:
+    """
+    Mock 인스턴스 재사용 풀 (대규모 구현 x 시드 스윕용)
+    생성자 인자 조합별로 반납된 Mock을 보관하고, 꺼낼 때 scope 범위만 조용히 초기화
+    """
+
+    def __init__(self, scope: ResetScope = ResetScope.ALL, **defaults):
+        self.scope = scope
+        self.defaults = {"verbose": False, "serial_sink": "discard", **defaults}
+        self._free: Dict[tuple, List[ArduinoUnoR4WiFiMock]] = {}
+        self._keys: Dict[int, tuple] = {}
+        self.created = 0
+        self.reused = 0
+
+    @staticmethod
+    def _key_value(value: Any) -> Any:
+        """풀 키용 값 (HardwareSpecs처럼 해시 불가능한 인자는 repr로 비교)"""
+        try:
+            hash(value)
+        except TypeError:
+            return (type(value).__name__, repr(value))
+        return value
+
+    def acquire(self, seed: Optional[int] = None, **kwargs) -> ArduinoUnoR4WiFiMock:
+        """
+        seed로 초기화된 Mock 꺼내기 (kwargs: 생성자 인자)
+        seed가 None이면 생성자처럼 현재 시각으로 새로 시드 (이전 대여자 시드 미사용)
+        """
+        if seed is None:
+            seed = int(time.time())
+        options = {**self.defaults, **kwargs}
+        key = tuple(
+            sorted((name, self._key_value(value)) for name, value in options.items())
+        )
+        free = self._free.get(key)
+
+        if free:
+            arduino = free.pop()
+            arduino.reset(self.scope, seed)
+            self.reused += 1
+        else:
+            arduino = ArduinoUnoR4WiFiMock(seed=seed, **options)
+            self.created += 1
+        self._keys[id(arduino)] = key
+        return arduino
+
+    def release(self, arduino: ArduinoUnoR4WiFiMock):
+        """Mock 반납"""
+        key = self._keys.pop(id(arduino), None)
+        if key is not None:
+            self._free.setdefault(key, []).append(arduino)
+
+    @contextmanager
+    def mock(self, seed: Optional[int] = None, **kwargs):
+        """with 블록 동안 Mock 대여"""
+        arduino = self.acquire(seed, **kwargs)
+        try:
+            yield arduino
+        finally:
+            self.release(arduino)
 
 
 # ==================== 테스트 코드 ====================
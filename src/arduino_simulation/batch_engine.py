@@ -0,0 +1,119 @@
+"""
+Lookup Chain Batch Engine
+룩업 테이블 체인(result[i] = table[result[i-1]][candidate[i]])을 NumPy로 한 번에 계산
+
+후보값 8개 묶음(윈도우)은 "이전 숫자 -> 8개 결과" 표(3^8 x 3)로 미리 계산하고,
+윈도우 사이의 의존성은 "이전 숫자 -> 마지막 결과" 사상(27가지)의 누적 합성으로 푼다.
+사상 누적은 16개 블록 안에서 Hillis-Steele 방식, 블록 합계는 재귀적으로 계산한다.
+"""
+
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+STATES = 3
+MAP_COUNT = STATES**STATES  # 사상 코드: m[0] + 3*m[1] + 9*m[2]
+IDENTITY = 0 + 3 * 1 + 9 * 2
+WINDOW = 8
+SCAN_BLOCK = 16
+
+
+def _encode(mapping: Sequence[int]) -> int:
+    return sum(value * STATES**state for state, value in enumerate(mapping))
+
+
+def _decode(code: int) -> List[int]:
+    return [code // STATES**state % STATES for state in range(STATES)]
+
+
+def _build_map_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """합성 테이블 (a 다음 b) 및 적용 테이블 (사상, 상태) -> 결과"""
+    maps = [_decode(code) for code in range(MAP_COUNT)]
+    compose = np.array(
+        [[_encode([b[a[s]] for s in range(STATES)]) for b in maps] for a in maps],
+        dtype=np.uint8,
+    )
+    apply = np.array(maps, dtype=np.uint8)
+    return compose, apply
+
+
+_COMPOSE, _APPLY = _build_map_tables()
+
+
+def _prefix_compose(maps: np.ndarray) -> np.ndarray:
+    """누적 합성: out[i] = maps[0] 다음 ... 다음 maps[i]"""
+    n = maps.size
+    padded = -n % SCAN_BLOCK
+    blocks = np.concatenate([maps, np.full(padded, IDENTITY, np.uint8)])
+    blocks = blocks.reshape(-1, SCAN_BLOCK)
+
+    # 블록 내부 누적 (log2(16) = 4단계)
+    step = 1
+    while step < SCAN_BLOCK:
+        blocks[:, step:] = _COMPOSE[blocks[:, :-step], blocks[:, step:]]
+        step *= 2
+
+    if len(blocks) > 1:
+        # 블록 합계를 재귀적으로 누적한 뒤 각 블록 앞에 합성
+        totals = _prefix_compose(blocks[:, -1].copy())
+        blocks[1:] = _COMPOSE[totals[:-1, None], blocks[1:]]
+
+    return blocks.ravel()[:n]
+
+
+@lru_cache(maxsize=8)
+def _window_tables(lookup_table: Tuple[Tuple[int, ...], ...]):
+    """윈도우 코드별 (시작 상태 -> 8개 결과) 표와 윈도우 전체 사상"""
+    table = np.array(lookup_table, dtype=np.uint8)
+    codes = np.arange(STATES**WINDOW)
+    digits = codes[:, None] // STATES ** np.arange(WINDOW - 1, -1, -1) % STATES
+
+    outputs = np.empty((codes.size, STATES, WINDOW), dtype=np.uint8)
+    for start in range(STATES):
+        state = np.full(codes.size, start, dtype=np.uint8)
+        for k in range(WINDOW):
+            state = table[state, digits[:, k]]
+            outputs[:, start, k] = state
+
+    last = outputs[:, :, -1].astype(np.int64)
+    window_maps = (last[:, 0] + STATES * last[:, 1] + STATES**2 * last[:, 2]).astype(
+        np.uint8
+    )
+    return outputs, window_maps
+
+
+def resolve_lookup_chain(
+    candidates: np.ndarray, lookup_table: Sequence[Sequence[int]], previous: int
+) -> np.ndarray:
+    """
+    후보값 배열을 룩업 테이블 체인으로 변환 (uint8 결과)
+    previous == -1이면 첫 후보값을 그대로 사용 (Arduino 코드의 첫 생성)
+    """
+    candidates = np.asarray(candidates)
+    n = candidates.size
+    if n == 0:
+        return np.empty(0, dtype=np.uint8)
+    if previous == -1:
+        first = np.asarray(candidates[:1], dtype=np.uint8)
+        rest = resolve_lookup_chain(candidates[1:], lookup_table, int(first[0]))
+        return np.concatenate([first, rest])
+
+    outputs, window_maps = _window_tables(tuple(map(tuple, lookup_table)))
+
+    # 윈도우 코드 (패딩한 꼬리는 결과에서 잘라냄)
+    padded = np.zeros(n + (-n % WINDOW), dtype=np.uint16)
+    padded[:n] = candidates
+    windows = padded.reshape(-1, WINDOW)
+    codes = windows[:, 0].copy()
+    for k in range(1, WINDOW):
+        codes *= STATES
+        codes += windows[:, k]
+
+    # 각 윈도우의 시작 상태 = 이전 윈도우까지의 누적 사상을 previous에 적용
+    prefix = _prefix_compose(window_maps[codes])
+    starts = np.empty(codes.size, dtype=np.uint8)
+    starts[0] = previous
+    starts[1:] = _APPLY[prefix[:-1], previous]
+
+    return outputs[codes, starts].ravel()[:n]
@@ -0,0 +1,121 @@
+"""
+Arduino Board Profiles
+platformio.ini 환경(uno, nano, esp32)과 Uno R4 WiFi의 하드웨어 사양 모음
+
+각 프로필은 클럭, 메모리, I/O, ADC 사양과 함께
+사이클 비용 테이블 이름(config/cycle_costs.yaml)과 random() 구현(RNG 백엔드)을 지정한다.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict, List
+
+DEFAULT_BOARD = "uno_r4_wifi"
+
+
+@dataclass
+class HardwareSpecs:
+    """Arduino 보드 하드웨어 사양 (기본값: Uno R4 WiFi)"""
+
+    board_name: str = "Arduino Uno R4 WiFi"
+
+    # MCU 사양
+    mcu_name: str = "Renesas RA4M1"
+    architecture: str = "ARM Cortex-M4"
+    clock_speed_hz: int = 48_000_000  # 48MHz
+
+    # 메모리 사양
+    flash_memory_bytes: int = 256 * 1024  # 256KB
+    sram_bytes: int = 32 * 1024  # 32KB
+    eeprom_bytes: int = 8 * 1024  # 8KB (emulated)
+
+    # I/O 사양
+    digital_pins: int = 14
+    analog_pins: int = 6
+    pwm_pins: List[int] = None
+
+    # ADC 사양
+    adc_resolution: int = 12  # 12-bit ADC
+    adc_max_value: int = 4095  # 2^12 - 1
+
+    # 전압 사양
+    operating_voltage: float = 5.0  # 5V
+    analog_reference: float = 5.0  # 5V
+
+    # 시뮬레이션 설정
+    cost_table: str = "uno_r4_wifi"  # config/cycle_costs.yaml 보드 키
+    rng_flavour: str = "newlib"  # 코어의 random() 구현 (rng_backends)
+    int_size: int = 4  # sizeof(int)
+    pointer_size: int = 4
+    call_frame_bytes: int = 8  # 호출 1회 기본 스택 프레임 (복귀 주소 + 저장 레지스터)
+
+    def __post_init__(self):
+        if self.pwm_pins is None:
+            self.pwm_pins = [3, 5, 6, 9, 10, 11]  # PWM 지원 핀
+
+
+BOARD_PROFILES: Dict[str, HardwareSpecs] = {
+    "uno_r4_wifi": HardwareSpecs(),
+    "uno": HardwareSpecs(
+        board_name="Arduino Uno",
+        mcu_name="ATmega328P",
+        architecture="AVR",
+        clock_speed_hz=16_000_000,
+        flash_memory_bytes=32 * 1024,
+        sram_bytes=2 * 1024,
+        eeprom_bytes=1024,
+        adc_resolution=10,
+        adc_max_value=1023,
+        cost_table="uno",
+        rng_flavour="avr",
+        int_size=2,
+        pointer_size=2,
+        call_frame_bytes=4,  # 복귀 주소 2 + 프레임 포인터 r28:r29 2
+    ),
+    "nano": HardwareSpecs(
+        board_name="Arduino Nano",
+        mcu_name="ATmega328P",
+        architecture="AVR",
+        clock_speed_hz=16_000_000,
+        flash_memory_bytes=32 * 1024,
+        sram_bytes=2 * 1024,
+        eeprom_bytes=1024,
+        analog_pins=8,  # A0 ~ A7
+        adc_resolution=10,
+        adc_max_value=1023,
+        cost_table="nano",
+        rng_flavour="avr",
+        int_size=2,
+        pointer_size=2,
+        call_frame_bytes=4,
+    ),
+    "esp32": HardwareSpecs(
+        board_name="ESP32 DevKit",
+        mcu_name="ESP32-D0WD",
+        architecture="Xtensa LX6",
+        clock_speed_hz=240_000_000,
+        flash_memory_bytes=4 * 1024 * 1024,
+        sram_bytes=320 * 1024,  # 520KB 중 애플리케이션 데이터 영역
+        eeprom_bytes=4 * 1024,  # 플래시 에뮬레이션 (EEPROM.begin 최대 크기)
+        digital_pins=40,
+        analog_pins=18,
+        pwm_pins=[2, 4, 5, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 25, 26, 27],
+        operating_voltage=3.3,
+        analog_reference=3.3,
+        cost_table="esp32",
+        # arduino-esp32 random()은 newlib random() % n이 아니라 esp_random()/rand()의
+        # 곱셈-시프트 축소 (rng_backends.Esp32RandomBackend, 시드 0이면 재현 불가)
+        rng_flavour="esp32",
+        call_frame_bytes=32,  # windowed ABI (call8) 레지스터 저장 영역
+    ),
+}
+
+
+def get_board_profile(board: str = DEFAULT_BOARD) -> HardwareSpecs:
+    """보드 이름으로 사양 복사본 반환"""
+    try:
+        profile = BOARD_PROFILES[board]
+    except KeyError:
+        raise ValueError(
+            f"Unknown board '{board}' (available: {', '.join(BOARD_PROFILES)})"
+        ) from None
+    return replace(profile, pwm_pins=list(profile.pwm_pins))
@@ -0,0 +1,43 @@
+"""
+Batch Checkpoint
+장시간 대량 시뮬레이션의 중간 상태를 JSON 파일로 저장/복원
+
+체크포인트에는 RNG 상태, previous_number, 누적 통계, 시퀀스 집계(SequenceCounts)가
+들어 있어 재개하거나 반복 수를 늘려 이어 실행해도 한 번에 실행한 결과와 같다.
+생성된 시퀀스는 체크포인트마다 집계에 합쳐지므로 앞부분 샘플만 따로 저장한다.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Union
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(state: Dict[str, Any], path: Union[str, Path]) -> str:
+    """체크포인트 저장 (임시 파일에 쓴 뒤 교체 - 저장 중 중단되어도 이전 파일 유지)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": CHECKPOINT_VERSION, **state}, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    return str(path)
+
+
+def load_checkpoint(path: Union[str, Path]) -> Dict[str, Any]:
+    """체크포인트 읽기 (버전이 다르면 ValueError)"""
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+
+    version = state.get("version")
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Unsupported checkpoint version {version} "
+            f"(expected {CHECKPOINT_VERSION}): {path}"
+        )
+    return state
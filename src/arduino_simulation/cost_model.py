@@ -0,0 +1,126 @@
+"""
+Arduino Cycle Cost Model
+config/cycle_costs.yaml에 정의된 보드별 사이클 비용 로더
+
+주요 기능:
+- 파일은 한 번만 로드하여 캐시
+- 보드별 Arduino 함수 비용 (functions) 및 기본 연산 비용 (operations)
+- inherits로 다른 보드 값 상속
+"""
+
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+import yaml
+
+DEFAULT_COST_MODEL_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "config", "cycle_costs.yaml"
+)
+DEFAULT_BOARD = "uno_r4_wifi"
+
+# 설정 파일을 읽을 수 없을 때 사용하는 Uno R4 WiFi 기본값
+_FALLBACK_FUNCTION_COSTS = {
+    "random": 20,
+    "randomSeed": 10,
+    "millis": 4,
+    "micros": 6,
+    "pinMode": 5,
+    "digitalWrite": 8,
+    "digitalRead": 6,
+    "analogRead": 100,
+    "analogWrite": 12,
+    "Serial.begin": 50,
+    "Serial.availableForWrite": 4,
+    "serial_copy_per_byte": 12,
+    "EEPROM.read": 20,
+    "EEPROM.write": 40,
+    "EEPROM.write_latency": 20000,
+    "ISR.overhead": 40,
+}
+
+
+@dataclass(frozen=True)
+class CycleCostTable:
+    """보드 하나의 사이클 비용 테이블"""
+
+    board: str
+    functions: Dict[str, int] = field(default_factory=dict)
+    operations: Dict[str, int] = field(default_factory=dict)
+
+    def function(self, name: str) -> int:
+        """Arduino 함수 1회 호출 비용 (정의되지 않은 함수는 0)"""
+        return self.functions.get(name, 0)
+
+    def operation(self, name: str) -> int:
+        """기본 연산 1회 비용 (정의되지 않은 연산은 0)"""
+        return self.operations.get(name, 0)
+
+    def sum_operations(self, names: Iterable[str]) -> int:
+        """연산 목록의 총 비용"""
+        return sum(self.operation(name) for name in names)
+
+
+@lru_cache(maxsize=None)
+def load_cost_model(path: str = DEFAULT_COST_MODEL_PATH) -> Dict[str, CycleCostTable]:
+    """비용 모델 파일 로드 (경로별로 한 번만 읽음)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    except Exception as e:
+        print(f"Error loading cycle cost model: {e}")
+        return {
+            DEFAULT_BOARD: CycleCostTable(
+                DEFAULT_BOARD, dict(_FALLBACK_FUNCTION_COSTS), {}
+            )
+        }
+
+    raw_boards = config.get("boards", {})
+    tables: Dict[str, CycleCostTable] = {}
+
+    def resolve(board: str, chain: tuple = ()) -> CycleCostTable:
+        if board in tables:
+            return tables[board]
+        if board in chain:
+            raise ValueError(f"Circular 'inherits' in cycle cost model: {board}")
+
+        entry = raw_boards[board] or {}
+        functions: Dict[str, int] = {}
+        operations: Dict[str, int] = {}
+        parent = entry.get("inherits")
+        if parent:
+            base = resolve(parent, chain + (board,))
+            functions.update(base.functions)
+            operations.update(base.operations)
+        functions.update(entry.get("functions", {}))
+        operations.update(entry.get("operations", {}))
+
+        tables[board] = CycleCostTable(board, functions, operations)
+        return tables[board]
+
+    for board in raw_boards:
+        resolve(board)
+
+    # Mock이 청구하는 함수 비용이 빠진 보드는 0 사이클로 채우고 경고
+    for board, table in tables.items():
+        missing = [n for n in _FALLBACK_FUNCTION_COSTS if n not in table.functions]
+        if missing:
+            print(f"Warning: no cycle cost for {', '.join(missing)} on '{board}'")
+            table.functions.update(dict.fromkeys(missing, 0))
+
+    return tables
+
+
+def get_cost_table(
+    board: str = DEFAULT_BOARD, path: Optional[str] = None
+) -> CycleCostTable:
+    """보드 이름으로 비용 테이블 조회"""
+    tables = load_cost_model(path or DEFAULT_COST_MODEL_PATH)
+    try:
+        return tables[board]
+    except KeyError:
+        raise ValueError(
+            f"Unknown board '{board}' in cycle cost model "
+            f"(available: {', '.join(tables)})"
+        ) from None
@@ -28,7 +28,7 @@ from dash import Input, Output, dcc, html
 # 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from arduino_mock import ArduinoUnoR4WiFiMock
+from arduino_mock import MockPool
 from real_arduino_sim import RealArduinoImplementationGenerator
 
 
@@ -48,6 +48,9 @@ class AutoRealArduinoDashboard:
         self.progress = 0
         self.results = []
         self.error_log = []
+
+        # 구현마다 Mock을 새로 만들지 않고 조용히 초기화해서 재사용
+        self.mock_pool = MockPool()
         self.auto_thread = None
 
         # 구현 목록 로드
@@ -497,30 +500,32 @@ class AutoRealArduinoDashboard:
     ) -> Optional[Dict[str, Any]]:
         """단일 구현 테스트"""
         try:
-            arduino = ArduinoUnoR4WiFiMock(seed=12345)
-            generator = RealArduinoImplementationGenerator(impl, arduino)
+            with self.mock_pool.mock(12345) as arduino:
+                generator = RealArduinoImplementationGenerator(
+                    impl, arduino, verbose=False
+                )
 
-            # 성능 측정
-            start_time = time.time()
-            generated_numbers = []
-            violations = 0
-            test_iterations = 5000
+                # 성능 측정
+                start_time = time.time()
+                generated_numbers = []
+                violations = 0
+                test_iterations = 5000
 
-            previous = -1
-            for i in range(test_iterations):
-                number = generator.generate_number(previous)
-                generated_numbers.append(number)
+                previous = -1
+                for i in range(test_iterations):
+                    number = generator.generate_number(previous)
+                    generated_numbers.append(number)
 
-                if previous != -1 and number == previous:
-                    violations += 1
+                    if previous != -1 and number == previous:
+                        violations += 1
 
-                previous = number
+                    previous = number
 
-            end_time = time.time()
-            execution_time = end_time - start_time
-            generation_rate = (
-                test_iterations / execution_time if execution_time > 0 else 0
-            )
+                end_time = time.time()
+                execution_time = end_time - start_time
+                generation_rate = (
+                    test_iterations / execution_time if execution_time > 0 else 0
+                )
 
             # 분포 분석
             distribution = {i: generated_numbers.count(i) for i in range(3)}
@@ -0,0 +1,287 @@
+"""
+Arduino EEPROM Simulation
+교체 가능한 EEPROM 백엔드 (메모리 / 메모리 매핑 파일)
+
+주요 기능:
+- 셀별 쓰기 횟수 (wear) 추적 및 수명 리포트
+- 바이트 단위 read/write와 NumPy 기반 대량 read_block/write_block
+- write_sequence: 같은 셀에 반복 저장하는 패턴(부팅마다 previous_number 저장 등)을
+  Python 루프 없이 한 번에 처리
+- mmap 백엔드는 데이터와 쓰기 횟수를 파일에 보존 (전원 재투입 시뮬레이션)
+- 새 셀 값은 기존 Mock(bytearray)과 같은 0x00, 실제 칩처럼 0xFF로 하려면 fill_value 지정
+"""
+
+import os
+from typing import Any, Dict, Tuple, Union
+
+import numpy as np
+
+ERASED_VALUE = 0xFF  # 실제 칩의 지워진 EEPROM/플래시 셀 값
+DEFAULT_FILL_VALUE = 0x00  # 새 EEPROM 셀 값 (기존 Mock의 bytearray 초기값 호환)
+DEFAULT_ENDURANCE = 100_000  # 셀당 보장 쓰기 횟수 (ATmega328P, RA4M1 데이터 플래시)
+
+
+class EEPROMBackend:
+    """EEPROM 백엔드 기본 클래스"""
+
+    name = "base"
+
+    def __init__(
+        self,
+        size: int,
+        endurance: int = DEFAULT_ENDURANCE,
+        fill_value: int = DEFAULT_FILL_VALUE,
+    ):
+        self.size = size
+        self.endurance = endurance
+        self.fill_value = fill_value & 0xFF
+
+    # 하위 클래스가 제공: self._data (uint8), self._write_counts (uint32)
+
+    @property
+    def data(self) -> np.ndarray:
+        """셀 데이터 (수정 가능)"""
+        return self._data
+
+    @property
+    def write_counts(self) -> np.ndarray:
+        """셀별 누적 쓰기 횟수"""
+        return self._write_counts
+
+    @property
+    def buffer(self) -> Union[bytearray, memoryview]:
+        """셀 데이터를 공유하는 수정 가능한 바이트 버퍼"""
+        return memoryview(self.data)
+
+    def read(self, address: int) -> int:
+        return int(self._data[address])
+
+    def write(self, address: int, value: int):
+        """셀 1개 프로그래밍 (값이 같아도 쓰기 횟수 증가)"""
+        self.data[address] = value & 0xFF
+        self.write_counts[address] += 1
+
+    def read_block(self, address: int, length: int) -> np.ndarray:
+        """연속 영역 읽기 (복사본 반환)"""
+        return np.array(self._data[address : address + length], dtype=np.uint8)
+
+    def write_block(self, address: int, values: Any, update: bool = True) -> int:
+        """연속 영역 쓰기, 실제로 프로그래밍한 셀 수 반환"""
+        values = np.asarray(values).ravel()
+        addresses = np.arange(address, address + values.size)
+        return self.write_sequence(addresses, values, update=update)
+
+    def write_sequence(self, addresses: Any, values: Any, update: bool = True) -> int:
+        """
+        (주소, 값) 쓰기를 순서대로 적용한 것과 같은 결과를 벡터 연산으로 계산
+        update=True면 EEPROM.update()처럼 셀 값이 바뀔 때만 프로그래밍한다.
+        실제로 프로그래밍한 셀 수 반환
+        """
+        values = np.asarray(values).astype(np.uint8).ravel()
+        addresses = np.broadcast_to(np.asarray(addresses, dtype=np.int64), values.shape)
+        if values.size == 0:
+            return 0
+        if addresses.min() < 0 or addresses.max() >= self.size:
+            raise IndexError(f"EEPROM address out of range (size {self.size})")
+
+        # 주소별로 묶되 같은 주소 안에서는 원래 순서 유지
+        order = np.argsort(addresses, kind="stable")
+        sorted_addr = addresses[order]
+        sorted_vals = values[order]
+        group_start = np.ones(values.size, dtype=bool)
+        group_start[1:] = sorted_addr[1:] != sorted_addr[:-1]
+        group_end = np.ones(values.size, dtype=bool)
+        group_end[:-1] = group_start[1:]
+
+        data = self.data
+        if update:
+            # 각 쓰기 직전의 셀 값: 같은 주소의 이전 쓰기 값, 첫 쓰기는 현재 셀 값
+            previous = np.empty_like(sorted_vals)
+            previous[1:] = sorted_vals[:-1]
+            previous[group_start] = data[sorted_addr[group_start]]
+            programmed = sorted_vals != previous
+        else:
+            programmed = np.ones(values.size, dtype=bool)
+
+        counts = np.bincount(sorted_addr[programmed], minlength=self.size)
+        self.write_counts[:] += counts.astype(np.uint32)
+        data[sorted_addr[group_end]] = sorted_vals[group_end]
+
+        return int(np.count_nonzero(programmed))
+
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(데이터, 쓰기 횟수) 상태 캡처"""
+        return self._data.copy(), self._write_counts.copy()
+
+    def restore(self, state: Tuple[np.ndarray, np.ndarray]):
+        """snapshot()으로 캡처한 상태 복원"""
+        data, write_counts = state
+        self.data[:] = data
+        self.write_counts[:] = write_counts
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def wear_report(self) -> Dict[str, Any]:
+        """셀 마모 통계"""
+        counts = self._write_counts
+        hottest = int(np.argmax(counts))
+        max_writes = int(counts[hottest])
+        return {
+            "backend": self.name,
+            "size_bytes": self.size,
+            "total_writes": int(counts.sum(dtype=np.uint64)),
+            "cells_written": int(np.count_nonzero(counts)),
+            "max_cell_writes": max_writes,
+            "hottest_address": hottest,
+            "endurance": self.endurance,
+            "worst_cell_life_used_percent": max_writes / self.endurance * 100,
+        }
+
+
+class RamEEPROM(EEPROMBackend):
+    """
+    메모리 EEPROM (프로세스 종료 시 사라짐)
+    셀 데이터는 bytearray에 두고 NumPy 배열은 같은 메모리를 보는 뷰로 쓴다.
+    snapshot()은 버퍼를 복사하지 않고 공유하며, 이후 첫 쓰기 때만 복사한다.
+    """
+
+    name = "ram"
+
+    def __init__(
+        self,
+        size: int,
+        endurance: int = DEFAULT_ENDURANCE,
+        fill_value: int = DEFAULT_FILL_VALUE,
+    ):
+        super().__init__(size, endurance, fill_value)
+        self._set_buffer(bytearray([self.fill_value]) * size)
+        self._write_counts = np.zeros(size, dtype=np.uint32)
+        self._shared = False  # 스냅샷과 버퍼를 공유 중인지
+
+    def _set_buffer(self, buffer: bytearray):
+        self._buffer = buffer
+        self._data = np.frombuffer(buffer, dtype=np.uint8)
+
+    def _unshare(self):
+        if self._shared:
+            self._set_buffer(bytearray(self._buffer))
+            self._write_counts = self._write_counts.copy()
+            self._shared = False
+
+    @property
+    def data(self) -> np.ndarray:
+        self._unshare()
+        return self._data
+
+    @property
+    def write_counts(self) -> np.ndarray:
+        self._unshare()
+        return self._write_counts
+
+    @property
+    def buffer(self) -> bytearray:
+        self._unshare()
+        return self._buffer
+
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        self._shared = True
+        return self._data, self._write_counts
+
+    def restore(self, state: Tuple[np.ndarray, np.ndarray]):
+        data, self._write_counts = state
+        base = data.base
+        if isinstance(base, memoryview) and isinstance(base.obj, bytearray):
+            self._buffer, self._data = base.obj, data  # 스냅샷 버퍼 공유
+        else:
+            self._set_buffer(bytearray(data.tobytes()))
+        self._shared = True
+
+
+class MmapEEPROM(EEPROMBackend):
+    """
+    메모리 매핑 파일 EEPROM (프로세스가 끝나도 내용과 마모 정보 유지)
+    파일 구성: 데이터 size 바이트 + 셀별 쓰기 횟수 (uint32 x size)
+    """
+
+    name = "mmap"
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        endurance: int = DEFAULT_ENDURANCE,
+        fill_value: int = DEFAULT_FILL_VALUE,
+    ):
+        super().__init__(size, endurance, fill_value)
+        self.path = path
+
+        file_size = size * 5
+        if not os.path.exists(path) or os.path.getsize(path) != file_size:
+            # 새 칩: 모든 셀이 fill_value, 쓰기 횟수 0
+            with open(path, "wb") as f:
+                f.write(bytes([self.fill_value]) * size)
+                f.write(bytes(size * 4))
+
+        self._data = np.memmap(path, dtype=np.uint8, mode="r+", shape=(size,))
+        self._write_counts = np.memmap(
+            path, dtype=np.uint32, mode="r+", offset=size, shape=(size,)
+        )
+
+    def flush(self):
+        self._data.flush()
+        self._write_counts.flush()
+
+
+def create_eeprom(
+    spec: Union[str, EEPROMBackend] = "ram",
+    size: int = 8 * 1024,
+    endurance: int = DEFAULT_ENDURANCE,
+    fill_value: int = DEFAULT_FILL_VALUE,
+) -> EEPROMBackend:
+    """
+    백엔드 생성 편의 함수: "ram", "mmap:<경로>" 또는 EEPROMBackend 인스턴스
+    fill_value는 새 셀 값 (실제 칩의 지워진 상태는 ERASED_VALUE)
+    """
+    if isinstance(spec, EEPROMBackend):
+        return spec
+    if spec == "ram":
+        return RamEEPROM(size, endurance, fill_value)
+    if spec.startswith("mmap:"):
+        return MmapEEPROM(spec[len("mmap:") :], size, endurance, fill_value)
+    raise ValueError(f"Unknown EEPROM backend '{spec}'")
+
+
+# ==================== 테스트 코드 ====================
+
+if __name__ == "__main__":
+    # 부팅마다 previous_number를 저장하는 전략별 마모 비교 (100만 회 부팅)
+    boots = 1_000_000
+    rng = np.random.default_rng(12345)
+    numbers = rng.integers(0, 3, boots)
+
+    print(f"=== EEPROM wear: {boots:,} boots ===")
+
+    always = RamEEPROM(1024)
+    always.write_sequence(0, numbers, update=False)
+
+    update = RamEEPROM(1024)
+    update.write_sequence(0, numbers, update=True)
+
+    # 16셀 링에 순환 저장 (wear leveling)
+    leveled = RamEEPROM(1024)
+    leveled.write_sequence(np.arange(boots) % 16, numbers, update=True)
+
+    for label, eeprom in [
+        ("EEPROM.write() every boot", always),
+        ("EEPROM.update() every boot", update),
+        ("update() + 16-cell ring", leveled),
+    ]:
+        report = eeprom.wear_report()
+        print(
+            f"{label:<28} max cell writes {report['max_cell_writes']:>9,} "
+            f"({report['worst_cell_life_used_percent']:.1f}% of endurance)"
+        )
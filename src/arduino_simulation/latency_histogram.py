@@ -0,0 +1,123 @@
+"""
+Latency Histogram
+HDR 스타일 로그 버킷 지연 시간 히스토그램 (고정 메모리, O(1) 기록, 병합 가능)
+
+값은 나노초 정수로 기록한다. 2의 거듭제곱 구간마다 같은 수의 선형 하위 버킷을 두어
+상대 오차를 significant_digits 유효 자릿수 이내로 유지한다.
+(기본 2자리: 오차 1% 미만, 1ns ~ 약 18분 범위에서 약 4,500개 버킷)
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """로그 버킷 지연 시간 히스토그램 (나노초 단위)"""
+
+    def __init__(self, highest_ns: int = 2**40, significant_digits: int = 2):
+        self.highest_ns = highest_ns
+        self.significant_digits = significant_digits
+
+        # 하위 버킷 수: 2 * 10^digits 이상인 2의 거듭제곱
+        self._sub_bits = math.ceil(math.log2(2 * 10**significant_digits))
+        self._sub_count = 1 << self._sub_bits
+        self._half = self._sub_count >> 1
+        top_shift = max(0, highest_ns.bit_length() - self._sub_bits)
+        self.counts: List[int] = [0] * (self._sub_count + top_shift * self._half)
+        self._last_index = len(self.counts) - 1  # highest_ns 초과 값은 마지막 버킷
+
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self._sub_bits
+        index = self._sub_count + (shift - 1) * self._half + (value >> shift)
+        return min(index - self._half, self._last_index)
+
+    def _upper_bound(self, index: int) -> int:
+        """버킷의 최대 등가 값"""
+        if index < self._sub_count:
+            return index
+        shift, offset = divmod(index - self._sub_count, self._half)
+        shift += 1
+        return ((self._half + offset + 1) << shift) - 1
+
+    def record_ns(self, value: int, count: int = 1):
+        """나노초 값 기록"""
+        value = max(0, int(value))
+        self.counts[self._index(value)] += count
+        self.count += count
+        self.total_ns += value * count
+        if self.min_ns is None or value < self.min_ns:
+            self.min_ns = value
+        if value > self.max_ns:
+            self.max_ns = value
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """다른 히스토그램 누적 (같은 설정이어야 함)"""
+        if len(other.counts) != len(self.counts) or other._sub_bits != self._sub_bits:
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total_ns += other.total_ns
+        if other.min_ns is not None:
+            self.min_ns = (
+                other.min_ns if self.min_ns is None else min(self.min_ns, other.min_ns)
+            )
+        self.max_ns = max(self.max_ns, other.max_ns)
+        return self
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile_ns(self, percentile: float) -> int:
+        """백분위 값 (버킷 상한, 최대값으로 제한)"""
+        if self.count == 0:
+            return 0
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return min(self._upper_bound(index), self.max_ns)
+
+    def summary_us(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict:
+        """평균/최소/최대와 백분위 요약 (마이크로초, 키: p50, p90, p99, p99.9, max)"""
+        summary = {
+            "count": self.count,
+            "mean": self.mean_ns / 1000,
+            "min": (self.min_ns or 0) / 1000,
+        }
+        for p in percentiles:
+            summary[f"p{p:g}"] = self.percentile_ns(p) / 1000
+        summary["max"] = self.max_ns / 1000
+        return summary
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON 저장용 상태 (0이 아닌 버킷만)"""
+        return {
+            "highest_ns": self.highest_ns,
+            "significant_digits": self.significant_digits,
+            "buckets": [[i, c] for i, c in enumerate(self.counts) if c],
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls(state["highest_ns"], state["significant_digits"])
+        for index, count in state["buckets"]:
+            histogram.counts[index] = count
+        histogram.count = state["count"]
+        histogram.total_ns = state["total_ns"]
+        histogram.min_ns = state["min_ns"]
+        histogram.max_ns = state["max_ns"]
+        return histogram
@@ -0,0 +1,233 @@
+"""
+Markov Chain Analysis
+구현의 생성 함수를 이전 숫자 -> 다음 숫자 3x3 전이 행렬로 정확히 환원하는 분석 엔진
+
+random() 결과를 스크립트로 주입하는 RNG 백엔드로 generate_number()를 다시 실행하면서
+가능한 모든 난수 분기(random(0, n)의 n가지)를 깊이 우선으로 탐색한다.
+각 분기의 확률은 1/n의 곱이므로 Monte Carlo 없이 전이 확률을 그대로 얻는다.
+재귀처럼 분기가 끝없이 이어지는 경우 min_probability 미만의 경로는 잘라내고
+잘린 확률을 truncated_probability로 보고한다.
+0..2 밖의 숫자(Bitwise의 3 등)를 반환하는 경로도 행에서 빼고 out_of_range_probability로
+보고하므로, 그런 구현의 행렬은 범위 안 결과로 조건부 재정규화한 근사다.
+
+이전 숫자 외의 상태(패턴 인덱스 등)가 바뀌는 구현은 마르코프 체인이 아니므로 None.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from arduino_mock import ArduinoUnoR4WiFiMock, InstrumentationLevel
+from board_profiles import DEFAULT_BOARD
+from rng_backends import RandomBackend
+
+STATES = 3
+DEFAULT_MIN_PROBABILITY = 1e-15
+# 생성 1회마다 바뀌어도 되는 속성 (이전 숫자, 재귀 깊이)
+_CHAIN_STATE_ATTRIBUTES = ("prev_num", "recursion_depth")
+
+
+class _NeedDraw(BaseException):
+    """
+    스크립트가 끝난 지점에서 새 난수가 필요함
+    (구현의 except Exception 폴백에 잡히지 않도록 BaseException 상속)
+    """
+
+    def __init__(self, span: int):
+        super().__init__(span)
+        self.span = span
+
+
+class ScriptedRandomBackend(RandomBackend):
+    """정해둔 random(min, max) 결과(min으로부터의 오프셋)를 차례로 돌려주는 백엔드"""
+
+    name = "scripted"
+
+    def __init__(self, seed: Optional[int] = None):
+        self.script: Tuple[int, ...] = ()
+        self.position = 0
+
+    def seed(self, seed: int):
+        pass  # 시드 무관
+
+    def random_range(self, min_val: int, max_val: int) -> int:
+        if min_val >= max_val:
+            return min_val
+        if self.position == len(self.script):
+            raise _NeedDraw(max_val - min_val)
+        offset = self.script[self.position]
+        self.position += 1
+        return min_val + offset
+
+    def getstate(self) -> Any:
+        return (self.script, self.position)
+
+    def setstate(self, state: Any):
+        self.script, self.position = tuple(state[0]), state[1]
+
+
+@dataclass
+class MarkovChainModel:
+    """구현의 정확한 전이 확률과 파생 통계"""
+
+    transition_matrix: np.ndarray  # [이전][다음] 확률
+    initial_distribution: np.ndarray  # 첫 생성 (이전 숫자 -1) 분포
+    truncated_probability: float = 0.0  # 잘라낸 경로 확률의 최대값
+    out_of_range_probability: float = 0.0  # 0..2 밖 숫자를 반환할 확률의 최대값
+
+    @property
+    def stationary_distribution(self) -> np.ndarray:
+        """pi P = pi, sum(pi) = 1의 해"""
+        system = np.vstack([self.transition_matrix.T - np.eye(STATES), np.ones(STATES)])
+        target = np.zeros(STATES + 1)
+        target[-1] = 1.0
+        return np.linalg.lstsq(system, target, rcond=None)[0]
+
+    @property
+    def violation_rate(self) -> float:
+        """정상 상태에서 연속 같은 숫자가 나올 확률"""
+        return float(self.stationary_distribution @ np.diag(self.transition_matrix))
+
+    @property
+    def entropy_rate_bits(self) -> float:
+        """생성 1회당 엔트로피 (비트, 최대 log2(3) = 1.585)"""
+        matrix = self.transition_matrix
+        logs = np.log2(matrix, out=np.zeros_like(matrix), where=matrix > 0)
+        return float(-(self.stationary_distribution @ (matrix * logs).sum(axis=1)))
+
+    def expected_counts(self, iterations: int) -> Tuple[np.ndarray, float]:
+        """첫 생성부터 iterations회 동안의 숫자별 기대 횟수와 기대 위반 수"""
+        distribution = np.zeros(STATES)
+        violations = 0.0
+        current = self.initial_distribution.copy()
+        stationary = self.stationary_distribution
+        diagonal = np.diag(self.transition_matrix)
+
+        for step in range(iterations):
+            distribution += current
+            if step + 1 == iterations:
+                break
+            violations += float(current @ diagonal)
+            following = current @ self.transition_matrix
+            if np.abs(following - stationary).max() < 1e-15:
+                # 정상 분포에 수렴하면 남은 구간은 한 번에 합산
+                remaining = iterations - step - 1
+                distribution += remaining * stationary
+                violations += (remaining - 1) * float(stationary @ diagonal)
+                break
+            current = following
+
+        return distribution, violations
+
+    def to_dict(self, iterations: Optional[int] = None) -> Dict[str, Any]:
+        """JSON 저장용 요약 (iterations를 주면 기대 횟수 포함)"""
+        summary = {
+            "transition_matrix": self.transition_matrix.tolist(),
+            "initial_distribution": self.initial_distribution.tolist(),
+            "stationary_distribution": self.stationary_distribution.tolist(),
+            "violation_rate": self.violation_rate,
+            "entropy_rate_bits": self.entropy_rate_bits,
+            "truncated_probability": self.truncated_probability,
+            "out_of_range_probability": self.out_of_range_probability,
+        }
+        if iterations:
+            distribution, violations = self.expected_counts(iterations)
+            summary["expected_distribution"] = {
+                i: float(count) for i, count in enumerate(distribution)
+            }
+            summary["expected_violations"] = violations
+        return summary
+
+
+def _transition_row(
+    generator: Any,
+    backend: ScriptedRandomBackend,
+    previous: int,
+    min_probability: float,
+) -> Optional[Tuple[np.ndarray, float, float]]:
+    """
+    이전 숫자 하나에 대한 다음 숫자 분포, 잘린 확률, 범위 밖 확률
+    (체인 외 상태가 바뀌면 None)
+    """
+    initial_state = dict(generator.__dict__)
+    row = np.zeros(STATES)
+    truncated = 0.0
+    out_of_range = 0.0
+    pending = [((), 1.0)]
+
+    while pending:
+        script, probability = pending.pop()
+        generator.__dict__.update(initial_state)
+        backend.script, backend.position = script, 0
+        try:
+            number = generator.generate_number(previous)
+        except _NeedDraw as need:
+            branch = probability / need.span
+            if branch < min_probability:
+                truncated += probability
+                continue
+            pending.extend((script + (draw,), branch) for draw in range(need.span))
+            continue
+
+        changed = [
+            name
+            for name, value in initial_state.items()
+            if name not in _CHAIN_STATE_ATTRIBUTES and generator.__dict__[name] != value
+        ]
+        if changed:
+            generator.__dict__.update(initial_state)
+            return None
+        if 0 <= number < STATES:
+            row[number] += probability
+        else:
+            out_of_range += probability
+
+    generator.__dict__.update(initial_state)
+    return row, truncated, out_of_range
+
+
+def derive_markov_model(
+    make_generator: Callable[[ArduinoUnoR4WiFiMock], Any],
+    board: str = DEFAULT_BOARD,
+    min_probability: float = DEFAULT_MIN_PROBABILITY,
+) -> Optional[MarkovChainModel]:
+    """
+    make_generator(mock)로 만든 생성기의 정확한 전이 행렬 계산
+    생성기는 generate_number(previous)를 제공해야 하며, 분석 전용 Mock에서 실행된다.
+    마르코프 체인이 아니면 None
+    """
+    backend = ScriptedRandomBackend()
+    arduino = ArduinoUnoR4WiFiMock(
+        rng_backend=backend,
+        instrumentation=InstrumentationLevel.OFF,
+        serial_sink="discard",
+        board=board,
+        verbose=False,
+    )
+    generator = make_generator(arduino)
+
+    rows = []
+    truncated = 0.0
+    out_of_range = 0.0
+    for previous in (-1, 0, 1, 2):
+        result = _transition_row(generator, backend, previous, min_probability)
+        if result is None:
+            return None
+        row, row_truncated, row_out_of_range = result
+        if not row.sum():
+            raise ValueError(f"Implementation never returned 0..2 after {previous}")
+        rows.append(row / row.sum())  # 잘라낸/범위 밖 확률만큼 재정규화
+        truncated = max(truncated, row_truncated)
+        out_of_range = max(out_of_range, row_out_of_range)
+
+    return MarkovChainModel(
+        transition_matrix=np.array(rows[1:]),
+        initial_distribution=rows[0],
+        truncated_probability=truncated,
+        out_of_range_probability=out_of_range,
+    )
+
+
+def format_probabilities(values: np.ndarray, digits: int = 3) -> str:
+    """[0.5, 0.25, 0.25] 형태 출력용 문자열"""
+    return "[" + ", ".join(f"{value:.{digits}f}" for value in values) + "]"
@@ -11,10 +11,25 @@ Multi-Implementation Arduino Simulator
 
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
+import numpy as np
 import yaml
-from arduino_mock import ArduinoUnoR4WiFiMock
+from arduino_mock import ArduinoUnoR4WiFiMock, MockPool
+from board_profiles import BOARD_PROFILES, DEFAULT_BOARD
+from markov_analysis import derive_markov_model
+from retry_engine import (
+    RetryEngine,
+    draws_quantile,
+    expected_draws,
+    iter_retry_chunks,
+)
+from sequence_analysis import SequenceCounts
+from streaming import (
+    DEFAULT_STREAM_CHUNK_SIZE,
+    iter_generated_chunks,
+    iter_numbers_from_chunks,
+)
 
 
 @dataclass
@@ -32,6 +47,11 @@ class ImplementationResult:
     generated_sequence: List[int]
     error_message: Optional[str] = None
     success: bool = True
+    board: str = DEFAULT_BOARD
+    cycles_per_generation: float = 0.0
+    predicted_device_rate: float = 0.0  # 비용 모델 기반 온디바이스 gen/sec
+    analytic: Optional[Dict[str, Any]] = None  # 전이 행렬 기반 정확한 통계
+    retry_draws: Optional[Dict[str, Any]] = None  # 재시도 구현의 숫자당 추첨 수 분포
 
 
 @dataclass
@@ -59,6 +79,9 @@ class MultiImplementationSimulator:
         self.comparison_metrics = []
         self.recommendation_weights = {}
 
+        # 구현 x 시드 x 보드마다 Mock을 새로 만들지 않고 조용히 초기화해서 재사용
+        self.mock_pool = MockPool()
+
         self._load_configuration()
         print(f"Loaded {len(self.implementations)} implementations")
 
@@ -126,6 +149,21 @@ class MultiImplementationSimulator:
                     f"✅ Success: {result.generation_rate:,.0f} gen/sec, "
                     f"{result.constraint_violations} violations"
                 )
+                if result.analytic:
+                    print(
+                        f"   Exact: {result.analytic['expected_violations']:.1f} "
+                        f"expected violations, "
+                        f"entropy {result.analytic['entropy_rate_bits']:.3f} bits/gen"
+                    )
+                if result.retry_draws:
+                    draws = result.retry_draws
+                    print(
+                        f"   RNG draws/number: mean {draws['mean_draws']:.3f} "
+                        f"(expected {draws['expected_draws']:.3f}), "
+                        f"p99 {draws['p99_draws']} "
+                        f"(expected {draws['expected_p99_draws']}), "
+                        f"max {draws['max_draws']}, {draws['fallbacks']} fallbacks"
+                    )
 
             except Exception as e:
                 failed_result = ImplementationResult(
@@ -152,38 +190,45 @@ class MultiImplementationSimulator:
         return report
 
     def _run_single_implementation(
-        self, impl_config: Dict[str, Any], iterations: int, seed: int
+        self,
+        impl_config: Dict[str, Any],
+        iterations: int,
+        seed: int,
+        board: str = DEFAULT_BOARD,
+        rng_backend: str = "mt19937",
     ) -> ImplementationResult:
         """단일 구현 실행"""
-        arduino = ArduinoUnoR4WiFiMock(seed=seed)
-        generator = ImplementationGenerator(impl_config, arduino)
-
-        # 성능 측정 시작
-        start_time = time.time()
-        arduino.reset_performance_counters()
-
-        # 시뮬레이션 실행
-        generated_numbers = []
-        previous_number = -1
-
-        for i in range(iterations):
-            number = generator.generate_number(previous_number)
-            generated_numbers.append(number)
-            previous_number = number
-
-        end_time = time.time()
-        execution_time = end_time - start_time
-
-        # 결과 분석
-        distribution = {i: generated_numbers.count(i) for i in range(3)}
-        constraint_violations = sum(
-            1
-            for i in range(1, len(generated_numbers))
-            if generated_numbers[i] == generated_numbers[i - 1]
-        )
-
-        generation_rate = iterations / execution_time if execution_time > 0 else 0
-        memory_usage = arduino.get_performance_stats()["sram_usage_bytes"]
+        with self.mock_pool.mock(seed, rng_backend=rng_backend, board=board) as arduino:
+            generator = ImplementationGenerator(impl_config, arduino)
+
+            # 성능 측정 시작
+            start_time = time.time()
+            arduino.reset_performance_counters()
+
+            # 시뮬레이션 실행 (청크 단위로 집계, 앞부분 100개만 보관)
+            counts = SequenceCounts()
+            sample: List[int] = []
+            for chunk in generator.iter_chunks(iterations=iterations):
+                counts.update(chunk)
+                if len(sample) < 100:
+                    sample.extend(chunk[: 100 - len(sample)].tolist())
+
+            end_time = time.time()
+            execution_time = end_time - start_time
+
+            # 결과 분석
+            distribution = counts.distribution_dict()
+            constraint_violations = counts.violations
+
+            generation_rate = iterations / execution_time if execution_time > 0 else 0
+            perf_stats = arduino.get_performance_stats()
+            memory_usage = perf_stats["sram_usage_bytes"]
+            cycles_per_generation = perf_stats["instruction_count"] / iterations
+            predicted_device_rate = (
+                perf_stats["clock_speed_hz"] / cycles_per_generation
+                if cycles_per_generation > 0
+                else 0
+            )
 
         return ImplementationResult(
             id=impl_config["id"],
@@ -194,9 +239,83 @@ class MultiImplementationSimulator:
             memory_usage=memory_usage,
             distribution=distribution,
             constraint_violations=constraint_violations,
-            generated_sequence=generated_numbers[:100],  # 처음 100개만 저장
+            generated_sequence=sample,  # 처음 100개만 저장
+            board=board,
+            cycles_per_generation=cycles_per_generation,
+            predicted_device_rate=predicted_device_rate,
+            analytic=self._derive_analytic(impl_config, iterations, board),
+            retry_draws=self._retry_draws(generator),
         )
 
+    def _retry_draws(self, generator: "ImplementationGenerator") -> Optional[Dict]:
+        """재시도 구현이면 숫자당 추첨 수 분포와 기대값 (충돌 확률 1/3 기준)"""
+        engine = getattr(generator, "retry_engine", None)
+        if engine is None:
+            return None
+        limit = engine.max_draws
+        summary = engine.stats.to_dict()
+        # 버리는 첫 후보 1회 + 재추첨
+        summary["expected_draws"] = 1 + expected_draws(max_draws=limit)
+        summary["expected_p99_draws"] = 1 + draws_quantile(0.99, max_draws=limit)
+        return summary
+
+    def _derive_analytic(
+        self, impl_config: Dict[str, Any], iterations: int, board: str
+    ) -> Optional[Dict[str, Any]]:
+        """정확한 전이 행렬/정상 분포/기대 위반 수 (마르코프 체인이 아니면 None)"""
+        try:
+            model = derive_markov_model(
+                lambda arduino: ImplementationGenerator(impl_config, arduino),
+                board=board,
+            )
+        except ValueError as e:
+            print(f"⚠️ Analytic model unavailable for {impl_config['name']}: {e}")
+            return None
+        return model.to_dict(iterations) if model else None
+
+    def run_board_sweep(
+        self, boards: List[str] = None, iterations: int = None, seed: int = None
+    ) -> Dict[str, Any]:
+        """
+        모든 구현을 여러 보드에서 실행하여 보드별 처리량/메모리 예측 매트릭스 생성
+        각 보드는 자체 클럭, SRAM, 사이클 비용, random() 구현을 사용
+        """
+        boards = boards or list(BOARD_PROFILES)
+        iterations = iterations or self.test_config.get("default_iterations", 10000)
+        seed = seed or self.test_config.get("default_seed", 12345)
+
+        print("\n=== Board Sweep ===")
+        print(f"Boards: {', '.join(boards)}")
+        print(f"Implementations: {len(self.implementations)}")
+        print("-" * 50)
+
+        matrix = {}
+        for impl_config in self.implementations.values():
+            row = matrix.setdefault(impl_config["name"], {})
+            for board in boards:
+                try:
+                    result = self._run_single_implementation(
+                        impl_config, iterations, seed, board=board, rng_backend="board"
+                    )
+                except Exception as e:
+                    print(f"❌ {impl_config['name']} on {board}: {e}")
+                    row[board] = {"success": False, "error_message": str(e)}
+                    continue
+
+                sram_bytes = BOARD_PROFILES[board].sram_bytes
+                row[board] = {
+                    "success": True,
+                    "predicted_device_rate": result.predicted_device_rate,
+                    "cycles_per_generation": result.cycles_per_generation,
+                    "sram_usage_bytes": result.memory_usage,
+                    "sram_usage_percent": result.memory_usage / sram_bytes * 100,
+                    "fits_in_sram": result.memory_usage <= sram_bytes,
+                    "constraint_violations": result.constraint_violations,
+                }
+
+        print_board_matrix(matrix, boards)
+        return {"boards": boards, "iterations": iterations, "matrix": matrix}
+
     def _generate_comparison_report(
         self, results: List[ImplementationResult], successful: int, failed: int
     ) -> ComparisonReport:
@@ -299,6 +418,21 @@ class MultiImplementationSimulator:
         ]
 
 
+# 구현 타입별 생성 메서드 (모두 (이전 숫자, 후보) 시그니처)
+# 알 수 없는 타입은 룩업 테이블 방식
+GENERATION_METHODS = {
+    "lookup_table": "_lookup_table_method",
+    "conditional": "_conditional_method",
+    "dictionary": "_dictionary_method",
+    "formula": "_formula_method",
+    "bitwise": "_bitwise_method",
+    "retry": "_retry_method",
+    "weighted": "_weighted_method",
+    "pattern": "_pattern_method",
+    "hybrid": "_hybrid_method",
+}
+
+
 class ImplementationGenerator:
     """개별 구현의 숫자 생성기"""
 
@@ -307,6 +441,10 @@ class ImplementationGenerator:
         self.arduino = arduino
         self.type = impl_config.get("type", "unknown")
 
+        # 전역 변수/테이블 SRAM 점유 (이전 값 1개 + 타입별 테이블, 보드 int 크기 기준)
+        self.sram_bytes = arduino.specs.int_size * (1 + self._table_entries())
+        arduino.allocate_sram(self.sram_bytes)
+
         # 타입별 초기화
         if self.type == "lookup_table":
             self.lookup_table = impl_config["lookup_table"]
@@ -317,31 +455,62 @@ class ImplementationGenerator:
             self.pattern_index = 0
         elif self.type == "weighted":
             self.weights = impl_config["weights"]
+        elif self.type == "retry":
+            self.retry_engine = RetryEngine(impl_config.get("max_retries", 10))
+
+        # 타입 문자열은 여기서 한 번만 해석 (호출마다 비교하지 않음)
+        self._generate = getattr(
+            self, GENERATION_METHODS.get(self.type, "_lookup_table_method")
+        )
+
+    def _table_entries(self) -> int:
+        """타입별 전역 테이블 항목 수 (int 단위)"""
+        if self.type in ("lookup_table", "weighted", "hybrid"):
+            return 9  # 3x3 테이블
+        if self.type == "dictionary":
+            return 2 * len(self.config.get("mapping", {}))  # 키 + 값
+        if self.type == "pattern":
+            return len(self.config.get("pattern", []))
+        return 0
 
     def generate_number(self, previous: int) -> int:
-        """구현 타입에 따른 숫자 생성"""
-        candidate = self.arduino.random_range(0, 3)
+        """구현 타입에 따른 숫자 생성 (생성 메서드는 생성자에서 바인딩)"""
+        return self._generate(previous, self.arduino.random_range(0, 3))
+
+    def iter_chunks(
+        self,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        iterations: Optional[int] = None,
+        previous: int = -1,
+    ) -> Iterator[np.ndarray]:
+        """
+        생성한 숫자를 chunk_size개씩 uint8 배열로 지연 생성 (iterations=None이면 무한)
+        재시도 방식은 RetryEngine 배치 경로 (출력마다 버리는 후보 1개 포함,
+        타이머 등 예약 이벤트가 있으면 제때 실행되도록 숫자 단위 경로 유지)
+        """
+        if self._generate == self._retry_method and not len(self.arduino.scheduler):
+            return iter_retry_chunks(
+                self.retry_engine,
+                lambda n: self.arduino.random_range_batch(0, 3, n),
+                chunk_size,
+                iterations,
+                previous,
+                discard=1,
+            )
+        return iter_generated_chunks(
+            self.generate_number, chunk_size, iterations, previous
+        )
 
-        if self.type == "lookup_table":
-            return self._lookup_table_method(previous, candidate)
-        elif self.type == "conditional":
-            return self._conditional_method(previous, candidate)
-        elif self.type == "dictionary":
-            return self._dictionary_method(previous, candidate)
-        elif self.type == "formula":
-            return self._formula_method(previous, candidate)
-        elif self.type == "bitwise":
-            return self._bitwise_method(previous, candidate)
-        elif self.type == "retry":
-            return self._retry_method(previous)
-        elif self.type == "weighted":
-            return self._weighted_method(previous)
-        elif self.type == "pattern":
-            return self._pattern_method()
-        elif self.type == "hybrid":
-            return self._hybrid_method(previous, candidate)
-        else:
-            return self._lookup_table_method(previous, candidate)  # 기본값
+    def iter_numbers(
+        self,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        iterations: Optional[int] = None,
+        previous: int = -1,
+    ) -> Iterator[int]:
+        """iter_chunks()를 숫자 하나씩 yield"""
+        return iter_numbers_from_chunks(
+            self.iter_chunks(chunk_size, iterations, previous)
+        )
 
     def _lookup_table_method(self, previous: int, candidate: int) -> int:
         """룩업 테이블 방식"""
@@ -398,17 +567,16 @@ class ImplementationGenerator:
             result = (result + 1) % 3
         return result
 
-    def _retry_method(self, previous: int) -> int:
-        """재시도 방식"""
-        max_retries = self.config.get("max_retries", 10)
-        for _ in range(max_retries):
-            candidate = self.arduino.random_range(0, 3)
-            if candidate != previous:
-                return candidate
-        return (previous + 1) % 3  # fallback
-
-    def _weighted_method(self, previous: int) -> int:
-        """가중치 방식"""
+    def _retry_method(self, previous: int, candidate: int) -> int:
+        """재시도 방식 (첫 후보는 버리고 직접 다시 뽑음, 추첨 수에는 포함)"""
+        num = self.retry_engine.draw(self._draw_candidate, previous, extra_draws=1)
+        return (previous + 1) % 3 if num is None else num  # fallback
+
+    def _draw_candidate(self) -> int:
+        return self.arduino.random_range(0, 3)
+
+    def _weighted_method(self, previous: int, candidate: int) -> int:
+        """가중치 방식 (후보 대신 가중치 난수 사용)"""
         if previous == -1:
             return self.arduino.random_range(0, 3)
 
@@ -422,8 +590,8 @@ class ImplementationGenerator:
                 return i
         return 2  # fallback
 
-    def _pattern_method(self) -> int:
-        """패턴 방식"""
+    def _pattern_method(self, previous: int, candidate: int) -> int:
+        """패턴 방식 (이전 값/후보와 무관)"""
         result = self.pattern[self.pattern_index]
         self.pattern_index = (self.pattern_index + 1) % len(self.pattern)
         return result
@@ -443,6 +611,27 @@ class ImplementationGenerator:
 # ==================== 편의 함수들 ====================
 
 
+def print_board_matrix(matrix: Dict[str, Dict[str, Dict[str, Any]]], boards: List[str]):
+    """구현 x 보드 예측 처리량(gen/sec) 및 SRAM 사용량 표 출력 (최대값이 있으면 최대값)"""
+    print(f"\n{'Implementation':<28}" + "".join(f"{b:>22}" for b in boards))
+    print("-" * (28 + 22 * len(boards)))
+    for name, row in matrix.items():
+        cells = []
+        for board in boards:
+            entry = row.get(board, {})
+            if not entry.get("success"):
+                cells.append(f"{'FAILED':>22}")
+                continue
+            cell = (
+                f"{entry['predicted_device_rate']:,.0f}/s "
+                f"{entry.get('peak_sram_bytes', entry['sram_usage_bytes'])}B"
+            )
+            if not entry["fits_in_sram"]:
+                cell += "!"
+            cells.append(f"{cell:>22}")
+        print(f"{name[:27]:<28}" + "".join(cells))
+
+
 def run_multi_implementation_test(
     config_file: str = "arduino_implementations.yaml",
     iterations: int = 10000,
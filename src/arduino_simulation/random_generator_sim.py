@@ -10,10 +10,23 @@ Arduino Uno R4 WiFi에서 실행되는 랜덤 숫자 생성기의 정확한 시
 
 import json
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from arduino_mock import ArduinoUnoR4WiFiMock
+import numpy as np
+from arduino_mock import ArduinoUnoR4WiFiMock, ClockMode
+from batch_engine import resolve_lookup_chain
+from checkpoint import load_checkpoint, save_checkpoint
+from latency_histogram import LatencyHistogram
+from results_io import save_results_file
+from sequence_analysis import SequenceCounts, analyze_sequence
+from streaming import DEFAULT_STREAM_CHUNK_SIZE, iter_numbers_from_chunks
+from timing import DEFAULT_TIMING_INTERVAL, TimingMode, timer_overhead_ns
+from trit_sequence import TritSequence
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 청크당 생성 수 (scalar는 집계 단위)
+BATCH_ENGINES = ("scalar", "numpy")
 
 
 @dataclass
@@ -24,7 +37,7 @@ class GenerationStats:
     start_time: float = 0.0
     number_frequency: Dict[int, int] = None
     transition_matrix: Dict[str, int] = None
-    generation_times: List[float] = None
+    generation_latency: LatencyHistogram = None  # 생성 1회 소요 시간 (고정 메모리)
     constraint_violations: int = 0
 
     def __post_init__(self):
@@ -32,8 +45,47 @@ class GenerationStats:
             self.number_frequency = {0: 0, 1: 0, 2: 0}
         if self.transition_matrix is None:
             self.transition_matrix = {}
-        if self.generation_times is None:
-            self.generation_times = []
+        if self.generation_latency is None:
+            self.generation_latency = LatencyHistogram()
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON 저장용 상태 (체크포인트)"""
+        return {
+            "total_count": self.total_count,
+            "start_time": self.start_time,
+            "number_frequency": self.number_frequency,
+            "transition_matrix": self.transition_matrix,
+            "generation_latency": self.generation_latency.to_state(),
+            "constraint_violations": self.constraint_violations,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "GenerationStats":
+        return cls(
+            total_count=state["total_count"],
+            start_time=state["start_time"],
+            # JSON 키는 문자열로 저장됨
+            number_frequency={
+                int(number): count
+                for number, count in state["number_frequency"].items()
+            },
+            transition_matrix=dict(state["transition_matrix"]),
+            generation_latency=LatencyHistogram.from_state(
+                state["generation_latency"]
+            ),
+            constraint_violations=state["constraint_violations"],
+        )
+
+
+@dataclass
+class BatchState:
+    """진행 중인 대량 시뮬레이션 상태 (체크포인트 단위)"""
+
+    iterations: int  # 목표 반복 수 (재개/연장 시 누적 기준)
+    done: int = 0
+    counts: SequenceCounts = field(default_factory=SequenceCounts)
+    sample: List[int] = field(default_factory=list)  # 앞부분 50개
+    elapsed_seconds: float = 0.0  # 이전 실행 구간까지의 소요 시간
 
 
 class RandomNumberGeneratorSim:
@@ -42,12 +94,31 @@ class RandomNumberGeneratorSim:
     원본 Arduino 코드의 정확한 동작을 Python으로 재현
     """
 
-    def __init__(self, arduino_mock: ArduinoUnoR4WiFiMock):
+    def __init__(
+        self,
+        arduino_mock: ArduinoUnoR4WiFiMock,
+        verbose: bool = True,
+        timing_mode: Union[str, TimingMode] = TimingMode.EVERY,
+        timing_interval: int = DEFAULT_TIMING_INTERVAL,
+    ):
         self.arduino = arduino_mock
         self.previous_number = -1  # Arduino 코드와 동일한 초기값
         self.generation_count = 0
         self.stats = GenerationStats(start_time=time.time())
 
+        # 생성 시간 측정 (SAMPLED/BLOCK은 timing_interval회마다 1번 측정)
+        self.timing_mode = TimingMode(timing_mode)
+        self.timing_interval = max(1, int(timing_interval))
+        self.timer_overhead_ns = (
+            timer_overhead_ns() if self.timing_mode is not TimingMode.OFF else 0
+        )
+        # generate_random_number()에서 측정하는 간격 (0 = 호출 단위로 측정 안 함)
+        self._sample_interval = {
+            TimingMode.EVERY: 1,
+            TimingMode.SAMPLED: self.timing_interval,
+        }.get(self.timing_mode, 0)
+        self._timing_countdown = 1 if self._sample_interval else 0
+
         # 룩업 테이블 (Arduino 코드와 동일)
         # [이전숫자][후보숫자] = 결과숫자
         self.lookup_table = [
@@ -56,18 +127,30 @@ class RandomNumberGeneratorSim:
             [0, 1, 0],  # 이전이 2일 때: 0->0, 1->1, 2->0
         ]
 
-        print("Random Number Generator Simulation initialized")
-        print("Lookup Table:")
-        for i, row in enumerate(self.lookup_table):
-            print(f"  Previous {i}: {row}")
+        if verbose:
+            print("Random Number Generator Simulation initialized")
+            print("Lookup Table:")
+            for i, row in enumerate(self.lookup_table):
+                print(f"  Previous {i}: {row}")
 
     def generate_random_number(self) -> int:
         """
         Arduino 코드의 generateRandomNumber() 함수 시뮬레이션
-        정확한 타이밍과 메모리 사용량 반영
+        timing_mode에 따라 생성 시간 측정 (EVERY: 매번, SAMPLED: N회 중 1회)
         """
-        start_time = time.perf_counter()
+        self._timing_countdown -= 1
+        if self._timing_countdown:
+            return self._next_number()
+
+        self._timing_countdown = self._sample_interval
+        start_ns = time.perf_counter_ns()
+        result = self._next_number()
+        elapsed_ns = time.perf_counter_ns() - start_ns - self.timer_overhead_ns
+        self.stats.generation_latency.record_ns(elapsed_ns)
+        return result
 
+    def _next_number(self) -> int:
+        """숫자 하나 생성 및 통계 갱신 (시간 측정 없음)"""
         # Arduino random(0, 3) 함수 호출 시뮬레이션
         candidate = self.arduino.random_range(0, 3)
 
@@ -80,7 +163,7 @@ class RandomNumberGeneratorSim:
             result = self.lookup_table[self.previous_number][candidate]
 
         # 통계 업데이트
-        self._update_stats(result, candidate, start_time)
+        self._update_stats(result)
 
         # 상태 업데이트
         self.previous_number = result
@@ -88,24 +171,22 @@ class RandomNumberGeneratorSim:
 
         return result
 
-    def _update_stats(self, result: int, candidate: int, start_time: float):
+    def _update_stats(self, result: int):
         """통계 정보 업데이트"""
-        generation_time = time.perf_counter() - start_time
-
         self.stats.total_count += 1
         self.stats.number_frequency[result] += 1
-        self.stats.generation_times.append(generation_time)
 
-        # 전이 행렬 업데이트
+        # 전이 행렬 업데이트 및 제약 조건 위반 검사 (연속된 동일한 숫자)
         if self.previous_number != -1:
-            transition = f"{self.previous_number}->{result}"
-            self.stats.transition_matrix[transition] = (
-                self.stats.transition_matrix.get(transition, 0) + 1
-            )
+            self._update_transition(self.previous_number, result)
 
-            # 제약 조건 위반 검사 (연속된 동일한 숫자)
-            if self.previous_number == result:
-                self.stats.constraint_violations += 1
+    def _update_transition(self, previous: int, result: int):
+        transition = f"{previous}->{result}"
+        self.stats.transition_matrix[transition] = (
+            self.stats.transition_matrix.get(transition, 0) + 1
+        )
+        if previous == result:
+            self.stats.constraint_violations += 1
 
     def simulate_arduino_setup(self):
         """Arduino setup() 함수 시뮬레이션"""
@@ -152,90 +233,316 @@ class RandomNumberGeneratorSim:
         return generated_numbers
 
     def run_batch_simulation(
-        self, iterations: int = 10000, show_progress: bool = True
+        self,
+        iterations: int = 10000,
+        show_progress: bool = True,
+        engine: str = "scalar",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        checkpoint_every: int = 0,
+        resume_from: Optional[Union[str, Path, Dict[str, Any]]] = None,
+        checkpoint_metadata: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         대량 시뮬레이션 실행 (10,000회)
         Arduino 하드웨어 특성을 반영한 정확한 시뮬레이션
-        """
-        print(f"\n=== Batch Simulation ({iterations:,} iterations) ===")
-
-        # 성능 카운터 리셋
-        self.arduino.reset_performance_counters()
-        batch_start_time = time.time()
-
-        generated_numbers = []
-
-        for i in range(iterations):
-            number = self.generate_random_number()
-            generated_numbers.append(number)
+        engine="numpy"는 후보값을 청크 단위로 뽑아 룩업 체인을 한 번에 계산
+        (같은 시드/백엔드면 분포, 전이, 위반 수, 카운터가 scalar와 동일)
 
-            # 진행률 표시
-            if show_progress and (i + 1) % (iterations // 10) == 0:
-                progress = ((i + 1) / iterations) * 100
+        checkpoint_path를 지정하면 checkpoint_every회마다, 그리고 종료 시 체크포인트 저장
+        resume_from(체크포인트 경로 또는 딕셔너리)이면 저장된 지점부터 iterations까지 실행
+        (iterations를 저장된 목표보다 크게 주면 연장, 결과는 한 번에 실행한 것과 동일)
+        """
+        if engine not in BATCH_ENGINES:
+            raise ValueError(f"Unknown batch engine '{engine}'")
+
+        if resume_from is not None:
+            state = self.restore_checkpoint(resume_from)
+            if iterations < state.done:
+                raise ValueError(
+                    f"Checkpoint already has {state.done:,} iterations "
+                    f"(requested {iterations:,})"
+                )
+            state.iterations = iterations
+            print(
+                f"\n=== Batch Simulation ({iterations:,} iterations, "
+                f"resumed at {state.done:,}) ==="
+            )
+        else:
+            print(f"\n=== Batch Simulation ({iterations:,} iterations) ===")
+            # 성능 카운터 리셋
+            self.arduino.reset_performance_counters()
+            state = BatchState(iterations=iterations)
+
+        batch_start_time = time.time() - state.elapsed_seconds
+        if engine == "numpy":
+            run_chunk = self._run_numpy_chunk
+        else:
+            run_chunk = self._run_scalar_chunk
+        next_report = state.done * 10 // iterations + 1 if iterations else 11
+
+        while state.done < iterations:
+            size = min(chunk_size, iterations - state.done)
+            if checkpoint_every:
+                size = min(size, checkpoint_every - state.done % checkpoint_every)
+            if show_progress:
+                # 10% 지점마다 진행률 표시
+                size = min(size, -(-next_report * iterations // 10) - state.done)
+
+            run_chunk(state, size)
+            state.done += size
+
+            if show_progress and state.done * 10 >= next_report * iterations:
+                next_report = state.done * 10 // iterations + 1
                 elapsed = time.time() - batch_start_time
-                rate = (i + 1) / elapsed if elapsed > 0 else 0
+                rate = state.done / elapsed if elapsed > 0 else 0
                 print(
-                    f"Progress: {progress:5.1f}% ({i+1:,}/{iterations:,}) - {rate:,.0f} gen/sec"
+                    f"Progress: {state.done / iterations * 100:5.1f}% "
+                    f"({state.done:,}/{iterations:,}) - {rate:,.0f} gen/sec"
                 )
 
+            if (
+                checkpoint_path
+                and checkpoint_every
+                and state.done % checkpoint_every == 0
+                and state.done < iterations
+            ):
+                state.elapsed_seconds = time.time() - batch_start_time
+                self.save_checkpoint(state, checkpoint_path, checkpoint_metadata)
+
         batch_end_time = time.time()
+        if checkpoint_path:
+            # 최종 체크포인트 (나중에 반복 수를 늘려 이어 실행할 때 사용)
+            state.elapsed_seconds = batch_end_time - batch_start_time
+            self.save_checkpoint(state, checkpoint_path, checkpoint_metadata)
 
         # 결과 분석
-        analysis_results = self._analyze_results(
-            generated_numbers, batch_start_time, batch_end_time
+        return self._build_results(
+            state.counts, state.sample, batch_start_time, batch_end_time
         )
 
+    def _run_scalar_chunk(self, state: BatchState, size: int):
+        """Arduino 코드와 같은 순서로 한 개씩 생성한 뒤 구간 단위로 집계"""
+        values = self._generate_scalar_chunk(size)
+        state.counts.update(values)
+        if len(state.sample) < 50:
+            state.sample.extend(values[: 50 - len(state.sample)].tolist())
+
+    def _generate_scalar_chunk(self, size: int) -> np.ndarray:
+        """한 개씩 생성한 청크 (BLOCK 모드는 timing_interval개 묶음 단위로 측정)"""
+        if self.timing_mode is not TimingMode.BLOCK:
+            generate = self.generate_random_number
+            return np.array([generate() for _ in range(size)], dtype=np.uint8)
+
+        generate = self._next_number
+        values: List[int] = []
+        for start in range(0, size, self.timing_interval):
+            block = min(self.timing_interval, size - start)
+            start_ns = time.perf_counter_ns()
+            block_values = [generate() for _ in range(block)]
+            self._record_block(time.perf_counter_ns() - start_ns, block)
+            values.extend(block_values)
+        return np.array(values, dtype=np.uint8)
+
+    def _record_block(self, elapsed_ns: int, count: int):
+        """묶음 측정값을 1회 평균으로 count번 기록 (타이머 오버헤드 1회분 제외)"""
+        if self.timing_mode is TimingMode.OFF:
+            return
+        per_generation = max(0, elapsed_ns - self.timer_overhead_ns) / count
+        self.stats.generation_latency.record_ns(per_generation, count)
+
+    def save_checkpoint(
+        self,
+        state: BatchState,
+        path: Union[str, Path],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """대량 시뮬레이션 체크포인트 저장"""
+        return save_checkpoint(
+            {
+                "iterations": state.iterations,
+                "done": state.done,
+                "elapsed_seconds": state.elapsed_seconds,
+                "counts": state.counts.to_state(),
+                "sample_sequence": state.sample,
+                "previous_number": self.previous_number,
+                "generation_count": self.generation_count,
+                "stats": self.stats.to_state(),
+                "arduino": self.arduino.get_checkpoint_state(),
+                "metadata": metadata or {},
+                "saved_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            },
+            path,
+        )
+
+    def restore_checkpoint(
+        self, checkpoint: Union[str, Path, Dict[str, Any]]
+    ) -> BatchState:
+        """체크포인트의 시뮬레이터/Mock 상태 복원 후 BatchState 반환"""
+        if not isinstance(checkpoint, dict):
+            checkpoint = load_checkpoint(checkpoint)
+
+        self.arduino.set_checkpoint_state(checkpoint["arduino"])
+        self.previous_number = checkpoint["previous_number"]
+        self.generation_count = checkpoint["generation_count"]
+        self.stats = GenerationStats.from_state(checkpoint["stats"])
+
+        return BatchState(
+            iterations=checkpoint["iterations"],
+            done=checkpoint["done"],
+            counts=SequenceCounts.from_state(checkpoint["counts"]),
+            sample=list(checkpoint["sample_sequence"]),
+            elapsed_seconds=checkpoint["elapsed_seconds"],
+        )
+
+    def run_timer_driven_simulation(
+        self, rate_hz: int = 1000, duration_ms: int = 1000
+    ) -> Dict[str, Any]:
+        """
+        타이머 ISR에서 숫자를 생성하는 시뮬레이션
+        loop()는 delay()로 대기하고, 생성은 rate_hz 주기의 타이머 인터럽트가 담당
+        (가상 클럭에서는 실제 대기 없이 실행)
+        """
+        print(f"\n=== Timer-Driven Simulation ({rate_hz:,} Hz, {duration_ms:,} ms) ===")
+
+        self.arduino.reset_performance_counters()
+        batch_start_time = time.time()
+
+        generated_numbers = TritSequence()  # 바이트당 5개 압축 저장
+
+        def on_timer():
+            generated_numbers.append(self.generate_random_number())
+
+        timer_id = self.arduino.attachTimerInterrupt(1_000_000 / rate_hz, on_timer)
+        self.arduino.delay(duration_ms)
+        self.arduino.detachTimerInterrupt(timer_id)
+
+        analysis_results = self._analyze_results(
+            generated_numbers, batch_start_time, time.time()
+        )
+        analysis_results["interrupt_analysis"] = self.arduino.get_interrupt_stats()
         return analysis_results
 
+    def _run_numpy_chunk(self, state: BatchState, size: int):
+        """NumPy 청크 하나 생성 후 이번 실행 집계에 합침"""
+        results, chunk = self._generate_numpy_chunk(size)
+        state.counts.merge(chunk)  # 이번 실행 집계 (실행 간 경계 전이는 제외)
+        if len(state.sample) < 50:
+            state.sample.extend(results[: 50 - len(state.sample)].tolist())
+
+    def _generate_numpy_chunk(self, size: int) -> Tuple[np.ndarray, SequenceCounts]:
+        """NumPy 청크 엔진 (생성 시간은 청크 시간을 숫자 수로 나눈 값으로 기록)"""
+        start_ns = time.perf_counter_ns()
+
+        candidates = self.arduino.random_range_batch(0, 3, size)
+        results = resolve_lookup_chain(
+            candidates, self.lookup_table, self.previous_number
+        )
+
+        chunk = analyze_sequence(results)
+        if self.previous_number != -1:
+            # GenerationStats는 실행 간 경계 전이도 포함 (scalar 경로와 동일)
+            self._update_transition(self.previous_number, chunk.first)
+        self._update_chunk_stats(chunk)
+
+        self.previous_number = chunk.last
+        self.generation_count += size
+        self._record_block(time.perf_counter_ns() - start_ns, size)
+        return results, chunk
+
+    def iter_chunks(
+        self,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        iterations: Optional[int] = None,
+        engine: str = "scalar",
+    ) -> Iterator[np.ndarray]:
+        """
+        생성한 숫자를 chunk_size개씩 uint8 배열로 지연 생성 (iterations=None이면 무한)
+        GenerationStats와 Mock 카운터는 run_batch_simulation()과 똑같이 누적된다.
+        """
+        if engine not in BATCH_ENGINES:
+            raise ValueError(f"Unknown batch engine '{engine}'")
+
+        remaining = iterations
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            if engine == "numpy":
+                yield self._generate_numpy_chunk(size)[0]
+            else:
+                yield self._generate_scalar_chunk(size)
+            if remaining is not None:
+                remaining -= size
+
+    def iter_numbers(
+        self,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        iterations: Optional[int] = None,
+        engine: str = "scalar",
+    ) -> Iterator[int]:
+        """iter_chunks()를 숫자 하나씩 yield"""
+        return iter_numbers_from_chunks(
+            self.iter_chunks(chunk_size, iterations, engine)
+        )
+
+    def _update_chunk_stats(self, chunk: SequenceCounts):
+        """청크 하나의 GenerationStats 누적 (경계 전이는 호출 측에서 처리)"""
+        self.stats.total_count += chunk.total
+        for number, count in chunk.distribution_dict().items():
+            self.stats.number_frequency[number] += count
+        for transition, count in chunk.transition_dict().items():
+            self.stats.transition_matrix[transition] = (
+                self.stats.transition_matrix.get(transition, 0) + count
+            )
+        self.stats.constraint_violations += chunk.violations
+
     def _analyze_results(
-        self, generated_numbers: List[int], start_time: float, end_time: float
+        self,
+        generated_numbers: Union[List[int], TritSequence],
+        start_time: float,
+        end_time: float,
+    ) -> Dict[str, Any]:
+        """시뮬레이션 결과 분석 (분포/전이/위반 수를 한 번에 집계)"""
+        return self._build_results(
+            analyze_sequence(generated_numbers),
+            list(generated_numbers[:50]),
+            start_time,
+            end_time,
+        )
+
+    def _build_results(
+        self,
+        counts: SequenceCounts,
+        sample_sequence: List[int],
+        start_time: float,
+        end_time: float,
     ) -> Dict[str, Any]:
-        """시뮬레이션 결과 분석"""
+        """집계값으로 결과 딕셔너리 구성"""
         total_time = end_time - start_time
         arduino_stats = self.arduino.get_performance_stats()
 
         # 기본 통계
-        total_count = len(generated_numbers)
+        total_count = counts.total
         generation_rate = total_count / total_time if total_time > 0 else 0
 
-        # 분포 분석
-        distribution = {i: generated_numbers.count(i) for i in range(3)}
+        # 분포, 제약 조건, 전이
+        distribution = counts.distribution_dict()
+        consecutive_violations = counts.violations
+        transitions = counts.transition_dict()
+
         distribution_percentages = {
             i: (count / total_count) * 100 if total_count > 0 else 0
             for i, count in distribution.items()
         }
 
-        # 제약 조건 검증
-        consecutive_violations = 0
-        for i in range(1, len(generated_numbers)):
-            if generated_numbers[i] == generated_numbers[i - 1]:
-                consecutive_violations += 1
-
-        # 전이 분석
-        transitions = {}
-        for i in range(1, len(generated_numbers)):
-            prev_num = generated_numbers[i - 1]
-            curr_num = generated_numbers[i]
-            transition = f"{prev_num}->{curr_num}"
-            transitions[transition] = transitions.get(transition, 0) + 1
-
-        # 통계적 분석
-        if self.stats.generation_times:
-            avg_generation_time = sum(self.stats.generation_times) / len(
-                self.stats.generation_times
-            )
-            min_generation_time = min(self.stats.generation_times)
-            max_generation_time = max(self.stats.generation_times)
-        else:
-            avg_generation_time = min_generation_time = max_generation_time = 0
+        # 생성 시간 분포 (마이크로초, 히스토그램 기반 백분위)
+        latency = self.stats.generation_latency.summary_us()
 
         return {
             "simulation_info": {
                 "total_iterations": total_count,
                 "total_time_seconds": total_time,
                 "generation_rate_per_second": generation_rate,
-                "arduino_board": "Uno R4 WiFi",
+                "arduino_board": self.arduino.specs.board_name,
                 "simulation_timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             },
             "distribution_analysis": {
@@ -258,33 +565,47 @@ class RandomNumberGeneratorSim:
                 "expected_transitions": 6,  # 3x3 - 3 (대각선 제외)
             },
             "performance_metrics": {
-                "avg_generation_time_microseconds": avg_generation_time * 1_000_000,
-                "min_generation_time_microseconds": min_generation_time * 1_000_000,
-                "max_generation_time_microseconds": max_generation_time * 1_000_000,
+                "avg_generation_time_microseconds": latency["mean"],
+                "min_generation_time_microseconds": latency["min"],
+                "p50_generation_time_microseconds": latency["p50"],
+                "p90_generation_time_microseconds": latency["p90"],
+                "p99_generation_time_microseconds": latency["p99"],
+                "p99_9_generation_time_microseconds": latency["p99.9"],
+                "max_generation_time_microseconds": latency["max"],
+                "timing_mode": self.timing_mode.value,
+                "timing_interval": self.timing_interval,
+                "timed_samples": latency["count"],
+                "timer_overhead_ns": self.timer_overhead_ns,
                 "arduino_instruction_count": arduino_stats["instruction_count"],
                 "arduino_function_calls": arduino_stats["function_calls"],
                 "sram_usage_percent": arduino_stats["sram_usage_percent"],
             },
+            "latency_histogram": self.stats.generation_latency.to_state(),
             "hardware_simulation": {
                 "clock_speed_mhz": arduino_stats["clock_speed_hz"] / 1_000_000,
                 "free_memory_bytes": arduino_stats["free_memory_bytes"],
                 "random_seed": arduino_stats["random_seed"],
             },
-            "sample_sequence": (
-                generated_numbers[:50]
-                if len(generated_numbers) >= 50
-                else generated_numbers
-            ),
+            "sample_sequence": sample_sequence,
         }
 
-    def save_results(self, results: Dict[str, Any], filename: str = None):
-        """결과를 JSON 파일로 저장"""
+    def save_results(
+        self,
+        results: Dict[str, Any],
+        filename: str = None,
+        results_format: str = "json",
+    ):
+        """결과를 JSON 또는 npz(열 배열) 파일로 저장 (results_format: json/npz/both)"""
         if filename is None:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"src/results/simulation_results_{timestamp}.json"
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        if results_format == "json":
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+        else:
+            stem = Path(filename).with_suffix("")
+            filename = ", ".join(save_results_file(results, stem, results_format))
 
         print(f"Results saved to: {filename}")
         return filename
@@ -303,16 +624,36 @@ class RandomNumberGeneratorSim:
 
 def create_simulation(
     seed: Optional[int] = None,
+    clock_mode: ClockMode = ClockMode.REALTIME,
+    time_dilation: float = 0.0,
+    rng_backend: str = "mt19937",
+    instrumentation: str = "full",
+    serial_sink: str = "console",
+    timing_mode: Union[str, TimingMode] = TimingMode.EVERY,
+    timing_interval: int = DEFAULT_TIMING_INTERVAL,
 ) -> Tuple[ArduinoUnoR4WiFiMock, RandomNumberGeneratorSim]:
     """시뮬레이션 환경 생성 편의 함수"""
-    arduino_mock = ArduinoUnoR4WiFiMock(seed=seed)
-    simulator = RandomNumberGeneratorSim(arduino_mock)
+    arduino_mock = ArduinoUnoR4WiFiMock(
+        seed=seed,
+        clock_mode=clock_mode,
+        time_dilation=time_dilation,
+        rng_backend=rng_backend,
+        instrumentation=instrumentation,
+        serial_sink=serial_sink,
+    )
+    simulator = RandomNumberGeneratorSim(
+        arduino_mock, timing_mode=timing_mode, timing_interval=timing_interval
+    )
     return arduino_mock, simulator
 
 
-def run_quick_test(seed: int = 12345, iterations: int = 20) -> Dict[str, Any]:
-    """빠른 테스트 실행"""
-    arduino, simulator = create_simulation(seed=seed)
+def run_quick_test(
+    seed: int = 12345,
+    iterations: int = 20,
+    clock_mode: ClockMode = ClockMode.VIRTUAL,
+) -> Dict[str, Any]:
+    """빠른 테스트 실행 (기본: 가상 클럭으로 delay() 없이 실행)"""
+    arduino, simulator = create_simulation(seed=seed, clock_mode=clock_mode)
 
     # Arduino setup 시뮬레이션
     simulator.simulate_arduino_setup()
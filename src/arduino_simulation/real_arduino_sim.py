@@ -10,17 +10,86 @@ Real Arduino Implementation Simulator
 """
 
 import os
-import random
 import time
-from typing import Any, Dict
-
-from arduino_mock import ArduinoUnoR4WiFiMock
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import yaml
+from arduino_mock import ArduinoUnoR4WiFiMock, InstrumentationLevel, MockPool
+from board_profiles import BOARD_PROFILES
+from multi_implementation_sim import GENERATION_METHODS as SIMPLE_GENERATION_METHODS
+from multi_implementation_sim import ImplementationGenerator, print_board_matrix
+from retry_engine import RetryEngine, expected_draws, iter_retry_chunks
+from sequence_analysis import SequenceCounts
+from streaming import (
+    DEFAULT_STREAM_CHUNK_SIZE,
+    iter_generated_chunks,
+    iter_numbers_from_chunks,
+)
+
+# 구현별 기본 연산 프로필 (config/cycle_costs.yaml의 operations 키)
+# (매 호출 실행되는 연산, 이전 값과 충돌했을 때 추가로 실행되는 연산)
+# random() 호출 비용은 Mock이 별도로 청구한다.
+_OPERATION_PROFILES = {
+    "recursive": (
+        ["function_call", "compare", "branch", "assign", "return"],
+        ["function_call", "compare", "branch", "return"],  # 재귀 호출 1회
+    ),
+    "array_based": (
+        ["function_call", "table_load", "compare", "branch", "assign", "return"],
+        ["add", "modulo", "table_load"],
+    ),
+    "switch_based": (
+        ["function_call", "table_load", "branch", "compare", "branch", "assign"]
+        + ["return"],
+        ["assign"],
+    ),
+    "function_pointer": (
+        ["function_call", "table_load", "function_pointer_call", "compare"]
+        + ["branch", "return", "assign", "return"],
+        [],
+    ),
+    "ternary_based": (
+        ["function_call", "compare", "branch", "assign", "return"],
+        ["add", "modulo"],
+    ),
+    "lambda_based": (
+        ["function_call", "function_call", "compare", "branch", "return"]
+        + ["assign", "return"],
+        ["add", "modulo", "assign"],
+    ),
+    "static_based": (
+        ["function_call", "compare", "branch", "assign", "return"],
+        ["add", "modulo", "assign"],
+    ),
+    "bitwise_based": (
+        ["function_call", "xor", "compare", "branch", "assign", "return"],
+        ["add", "modulo", "assign"],
+    ),
+}
+
+# 구현별 생성 메서드 (알 수 없는 타입은 삼항 연산자 방식)
+GENERATION_METHODS = {
+    "recursive": "_recursive_method",
+    "array_based": "_array_conditional_method",
+    "switch_based": "_switch_case_method",
+    "function_pointer": "_function_pointer_method",
+    "ternary_based": "_ternary_formula_method",
+    "lambda_based": "_lambda_function_method",
+    "static_based": "_static_variable_method",
+    "bitwise_based": "_bitwise_operation_method",
+}
 
 
 class RealArduinoImplementationGenerator:
     """실제 Arduino 구현 방식을 시뮬레이션하는 생성기"""
 
-    def __init__(self, impl_config: Dict[str, Any], arduino: ArduinoUnoR4WiFiMock):
+    def __init__(
+        self,
+        impl_config: Dict[str, Any],
+        arduino: ArduinoUnoR4WiFiMock,
+        verbose: bool = True,
+    ):
         self.config = impl_config
         self.arduino = arduino
         self.type = impl_config.get("type", "unknown")
@@ -28,8 +97,33 @@ class RealArduinoImplementationGenerator:
 
         # 각 구현별 상태 변수 초기화
         self.prev_num = -1
-        self.recursion_depth = 0
-        self.max_recursion_depth = 100  # 재귀 깊이 제한
+        self.recursion_depth = 0  # 마지막 호출의 재귀(충돌) 횟수
+        self.max_recursion_depth = 100  # 재귀 깊이 제한 (최대 추첨 수)
+        self.retry_engine = RetryEngine(self.max_recursion_depth)
+
+        # 연산 비용은 생성기 생성 시 한 번만 합산 (알 수 없는 타입은 삼항 방식)
+        base_ops, collision_ops = _OPERATION_PROFILES.get(
+            self.type, _OPERATION_PROFILES["ternary_based"]
+        )
+        self._base_cycles = arduino.costs.sum_operations(base_ops)
+        self._collision_cycles = arduino.costs.sum_operations(collision_ops)
+
+        # 생성 메서드도 한 번만 찾아 바인딩 (호출마다 타입 문자열 비교 없음)
+        self._generate = getattr(
+            self, GENERATION_METHODS.get(self.type, "_ternary_formula_method")
+        )
+
+        # 전역/static 변수 SRAM 점유 (prevNum + 함수 포인터 테이블)
+        self.sram_bytes = arduino.specs.int_size
+        if self.type == "function_pointer":
+            self.sram_bytes += 3 * arduino.specs.pointer_size
+        arduino.allocate_sram(self.sram_bytes)
+
+        # 호출 1회 스택 프레임 (기본 프레임 + int 지역 변수 1개, 설정으로 변경 가능)
+        self.frame_bytes = impl_config.get(
+            "stack_frame_bytes",
+            arduino.specs.call_frame_bytes + arduino.specs.int_size,
+        )
 
         # 함수 포인터 시뮬레이션용
         if self.type == "function_pointer":
@@ -39,38 +133,78 @@ class RealArduinoImplementationGenerator:
                 2: self._get_num_2,
             }
 
-        print(f"Real Arduino Implementation: {impl_config['name']} initialized")
+        if verbose:
+            print(f"Real Arduino Implementation: {impl_config['name']} initialized")
 
     def generate_number(self, previous: int = None) -> int:
         """구현 타입에 따른 실제 Arduino 로직 시뮬레이션"""
         if previous is not None:
             self.prev_num = previous
 
-        try:
-            if self.type == "recursive":
-                return self._recursive_method()
-            elif self.type == "array_based":
-                return self._array_conditional_method()
-            elif self.type == "switch_based":
-                return self._switch_case_method()
-            elif self.type == "function_pointer":
-                return self._function_pointer_method()
-            elif self.type == "ternary_based":
-                return self._ternary_formula_method()
-            elif self.type == "lambda_based":
-                return self._lambda_function_method()
-            elif self.type == "static_based":
-                return self._static_variable_method()
-            elif self.type == "bitwise_based":
-                return self._bitwise_operation_method()
-            else:
-                # 기본값으로 삼항 연산자 방식 사용
-                return self._ternary_formula_method()
+        self.arduino.charge_cycles(self._base_cycles)
 
+        # getRandomNum() 호출 프레임 (재귀/람다 호출은 각 메서드에서 추가)
+        # 예외(ISR 콜백 등)가 나도 폴백을 반환하고 프레임을 맞춰야 하므로 try 유지
+        # (예외가 없으면 try 비용은 측정 잡음 이하)
+        self.arduino.push_stack_frame(self.frame_bytes)
+        try:
+            return self._generate()
         except Exception as e:
             print(f"Error in {self.impl_id}: {e}")
             # 안전한 기본값 반환
             return self._safe_fallback()
+        finally:
+            self.arduino.pop_stack_frame(self.frame_bytes)
+            self.arduino.end_stack_sample()
+
+    def iter_chunks(
+        self,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        iterations: Optional[int] = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        생성한 숫자를 chunk_size개씩 uint8 배열로 지연 생성 (iterations=None이면 무한)
+        현재 prev_num에서 이어서 생성
+        재귀 방식은 RetryEngine 배치 경로
+        (타이머 등 예약 이벤트가 있으면 제때 실행되도록 숫자 단위 경로 유지)
+        """
+        if self._generate == self._recursive_method and not len(self.arduino.scheduler):
+            return self._iter_recursive_chunks(chunk_size, iterations)
+        return iter_generated_chunks(
+            self.generate_number, chunk_size, iterations, self.prev_num
+        )
+
+    def _iter_recursive_chunks(
+        self, chunk_size: int, iterations: Optional[int]
+    ) -> Iterator[np.ndarray]:
+        """재귀 방식 배치 생성: random()을 한 번에 뽑아 resolve_batch()로 출력 결정"""
+        for chunk in iter_retry_chunks(
+            self.retry_engine,
+            lambda n: self.arduino.random_range_batch(0, 3, n),
+            chunk_size,
+            iterations,
+            self.prev_num,
+            on_batch=self._charge_recursive_batch,
+        ):
+            self.prev_num = int(chunk[-1])
+            yield chunk
+
+    def _charge_recursive_batch(self, outputs: np.ndarray, collisions: np.ndarray):
+        """출력마다 generate_number() 1회 + 충돌마다 재귀 호출 1회의 비용과 스택 기록"""
+        self.arduino.charge_cycles(
+            self._base_cycles * outputs.size
+            + self._collision_cycles * int(collisions.sum())
+        )
+        self.arduino.record_stack_samples(collisions + 1, self.frame_bytes)
+        self.recursion_depth = int(collisions[-1])
+
+    def iter_numbers(
+        self,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        iterations: Optional[int] = None,
+    ) -> Iterator[int]:
+        """iter_chunks()를 숫자 하나씩 yield"""
+        return iter_numbers_from_chunks(self.iter_chunks(chunk_size, iterations))
 
     def _recursive_method(self) -> int:
         """
@@ -83,25 +217,33 @@ class RealArduinoImplementationGenerator:
           prevNum1 = num;
           return num;
         }
+        재귀 대신 RetryEngine으로 반복하고, 충돌(재귀 호출)마다 비용과 프레임을 청구
         """
-        self.recursion_depth += 1
+        self.recursion_depth = 0
+        try:
+            num = self.retry_engine.draw(
+                self._draw_candidate, self.prev_num, self._charge_recursive_call
+            )
+        finally:
+            for _ in range(self.recursion_depth):
+                self.arduino.pop_stack_frame(self.frame_bytes)
 
-        # 무한 재귀 방지
-        if self.recursion_depth > self.max_recursion_depth:
-            self.recursion_depth = 0
+        if num is None:
+            # 재귀 깊이 제한 초과 (폴백은 retry_engine.stats.fallbacks에 집계)
             return (self.prev_num + 1) % 3
-
-        # Arduino random(0, 3) 시뮬레이션
-        num = self.arduino.random_range(0, 3)
-
-        # 재귀 조건 검사
-        if num == self.prev_num:
-            return self._recursive_method()  # 재귀 호출
-
         self.prev_num = num
-        self.recursion_depth = 0
         return num
 
+    def _draw_candidate(self) -> int:
+        """Arduino random(0, 3)"""
+        return self.arduino.random_range(0, 3)
+
+    def _charge_recursive_call(self):
+        """재귀 호출 1회 (충돌 비용 + 스택 프레임)"""
+        self.recursion_depth += 1
+        self.arduino.charge_cycles(self._collision_cycles)
+        self.arduino.push_stack_frame(self.frame_bytes)
+
     def _array_conditional_method(self) -> int:
         """
         배열과 조건문 방식
@@ -124,6 +266,7 @@ class RealArduinoImplementationGenerator:
 
         # 조건문 검사
         if num == self.prev_num:
+            self.arduino.charge_cycles(self._collision_cycles)
             idx = (idx + 1) % 3
             num = nums[idx]
 
@@ -142,6 +285,8 @@ class RealArduinoImplementationGenerator:
         num = self.arduino.random_range(0, 3)
 
         # Switch 문 시뮬레이션
+        if num == self.prev_num:
+            self.arduino.charge_cycles(self._collision_cycles)
         if num == 0:
             if self.prev_num == 0:
                 num = 1
@@ -197,6 +342,8 @@ class RealArduinoImplementationGenerator:
         num = self.arduino.random_range(0, 3)
 
         # 삼항 연산자 시뮬레이션
+        if num == self.prev_num:
+            self.arduino.charge_cycles(self._collision_cycles)
         num = ((num + 1) % 3) if (num == self.prev_num) else num
 
         self.prev_num = num
@@ -217,10 +364,13 @@ class RealArduinoImplementationGenerator:
         def pick(prev):
             n = self.arduino.random_range(0, 3)
             if n == prev:
+                self.arduino.charge_cycles(self._collision_cycles)
                 n = (n + 2) % 3
             return n
 
+        self.arduino.push_stack_frame(self.frame_bytes)
         num = pick(self.prev_num)
+        self.arduino.pop_stack_frame(self.frame_bytes)
         self.prev_num = num
         return num
 
@@ -240,6 +390,7 @@ class RealArduinoImplementationGenerator:
         num = self.arduino.random_range(0, 3)
 
         if num == self.prev_num:
+            self.arduino.charge_cycles(self._collision_cycles)
             num = (num + 2) % 3
 
         self.prev_num = num
@@ -260,6 +411,7 @@ class RealArduinoImplementationGenerator:
 
         # XOR 비트 연산 시뮬레이션
         if (num ^ self.prev_num) == 0:  # 같은 숫자면 XOR 결과가 0
+            self.arduino.charge_cycles(self._collision_cycles)
             num = (num + 1) % 3
 
         self.prev_num = num
@@ -272,7 +424,7 @@ class RealArduinoImplementationGenerator:
             candidates.remove(self.prev_num)
 
         if candidates:
-            return random.choice(candidates)
+            return candidates[self.arduino.rng.random_range(0, len(candidates))]
         else:
             return 0
 
@@ -283,6 +435,9 @@ class RealArduinoImplementationGenerator:
             "implementation_name": self.config.get("name", "Unknown"),
             "type": self.type,
             "recursion_depth_used": self.recursion_depth,
+            "retry_draws": (
+                self.retry_engine.stats.to_dict() if self.type == "recursive" else None
+            ),
             "expected_performance": self.config.get("expected_performance", "unknown"),
             "expected_memory": self.config.get("memory_usage", "unknown"),
             "constraint_compliance": self.config.get(
@@ -290,16 +445,14 @@ class RealArduinoImplementationGenerator:
             ),
             "arduino_code_lines": len(self.config.get("arduino_code", "").split("\n")),
             "cpp_version": self.config.get("cpp_version", "C++98"),
+            "base_cycles": self._base_cycles,
+            "collision_cycles": self._collision_cycles,
+            "stack_frame_bytes": self.frame_bytes,
         }
 
 
-def test_real_arduino_implementations():
-    """실제 Arduino 구현들 테스트"""
-    import yaml
-
-    print("=== Real Arduino Implementations Test ===")
-
-    # YAML 설정 로드
+def _load_real_implementations() -> Optional[List[Dict[str, Any]]]:
+    """arduino_implementations_real.yaml 구현 목록 로드 (없으면 None)"""
     try:
         # 설정 파일 경로 (프로젝트 루트의 config 폴더)
         config_path = os.path.join(
@@ -314,9 +467,194 @@ def test_real_arduino_implementations():
     except FileNotFoundError:
         print("❌ arduino_implementations_real.yaml not found")
         print(f"Expected path: {config_path}")
-        return
+        return None
+
+    return config.get("implementations", [])
+
+
+def sweep_real_implementations_across_boards(
+    boards: List[str] = None, iterations: int = 1000, seed: int = 12345
+) -> Dict[str, Any]:
+    """
+    실제 Arduino 구현들을 여러 보드에서 실행하여
+    보드별 예측 처리량(gen/sec)과 최대 SRAM 사용량(전역 변수 + 콜 스택) 매트릭스 생성
+    """
+    implementations = _load_real_implementations()
+    if implementations is None:
+        return {}
+    boards = boards or list(BOARD_PROFILES)
+
+    print("=== Real Arduino Implementations Board Sweep ===")
+    print(f"Boards: {', '.join(boards)}")
 
-    implementations = config.get("implementations", [])
+    # 보드별 Mock은 풀에서 재사용 (구현마다 조용히 초기화)
+    pool = MockPool(rng_backend="board")
+    matrix = {}
+    for impl in implementations:
+        if not impl.get("enabled", True):
+            continue
+        row = matrix.setdefault(impl["name"], {})
+
+        for board in boards:
+            with pool.mock(seed, board=board) as arduino:
+                generator = RealArduinoImplementationGenerator(
+                    impl, arduino, verbose=False
+                )
+
+                counts = SequenceCounts()
+                for chunk in generator.iter_chunks(iterations=iterations):
+                    counts.update(chunk)
+
+                perf_stats = arduino.get_performance_stats()
+                stack = perf_stats["stack"]
+                cycles_per_generation = perf_stats["instruction_count"] / iterations
+                sram_bytes = arduino.specs.sram_bytes
+                row[board] = {
+                    "success": True,
+                    "predicted_device_rate": (
+                        perf_stats["clock_speed_hz"] / cycles_per_generation
+                        if cycles_per_generation > 0
+                        else 0
+                    ),
+                    "cycles_per_generation": cycles_per_generation,
+                    "sram_usage_bytes": perf_stats["sram_usage_bytes"],
+                    "sram_usage_percent": perf_stats["sram_usage_percent"],
+                    "peak_sram_bytes": stack["peak_sram_bytes"],
+                    "max_stack_depth": stack["max_depth"],
+                    "stack_overflows": stack["overflows"],
+                    "fits_in_sram": stack["peak_sram_bytes"] <= sram_bytes,
+                    "constraint_violations": counts.violations,
+                }
+
+    print_board_matrix(matrix, boards)
+    return {"boards": boards, "iterations": iterations, "matrix": matrix}
+
+
+def make_legacy_dispatch(
+    generator: Any, methods: Dict[str, str], default: str
+) -> Callable[..., int]:
+    """
+    이전 if/elif 디스패치 재현 (benchmark_dispatch 비교용)
+    호출마다 generator.type을 methods 등록 순서대로 문자열 비교, 없으면 default
+    """
+    chain = [(name, getattr(generator, method)) for name, method in methods.items()]
+    fallback = getattr(generator, default)
+
+    def generate(*args):
+        for type_name, method in chain:
+            if generator.type == type_name:
+                return method(*args)
+        return fallback(*args)
+
+    return generate
+
+
+def _time_generate(generators: List[Any], iterations: int, repeat: int) -> List[float]:
+    """
+    생성기별 generate_number() 1회 평균 시간 (ns, repeat회 측정 중 최솟값)
+    생성기를 번갈아 측정해 측정 중 부하 변화가 한쪽에만 몰리지 않게 한다.
+    """
+    best = [float("inf")] * len(generators)
+    for _ in range(repeat):
+        for i, generator in enumerate(generators):
+            generate = generator.generate_number
+            previous = -1
+            start = time.perf_counter_ns()
+            for _ in range(iterations):
+                previous = generate(previous)
+            best[i] = min(best[i], time.perf_counter_ns() - start)
+    return [elapsed / iterations for elapsed in best]
+
+
+def benchmark_dispatch(
+    iterations: int = 20000, repeat: int = 5
+) -> List[Dict[str, Any]]:
+    """
+    구현 타입별 generate_number() 1회 시간을 사전 바인딩 디스패치와
+    이전 if/elif 타입 비교 디스패치(make_legacy_dispatch)로 각각 측정해 비교
+    """
+    config_dir = os.path.join(os.path.dirname(__file__), "..", "..", "config")
+    with open(
+        os.path.join(config_dir, "arduino_implementations.yaml"), encoding="utf-8"
+    ) as f:
+        simple = yaml.safe_load(f).get("implementations", [])
+    real = _load_real_implementations() or []
+
+    print("=== Generation Dispatch Benchmark ===")
+    print(
+        f"{'Suite':<7} {'Type':<17} {'Bound (ns)':>11} {'If/elif (ns)':>13} "
+        f"{'Saved %':>8}"
+    )
+    print("-" * 60)
+
+    # suite별 생성기, 타입 -> 메서드 표, 알 수 없는 타입의 기본 메서드
+    suites = {
+        "simple": (
+            lambda impl, arduino: ImplementationGenerator(impl, arduino),
+            SIMPLE_GENERATION_METHODS,
+            "_lookup_table_method",
+        ),
+        "real": (
+            lambda impl, arduino: RealArduinoImplementationGenerator(
+                impl, arduino, verbose=False
+            ),
+            GENERATION_METHODS,
+            "_ternary_formula_method",
+        ),
+    }
+
+    rows = []
+    for suite, implementations in (("simple", simple), ("real", real)):
+        make_generator, methods, default = suites[suite]
+        seen = set()
+        for impl in implementations:
+            if impl["type"] in seen:
+                continue
+            seen.add(impl["type"])
+
+            # 같은 시드의 Mock 두 개에서 디스패치만 다르게 실행
+            generators = []
+            for legacy in (False, True):
+                arduino = ArduinoUnoR4WiFiMock(
+                    seed=12345,
+                    instrumentation=InstrumentationLevel.OFF,
+                    serial_sink="discard",
+                    verbose=False,
+                )
+                generator = make_generator(impl, arduino)
+                if legacy:
+                    generator._generate = make_legacy_dispatch(
+                        generator, methods, default
+                    )
+                generators.append(generator)
+
+            call_ns, legacy_ns = _time_generate(generators, iterations, repeat)
+            saved_ns = legacy_ns - call_ns  # 음수면 측정 잡음보다 작은 차이
+            row = {
+                "suite": suite,
+                "type": impl["type"],
+                "call_ns": call_ns,
+                "legacy_call_ns": legacy_ns,
+                "saved_ns": saved_ns,
+                "saved_percent": saved_ns / legacy_ns * 100,
+            }
+            rows.append(row)
+            print(
+                f"{suite:<7} {row['type']:<17} {call_ns:>11.0f} {legacy_ns:>13.0f} "
+                f"{row['saved_percent']:>7.1f}%"
+            )
+
+    return rows
+
+
+def test_real_arduino_implementations():
+    """실제 Arduino 구현들 테스트"""
+    print("=== Real Arduino Implementations Test ===")
+
+    # YAML 설정 로드
+    implementations = _load_real_implementations()
+    if implementations is None:
+        return
     test_iterations = 1000
 
     print(f"Testing {len(implementations)} real Arduino implementations")
@@ -360,6 +698,15 @@ def test_real_arduino_implementations():
                 test_iterations / execution_time if execution_time > 0 else 0
             )
 
+            # 비용 모델 기반 온디바이스 처리량 예측
+            perf_stats = arduino.get_performance_stats()
+            cycles_per_generation = perf_stats["instruction_count"] / test_iterations
+            predicted_device_rate = (
+                perf_stats["clock_speed_hz"] / cycles_per_generation
+                if cycles_per_generation > 0
+                else 0
+            )
+
             # 분포 분석
             distribution = {i: generated_numbers.count(i) for i in range(3)}
 
@@ -371,6 +718,9 @@ def test_real_arduino_implementations():
                 "violations": violations,
                 "distribution": distribution,
                 "execution_time": execution_time,
+                "cycles_per_generation": cycles_per_generation,
+                "predicted_device_rate": predicted_device_rate,
+                "stack": perf_stats["stack"],
                 "stats": generator.get_implementation_stats(),
             }
             results.append(result)
@@ -378,7 +728,25 @@ def test_real_arduino_implementations():
             print(
                 f"✅ Success: {generation_rate:,.0f} gen/sec, {violations} violations"
             )
+            print(
+                f"   Device estimate: {cycles_per_generation:.1f} cycles/gen, "
+                f"{predicted_device_rate:,.0f} gen/sec"
+                f" @ {perf_stats['clock_speed_hz']/1_000_000:.0f}MHz"
+            )
+            print(
+                f"   Stack: max depth {perf_stats['stack']['max_depth']}, "
+                f"peak SRAM {perf_stats['stack']['peak_sram_bytes']}B"
+            )
             print(f"   Distribution: {distribution}")
+            retry_draws = result["stats"]["retry_draws"]
+            if retry_draws:
+                expected = expected_draws(max_draws=generator.max_recursion_depth)
+                print(
+                    f"   RNG draws/number: mean {retry_draws['mean_draws']:.3f} "
+                    f"(expected {expected:.3f}), "
+                    f"p99 {retry_draws['p99_draws']}, "
+                    f"p99.9 {retry_draws['p999_draws']}, max {retry_draws['max_draws']}"
+                )
 
         except Exception as e:
             print(f"❌ Failed: {e}")
@@ -423,3 +791,4 @@ def test_real_arduino_implementations():
 
 if __name__ == "__main__":
     test_real_arduino_implementations()
+    benchmark_dispatch()
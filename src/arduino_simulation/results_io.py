@@ -0,0 +1,255 @@
+"""
+Results I/O
+시뮬레이션 결과를 들여쓰기 JSON 대신 NumPy npz(메타데이터 헤더 + 열 배열)로 저장/로드
+
+npz 파일 구성:
+- metadata: 열로 옮기지 않은 나머지 결과 (압축 JSON 바이트)
+- distribution (실행 수 x 3), transitions (실행 수 x 3 x 3), violations
+- sample_values / sample_offsets: 실행별 샘플 시퀀스를 이어 붙인 uint8 배열과 경계
+- latency_*: 실행별 지연 시간 히스토그램 (0이 아닌 버킷만, 경계 배열로 구분)
+
+통합 결과(individual_results)는 개별 실행을 열로 저장하므로 중복 없이 한 번만 들어간다.
+load_results()는 JSON과 같은 딕셔너리로 복원하고, load_result_columns()는 배열만 읽는다.
+"""
+
+import json
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+RESULTS_FORMAT_VERSION = 1
+RESULTS_FORMATS = ("json", "npz", "both")
+
+_LATENCY_FIELDS = ("count", "total_ns", "min_ns", "max_ns")
+
+
+def _transition_matrix(transitions: Dict[str, int]) -> np.ndarray:
+    """{"이전->현재": 횟수} -> 3x3 배열"""
+    matrix = np.zeros((3, 3), dtype=np.int64)
+    for transition, count in transitions.items():
+        prev, curr = transition.split("->")
+        matrix[int(prev), int(curr)] = count
+    return matrix
+
+
+def _split_run(result: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """실행 결과 하나를 (메타데이터, 열 값)으로 분리"""
+    metadata = json.loads(json.dumps(result, ensure_ascii=False))  # 깊은 복사
+    columns: Dict[str, Any] = {}
+
+    distribution = metadata.get("distribution_analysis", {})
+    if "counts" in distribution:
+        counts = distribution.pop("counts")
+        columns["distribution"] = [counts.get(str(i), 0) for i in range(3)]
+    transitions = metadata.get("transition_analysis", {})
+    if "transitions" in transitions:
+        columns["transitions"] = _transition_matrix(transitions.pop("transitions"))
+    if "sample_sequence" in metadata:
+        columns["sample_sequence"] = metadata.pop("sample_sequence")
+    if "latency_histogram" in metadata:
+        columns["latency_histogram"] = metadata.pop("latency_histogram")
+
+    metadata["_columns"] = sorted(columns)
+    return metadata, columns
+
+
+def _pack_runs(runs: List[Dict[str, Any]]) -> Tuple[List[Dict], Dict[str, np.ndarray]]:
+    """실행 목록을 실행별 메타데이터와 열 배열로 변환"""
+    metadata_list = []
+    distribution = np.zeros((len(runs), 3), dtype=np.int64)
+    transitions = np.zeros((len(runs), 3, 3), dtype=np.int64)
+    samples: List[np.ndarray] = []
+    latency_indices: List[np.ndarray] = []
+    latency_counts: List[np.ndarray] = []
+    latency_layout = np.zeros((len(runs), 2), dtype=np.int64)
+    latency_totals = np.full((len(runs), len(_LATENCY_FIELDS)), -1, dtype=np.int64)
+
+    for run, result in enumerate(runs):
+        metadata, columns = _split_run(result)
+        metadata_list.append(metadata)
+
+        if "distribution" in columns:
+            distribution[run] = columns["distribution"]
+        if "transitions" in columns:
+            transitions[run] = columns["transitions"]
+        samples.append(np.asarray(columns.get("sample_sequence", []), dtype=np.uint8))
+
+        state = columns.get("latency_histogram")
+        if state is None:
+            latency_indices.append(np.empty(0, dtype=np.int32))
+            latency_counts.append(np.empty(0, dtype=np.int64))
+            continue
+        buckets = np.asarray(state["buckets"], dtype=np.int64).reshape(-1, 2)
+        latency_indices.append(buckets[:, 0].astype(np.int32))
+        latency_counts.append(buckets[:, 1])
+        latency_layout[run] = (state["highest_ns"], state["significant_digits"])
+        latency_totals[run] = [
+            -1 if state[name] is None else state[name] for name in _LATENCY_FIELDS
+        ]
+
+    def offsets(parts: List[np.ndarray]) -> np.ndarray:
+        return np.concatenate([[0], np.cumsum([part.size for part in parts])])
+
+    arrays = {
+        "distribution": distribution,
+        "transitions": transitions,
+        "violations": np.trace(transitions, axis1=1, axis2=2),
+        "sample_values": np.concatenate(samples or [np.empty(0, np.uint8)]),
+        "sample_offsets": offsets(samples),
+        "latency_index": np.concatenate(latency_indices or [np.empty(0, np.int32)]),
+        "latency_count": np.concatenate(latency_counts or [np.empty(0, np.int64)]),
+        "latency_offsets": offsets(latency_indices),
+        "latency_layout": latency_layout,
+        "latency_totals": latency_totals,
+    }
+    return metadata_list, arrays
+
+
+def _unpack_run(
+    metadata: Dict[str, Any], arrays: Dict[str, np.ndarray], run: int
+) -> Dict[str, Any]:
+    """열 배열에서 실행 결과 하나 복원 (JSON으로 읽은 것과 같은 형태)"""
+    result = dict(metadata)
+    columns = set(result.pop("_columns", []))
+
+    if "distribution" in columns:
+        result.setdefault("distribution_analysis", {})["counts"] = {
+            str(i): int(count) for i, count in enumerate(arrays["distribution"][run])
+        }
+    if "transitions" in columns:
+        matrix = arrays["transitions"][run]
+        result.setdefault("transition_analysis", {})["transitions"] = {
+            f"{prev}->{curr}": int(matrix[prev, curr])
+            for prev in range(3)
+            for curr in range(3)
+            if matrix[prev, curr]
+        }
+    if "sample_sequence" in columns:
+        start, end = arrays["sample_offsets"][run : run + 2]
+        result["sample_sequence"] = arrays["sample_values"][start:end].tolist()
+    if "latency_histogram" in columns:
+        start, end = arrays["latency_offsets"][run : run + 2]
+        indices = arrays["latency_index"][start:end]
+        buckets = np.stack([indices, arrays["latency_count"][start:end]], axis=1)
+        totals = arrays["latency_totals"][run].tolist()
+        state = {
+            "highest_ns": int(arrays["latency_layout"][run, 0]),
+            "significant_digits": int(arrays["latency_layout"][run, 1]),
+            "buckets": buckets.tolist(),
+        }
+        state.update(zip(_LATENCY_FIELDS, totals))
+        if state["min_ns"] == -1:
+            state["min_ns"] = None
+        result["latency_histogram"] = state
+    return result
+
+
+def save_results_npz(
+    results: Dict[str, Any], path: Union[str, Path], compress: bool = True
+) -> str:
+    """결과(단일 또는 통합)를 npz로 저장"""
+    if "individual_results" in results:
+        header = {k: v for k, v in results.items() if k != "individual_results"}
+        runs = results["individual_results"]
+        layout = "combined"
+    else:
+        header, runs, layout = {}, [results], "single"
+
+    metadata_list, arrays = _pack_runs(runs)
+    metadata = {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "layout": layout,
+        "header": header,
+        "runs": metadata_list,
+    }
+    encoded = json.dumps(metadata, ensure_ascii=False).encode("utf-8")
+    arrays["metadata"] = np.frombuffer(zlib.compress(encoded), dtype=np.uint8)
+
+    path = Path(path)
+    save = np.savez_compressed if compress else np.savez
+    save(path, **arrays)
+    # np.savez는 .npz 확장자가 없으면 붙여서 저장
+    return str(path if path.suffix == ".npz" else path.with_name(path.name + ".npz"))
+
+
+def load_result_columns(path: Union[str, Path]) -> Dict[str, Any]:
+    """npz 열 배열과 메타데이터 읽기 (딕셔너리 복원 없이 대시보드에서 바로 사용)"""
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    metadata = json.loads(zlib.decompress(arrays.pop("metadata").tobytes()))
+    if metadata.get("format_version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported results format version in {path}")
+    arrays["metadata"] = metadata
+    return arrays
+
+
+def load_results(path: Union[str, Path]) -> Dict[str, Any]:
+    """JSON 또는 npz 결과 파일을 JSON과 같은 딕셔너리로 읽기"""
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    arrays = load_result_columns(path)
+    metadata = arrays.pop("metadata")
+    runs = [
+        _unpack_run(run_metadata, arrays, run)
+        for run, run_metadata in enumerate(metadata["runs"])
+    ]
+    if metadata["layout"] == "single":
+        return runs[0]
+    return {**metadata["header"], "individual_results": runs}
+
+
+def save_results_file(
+    results: Dict[str, Any], path_stem: Union[str, Path], results_format: str = "json"
+) -> List[str]:
+    """results_format("json", "npz", "both")에 따라 확장자를 붙여 저장한 파일 목록"""
+    if results_format not in RESULTS_FORMATS:
+        raise ValueError(
+            f"Unknown results format '{results_format}' "
+            f"(available: {', '.join(RESULTS_FORMATS)})"
+        )
+
+    path_stem = Path(path_stem)
+    saved = []
+    if results_format in ("json", "both"):
+        filename = path_stem.with_name(path_stem.name + ".json")
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        saved.append(str(filename))
+    if results_format in ("npz", "both"):
+        saved.append(
+            save_results_npz(results, path_stem.with_name(path_stem.name + ".npz"))
+        )
+    return saved
+
+
+def convert_json_results(
+    sources: Union[str, Path, Iterable[Union[str, Path]]] = "src/results",
+) -> List[str]:
+    """기존 JSON 결과 파일(또는 디렉토리의 *.json)을 같은 이름의 npz로 변환"""
+    if isinstance(sources, (str, Path)):
+        source = Path(sources)
+        paths = sorted(source.glob("*.json")) if source.is_dir() else [source]
+    else:
+        paths = [Path(p) for p in sources]
+
+    converted = []
+    for path in paths:
+        try:
+            results = load_results(path)
+            converted.append(save_results_npz(results, path.with_suffix(".npz")))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Skipped {path}: {e}")
+            continue
+        print(f"Converted: {path} -> {converted[-1]}")
+    return converted
+
+
+if __name__ == "__main__":
+    # 사용법: python results_io.py [결과 디렉토리 또는 JSON 파일 ...]
+    convert_json_results(sys.argv[1:] or "src/results")
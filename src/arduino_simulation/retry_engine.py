@@ -0,0 +1,256 @@
+"""
+Retry Engine
+이전 숫자와 다른 값이 나올 때까지 random(0, 3)을 다시 뽑는 재추첨 엔진
+
+재귀 구현(getRandomNum1)과 재시도 구현이 같은 규칙을 공유한다:
+- 최대 max_draws회 추첨, 모두 이전 숫자와 같으면 (이전 숫자 + 1) % 3으로 폴백
+- 출력 1개마다 소비한 RNG 추첨 수를 RetryStats 히스토그램에 기록
+
+배치 모드는 미리 뽑은 후보 스트림에서 같은 값이 이어지는 구간(run)을 접어
+한 번에 계산한다.
+재추첨은 직전 출력과 같은 후보를 건너뛰는 것이므로 출력은 각 run의 첫 값이고,
+출력 1개의 추첨 수는 그 직전 run의 길이와 같다.
+출력마다 버리는 후보가 있으면(discard > 0) run이 끊기므로 후보를 차례로 처리한다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+STATES = 3
+DEFAULT_MAX_DRAWS = 100
+# 후보가 균등할 때 이전 숫자와 충돌할 확률
+UNIFORM_COLLISION_PROBABILITY = 1 / STATES
+
+
+def expected_draws(
+    collision_probability: float = UNIFORM_COLLISION_PROBABILITY,
+    max_draws: int = DEFAULT_MAX_DRAWS,
+) -> float:
+    """충돌 확률 q에서 출력 1개당 기대 추첨 수 (1 + q + ... + q^(max_draws-1))"""
+    q = collision_probability
+    if q >= 1:
+        return float(max_draws)
+    return (1 - q**max_draws) / (1 - q)
+
+
+def draws_quantile(
+    probability: float,
+    collision_probability: float = UNIFORM_COLLISION_PROBABILITY,
+    max_draws: int = DEFAULT_MAX_DRAWS,
+) -> int:
+    """추첨 수가 k 이하일 확률(1 - q^k)이 probability 이상이 되는 최소 k"""
+    q = collision_probability
+    for draws in range(1, max_draws):
+        if 1 - q**draws >= probability:
+            return draws
+    return max_draws
+
+
+@dataclass
+class RetryStats:
+    """출력 1개당 RNG 추첨 수 분포"""
+
+    counts: List[int] = field(default_factory=lambda: [0])  # [추첨 수] = 출력 수
+    fallbacks: int = 0  # max_draws회 모두 충돌해 폴백한 출력 수
+
+    @property
+    def outputs(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def total_draws(self) -> int:
+        return sum(draws * count for draws, count in enumerate(self.counts))
+
+    @property
+    def mean_draws(self) -> float:
+        outputs = self.outputs
+        return self.total_draws / outputs if outputs else 0.0
+
+    @property
+    def max_draws(self) -> int:
+        return max((d for d, count in enumerate(self.counts) if count), default=0)
+
+    def record(self, draws: int, fallback: bool = False):
+        """출력 1개 기록"""
+        if draws >= len(self.counts):
+            self.counts.extend([0] * (draws + 1 - len(self.counts)))
+        self.counts[draws] += 1
+        if fallback:
+            self.fallbacks += 1
+
+    def record_batch(self, draws: np.ndarray):
+        """출력 여러 개의 추첨 수 한 번에 기록"""
+        if len(draws):
+            self._add_histogram(np.bincount(draws).tolist())
+
+    def _add_histogram(self, histogram: List[int]):
+        if len(histogram) > len(self.counts):
+            self.counts.extend([0] * (len(histogram) - len(self.counts)))
+        for value, count in enumerate(histogram):
+            self.counts[value] += count
+
+    def merge(self, other: "RetryStats") -> "RetryStats":
+        """다른 구간의 분포 합치기"""
+        self._add_histogram(other.counts)
+        self.fallbacks += other.fallbacks
+        return self
+
+    def percentile(self, q: float) -> int:
+        """추첨 수의 q 백분위수 (0 ~ 100)"""
+        outputs = self.outputs
+        if outputs == 0:
+            return 0
+        target = q / 100 * outputs
+        cumulative = 0
+        for draws, count in enumerate(self.counts):
+            cumulative += count
+            if count and cumulative >= target:
+                return draws
+        return self.max_draws
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 저장/출력용 요약"""
+        return {
+            "outputs": self.outputs,
+            "total_draws": self.total_draws,
+            "mean_draws": self.mean_draws,
+            "p50_draws": self.percentile(50),
+            "p99_draws": self.percentile(99),
+            "p999_draws": self.percentile(99.9),
+            "max_draws": self.max_draws,
+            "fallbacks": self.fallbacks,
+            "histogram": {d: count for d, count in enumerate(self.counts) if count},
+        }
+
+
+class RetryEngine:
+    """이전 숫자와 다른 값이 나올 때까지 재추첨 (재귀 없이 반복)"""
+
+    def __init__(self, max_draws: int = DEFAULT_MAX_DRAWS):
+        if max_draws <= 0:
+            raise ValueError("max_draws must be positive")
+        self.max_draws = max_draws
+        self.stats = RetryStats()
+        self._pending = 0  # 배치 끝에서 아직 출력이 정해지지 않은 추첨 수
+
+    def draw(
+        self,
+        draw: Callable[[], int],
+        previous: int,
+        on_collision: Optional[Callable[[], Any]] = None,
+        extra_draws: int = 0,
+    ) -> Optional[int]:
+        """
+        draw()를 previous와 다른 값이 나올 때까지 호출 (max_draws회 모두 충돌하면 None)
+        on_collision은 충돌할 때마다 호출, extra_draws는 기록에 더할 호출 전 추첨 수
+        """
+        for draws in range(1, self.max_draws + 1):
+            value = draw()
+            if value != previous:
+                self.stats.record(draws + extra_draws)
+                return value
+            if on_collision is not None:
+                on_collision()
+        self.stats.record(self.max_draws + extra_draws, fallback=True)
+        return None
+
+    def resolve_batch(
+        self, candidates: np.ndarray, previous: int, discard: int = 0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        미리 뽑은 후보 스트림의 (출력 시퀀스, 출력별 충돌 횟수)
+        draw()를 차례로 반복한 것과 동일하며, discard는 출력마다 draw() 전에 버리는
+        후보 수 (draw(extra_draws=discard)와 같은 추첨 수 기록)
+        끝에서 아직 출력이 정해지지 않은 후보는 다음 배치 첫 출력의 추첨 수로 이어진다.
+        """
+        values = np.asarray(candidates, dtype=np.int64).ravel()
+        if values.size == 0:
+            return values.astype(np.uint8), values
+        if discard:
+            return self._resolve_scalar(values, previous, discard)
+
+        before = np.empty_like(values)
+        before[0] = previous
+        before[1:] = values[:-1]
+        heads = np.flatnonzero(values != before)
+        if heads.size == 0:
+            draws = np.empty(0, dtype=np.int64)
+            tail = self._pending + values.size
+        else:
+            draws = np.diff(heads, prepend=-1 - self._pending)
+            tail = values.size - 1 - int(heads[-1])
+
+        if int(draws.max(initial=0)) > self.max_draws or tail >= self.max_draws:
+            # 폴백이 끼어드는 구간은 스칼라 규칙으로 정확히 처리 (확률 (1/3)^max_draws)
+            return self._resolve_scalar(values, previous)
+
+        self.stats.record_batch(draws)
+        self._pending = tail
+        return values[heads].astype(np.uint8), draws - 1
+
+    def _resolve_scalar(
+        self, values: np.ndarray, previous: int, discard: int = 0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """resolve_batch()의 폴백/버리는 후보 포함 스칼라 경로"""
+        outputs = []
+        collisions = []
+        draws = self._pending
+        for value in values.tolist():
+            draws += 1
+            if draws <= discard:
+                continue
+            if value != previous:
+                self.stats.record(draws)
+                outputs.append(value)
+                collisions.append(draws - discard - 1)
+                previous, draws = value, 0
+            elif draws - discard == self.max_draws:
+                self.stats.record(draws, fallback=True)
+                previous, draws = (previous + 1) % STATES, 0
+                outputs.append(previous)
+                collisions.append(self.max_draws)
+        self._pending = draws
+        return np.array(outputs, dtype=np.uint8), np.array(collisions, dtype=np.int64)
+
+
+def iter_retry_chunks(
+    engine: RetryEngine,
+    draw_batch: Callable[[int], np.ndarray],
+    chunk_size: int,
+    iterations: Optional[int],
+    previous: int = -1,
+    discard: int = 0,
+    on_batch: Optional[Callable[[np.ndarray, np.ndarray], Any]] = None,
+) -> Iterator[np.ndarray]:
+    """
+    draw_batch(n)으로 후보를 미리 뽑아 재추첨 규칙의 출력을 chunk_size개씩 yield
+    (iterations=None이면 무한, 마지막 청크는 더 짧을 수 있음)
+    on_batch(출력, 출력별 충돌 횟수)는 resolve_batch() 결과마다 yield 전에 호출
+    출력 1개는 추첨 1 + discard회 이상이므로 남은 출력 수에 맞춰 뽑으면
+    청크를 넘치지 않고, RNG도 스칼라 실행보다 앞서 나가지 않는다.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    remaining = iterations
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        parts = []
+        filled = 0
+        while filled < size:
+            # 이전 배치에서 이미 버린 후보는 다시 뽑지 않음
+            count = (size - filled) * (1 + discard) - min(engine._pending, discard)
+            outputs, collisions = engine.resolve_batch(
+                draw_batch(count), previous, discard
+            )
+            if outputs.size:
+                previous = int(outputs[-1])
+                filled += outputs.size
+                if on_batch is not None:
+                    on_batch(outputs, collisions)
+                parts.append(outputs)
+        if remaining is not None:
+            remaining -= size
+        yield parts[0] if len(parts) == 1 else np.concatenate(parts)
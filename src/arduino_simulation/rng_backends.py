@@ -0,0 +1,390 @@
+"""
+Arduino random() Generator Backends
+Arduino Mock의 random() 생성기를 교체 가능한 백엔드로 분리
+
+지원 백엔드:
+- mt19937: Python random.Random (기존 시뮬레이션과 동일한 시퀀스)
+- newlib: Uno R4 (Renesas), ESP32 등 newlib 기반 코어의 random() 비트 단위 재현
+- avr: Uno/Nano (ATmega328P) AVR-libc random() 비트 단위 재현
+- esp32: arduino-esp32 코어의 random() (randomSeed() 전에는 하드웨어 RNG라 재현 불가)
+
+Arduino 코어의 random(min, max) 축소 방식 (ArduinoCore-API WMath.cpp):
+  long random(long howbig) { if (howbig == 0) return 0; return random() % howbig; }
+  long random(long howsmall, long howbig) {
+    if (howsmall >= howbig) return howsmall;
+    return random(howbig - howsmall) + howsmall;
+  }
+  void randomSeed(unsigned long seed) { if (seed != 0) srandom(seed); }
+
+arduino-esp32는 WMath.cpp에서 random()을 따로 구현한다 (Esp32RandomBackend 참고).
+
+모든 백엔드는 스칼라 경로와 NumPy 벡터화 경로가 동일한 출력을 생성한다.
+"""
+
+import random
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+RANDOM_MAX = 0x7FFFFFFF  # newlib RAND_MAX, AVR-libc RANDOM_MAX
+_MASK32 = 0xFFFFFFFF
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# 벡터화 경로의 점프 테이블 블록 크기
+_BLOCK_SIZE = 1 << 16
+
+
+class RandomBackend:
+    """Arduino random() 생성기 백엔드 기본 클래스"""
+
+    name = "base"
+
+    def seed(self, seed: int):
+        """randomSeed() 동작"""
+        raise NotImplementedError
+
+    def random(self) -> int:
+        """인자 없는 C random() 한 번 호출 (0 ~ RANDOM_MAX)"""
+        raise NotImplementedError
+
+    def random_batch(self, n: int) -> np.ndarray:
+        """C random() n번 호출 결과 (int64 배열)"""
+        return np.array([self.random() for _ in range(n)], dtype=np.int64)
+
+    def random_range(self, min_val: int, max_val: int) -> int:
+        """Arduino random(min, max) - max 미포함"""
+        if min_val >= max_val:
+            return min_val
+        return self.random() % (max_val - min_val) + min_val
+
+    def random_range_batch(self, min_val: int, max_val: int, n: int) -> np.ndarray:
+        """random(min, max) n번 호출 결과 (int64 배열)"""
+        if min_val >= max_val:
+            return np.full(n, min_val, dtype=np.int64)
+        return self.random_batch(n) % (max_val - min_val) + min_val
+
+    def getstate(self) -> Any:
+        raise NotImplementedError
+
+    def setstate(self, state: Any):
+        raise NotImplementedError
+
+
+class MersenneTwisterBackend(RandomBackend):
+    """Python random.Random 기반 백엔드 (기존 시뮬레이션 호환)"""
+
+    name = "mt19937"
+
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+
+    def seed(self, seed: int):
+        self._rng.seed(seed)
+
+    def random(self) -> int:
+        return self._rng.getrandbits(31)
+
+    def random_range(self, min_val: int, max_val: int) -> int:
+        if min_val >= max_val:
+            return min_val
+        return self._rng.randint(min_val, max_val - 1)
+
+    def random_range_batch(self, min_val: int, max_val: int, n: int) -> np.ndarray:
+        if min_val >= max_val:
+            return np.full(n, min_val, dtype=np.int64)
+        return min_val + self._randbelow_batch(max_val - min_val, n)
+
+    def _randbelow_batch(self, span: int, n: int) -> np.ndarray:
+        """
+        random.Random.randrange(span)와 비트 단위로 동일한 벡터화 추출
+        MT19937 상태를 NumPy로 옮겨 32비트 출력을 한 번에 생성한 뒤
+        같은 거절 샘플링(getrandbits(k) >= span이면 재추출)을 적용하고,
+        실제로 소비한 출력 수만큼만 진행한 상태를 되돌려 놓는다.
+        """
+        k = span.bit_length()
+        if n == 0 or k > 32:
+            return np.array([self._rng.randrange(span) for _ in range(n)], np.int64)
+
+        version, internal, gauss_next = self._rng.getstate()
+        start_state = {
+            "bit_generator": "MT19937",
+            "state": {"key": np.array(internal[:-1], np.uint32), "pos": internal[-1]},
+        }
+        bitgen = np.random.MT19937()
+        bitgen.state = start_state
+
+        chunks = []
+        consumed = 0
+        remaining = n
+        while remaining > 0:
+            # 수락 확률 span / 2^k (>= 1/2) 기준으로 약간 넉넉하게 추출
+            draws = remaining * (1 << k) // span + 64
+            raw = bitgen.random_raw(draws) >> np.uint64(32 - k)
+            accepted = np.flatnonzero(raw < span)
+            if accepted.size >= remaining:
+                accepted = accepted[:remaining]
+                consumed += int(accepted[-1]) + 1
+            else:
+                consumed += draws
+            chunks.append(raw[accepted])
+            remaining -= accepted.size
+
+        # 소비한 만큼만 진행한 상태로 되감기
+        bitgen.state = start_state
+        bitgen.random_raw(consumed)
+        end_state = bitgen.state["state"]
+        key = tuple(int(word) for word in end_state["key"])
+        self._rng.setstate((version, key + (int(end_state["pos"]),), gauss_next))
+
+        return np.concatenate(chunks).astype(np.int64)
+
+    def getstate(self) -> Any:
+        return self._rng.getstate()
+
+    def setstate(self, state: Any):
+        # JSON에서 읽은 상태는 튜플이 리스트로 바뀌어 있음
+        version, key, gauss_next = state
+        self._rng.setstate((version, tuple(key), gauss_next))
+
+
+class NewlibRandomBackend(RandomBackend):
+    """
+    newlib random() 재현 (Uno R4 Renesas 코어, ESP32 등)
+    next = next * 6364136223846793005 + 1 (mod 2^64)
+    return (next >> 32) & RAND_MAX
+    """
+
+    name = "newlib"
+    MULTIPLIER = 6364136223846793005
+    INCREMENT = 1
+
+    _jump_tables = None  # (A_k, C_k) k = 1.._BLOCK_SIZE, 클래스 단위 캐시
+
+    def __init__(self, seed: Optional[int] = None):
+        self._next = 1  # newlib 초기값
+        if seed is not None:
+            self.seed(seed)
+
+    def seed(self, seed: int):
+        seed &= _MASK32  # unsigned long (32비트)
+        if seed != 0:  # Arduino randomSeed(0)은 무시됨
+            self._next = seed
+
+    def random(self) -> int:
+        self._next = (self._next * self.MULTIPLIER + self.INCREMENT) & _MASK64
+        return (self._next >> 32) & RANDOM_MAX
+
+    @classmethod
+    def _get_jump_tables(cls):
+        """s_k = A_k * s_0 + C_k 점프 계수 테이블 (uint64 오버플로 = mod 2^64)"""
+        if cls._jump_tables is None:
+            a = np.empty(_BLOCK_SIZE, dtype=np.uint64)
+            c = np.empty(_BLOCK_SIZE, dtype=np.uint64)
+            a[0] = cls.MULTIPLIER
+            c[0] = cls.INCREMENT
+            filled = 1
+            while filled < _BLOCK_SIZE:
+                step = min(filled, _BLOCK_SIZE - filled)
+                # s_{m+k} = A_k * s_m + C_k
+                #   =>  A_{m+k} = A_k A_m, C_{m+k} = A_k C_m + C_k
+                a[filled : filled + step] = a[:step] * a[filled - 1]
+                c[filled : filled + step] = a[:step] * c[filled - 1] + c[:step]
+                filled += step
+            cls._jump_tables = (a, c)
+        return cls._jump_tables
+
+    def random_batch(self, n: int) -> np.ndarray:
+        a, c = self._get_jump_tables()
+        out = np.empty(n, dtype=np.int64)
+        for start in range(0, n, _BLOCK_SIZE):
+            size = min(_BLOCK_SIZE, n - start)
+            states = a[:size] * np.uint64(self._next) + c[:size]
+            out[start : start + size] = (states >> np.uint64(32)) & np.uint64(
+                RANDOM_MAX
+            )
+            self._next = int(states[-1])
+        return out
+
+    def getstate(self) -> Any:
+        return ("newlib", self._next)
+
+    def setstate(self, state: Any):
+        self._next = int(state[1])
+
+
+class AvrLibcRandomBackend(RandomBackend):
+    """
+    AVR-libc random() 재현 (Uno/Nano ATmega328P)
+    Park-Miller 최소 표준 생성기 (Schrage 방식, 16807 * x mod 2^31-1)
+    """
+
+    name = "avr"
+    MODULUS = 0x7FFFFFFF
+    MULTIPLIER = 16807
+
+    _jump_table = None  # 16807^k mod M, k = 1.._BLOCK_SIZE
+
+    def __init__(self, seed: Optional[int] = None):
+        self._next = 1  # AVR-libc 초기값
+        if seed is not None:
+            self.seed(seed)
+
+    def seed(self, seed: int):
+        seed &= _MASK32
+        if seed != 0:  # Arduino randomSeed(0)은 무시됨
+            self._next = seed
+
+    def random(self) -> int:
+        """do_random() - C의 부호 있는 long 나눗셈 의미 그대로 재현"""
+        x = self._next
+        if x & 0x80000000:
+            x -= 1 << 32
+        if x == 0:
+            x = 123459876
+        hi = int(x / 127773)  # C 나눗셈은 0 방향으로 버림
+        lo = x - hi * 127773
+        x = 16807 * lo - 2836 * hi
+        if x < 0:
+            x += 0x7FFFFFFF
+        self._next = x & _MASK32
+        return x % (RANDOM_MAX + 1)
+
+    @classmethod
+    def _get_jump_table(cls) -> np.ndarray:
+        if cls._jump_table is None:
+            table = np.empty(_BLOCK_SIZE, dtype=np.uint64)
+            table[0] = cls.MULTIPLIER
+            filled = 1
+            while filled < _BLOCK_SIZE:
+                step = min(filled, _BLOCK_SIZE - filled)
+                table[filled : filled + step] = (
+                    table[:step] * table[filled - 1] % np.uint64(cls.MODULUS)
+                )
+                filled += step
+            cls._jump_table = table
+        return cls._jump_table
+
+    def random_batch(self, n: int) -> np.ndarray:
+        out = np.empty(n, dtype=np.int64)
+        start = 0
+        # 상태가 [1, M-1] 밖이면 (시드 0 또는 2^31 이상) 스칼라로 한 단계 정규화
+        while start < n and not 0 < self._next < self.MODULUS:
+            out[start] = self.random()
+            start += 1
+
+        table = self._get_jump_table()
+        modulus = np.uint64(self.MODULUS)
+        while start < n:
+            size = min(_BLOCK_SIZE, n - start)
+            states = table[:size] * np.uint64(self._next) % modulus
+            out[start : start + size] = states
+            self._next = int(states[-1])
+            start += size
+        return out
+
+    def getstate(self) -> Any:
+        return ("avr", self._next)
+
+    def setstate(self, state: Any):
+        self._next = int(state[1])
+
+
+class Esp32RandomBackend(RandomBackend):
+    """
+    arduino-esp32 random() 재현 (WMath.cpp)
+      randomSeed(seed): seed != 0이면 srand(seed) 후 하드웨어 RNG 사용 중단
+      random(howbig): x = 하드웨어 RNG면 esp_random() (32비트), 아니면 rand() (31비트)
+        m = (uint64_t)x * howbig, l = (uint32_t)m
+        l < (-howbig) % howbig이면 다시 추출, 결과는 m >> 32
+    rand()는 newlib random()과 같은 64비트 LCG 상태를 쓴다.
+    esp_random()은 진짜 하드웨어 난수이므로 randomSeed() 전에는 시퀀스를 재현할 수 없고
+    (OS 엔트로피로 대신함), 시드 후에는 rand()가 31비트라 m >> 32는 howbig / 2 미만만
+    나온다 (random(0, 3)은 0 또는 1, 실제 보드와 동일).
+    """
+
+    name = "esp32"
+
+    def __init__(self, seed: Optional[int] = None):
+        self._rand = NewlibRandomBackend()  # rand(): newlib LCG, 초기값 1
+        self._hardware = np.random.default_rng()  # esp_random() 대용 (시드 없음)
+        self._use_hardware = True
+        if seed is not None:
+            self.seed(seed)
+
+    def seed(self, seed: int):
+        seed &= _MASK32
+        if seed != 0:  # randomSeed(0)은 무시되어 하드웨어 RNG 유지
+            self._rand.seed(seed)
+            self._use_hardware = False
+
+    def random(self) -> int:
+        """C rand() (newlib random()과 같은 상태)"""
+        return self._rand.random()
+
+    def _draw_batch(self, n: int) -> np.ndarray:
+        """random(howbig)이 쓰는 원시 추출 n개 (esp_random() 또는 rand())"""
+        if self._use_hardware:
+            return self._hardware.integers(0, 1 << 32, n, dtype=np.int64)
+        return self._rand.random_batch(n)
+
+    def random_range(self, min_val: int, max_val: int) -> int:
+        if min_val >= max_val:
+            return min_val
+        howbig = max_val - min_val
+        threshold = (-howbig & _MASK32) % howbig
+        while True:
+            if self._use_hardware:
+                x = int(self._hardware.integers(0, 1 << 32))
+            else:
+                x = self._rand.random()
+            m = x * howbig
+            if m & _MASK32 >= threshold:
+                return (m >> 32) + min_val
+
+    def random_range_batch(self, min_val: int, max_val: int, n: int) -> np.ndarray:
+        if min_val >= max_val:
+            return np.full(n, min_val, dtype=np.int64)
+        howbig = max_val - min_val
+        threshold = (-howbig & _MASK32) % howbig
+        chunks = []
+        remaining = n
+        while remaining > 0:
+            # 거절된 추출만큼만 다시 뽑으므로 스칼라 경로와 같은 만큼 소비
+            m = self._draw_batch(remaining).astype(np.uint64) * np.uint64(howbig)
+            accepted = m[(m & np.uint64(_MASK32)) >= np.uint64(threshold)]
+            chunks.append((accepted >> np.uint64(32)).astype(np.int64) + min_val)
+            remaining -= accepted.size
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+    def getstate(self) -> Any:
+        return ("esp32", self._rand._next, self._use_hardware)
+
+    def setstate(self, state: Any):
+        self._rand._next = int(state[1])
+        self._use_hardware = bool(state[2])
+
+
+RNG_BACKENDS: Dict[str, type] = {
+    MersenneTwisterBackend.name: MersenneTwisterBackend,
+    NewlibRandomBackend.name: NewlibRandomBackend,
+    AvrLibcRandomBackend.name: AvrLibcRandomBackend,
+    Esp32RandomBackend.name: Esp32RandomBackend,
+}
+
+
+def create_rng_backend(
+    backend: Union[str, RandomBackend] = "mt19937", seed: Optional[int] = None
+) -> RandomBackend:
+    """이름 또는 인스턴스로 백엔드 생성"""
+    if isinstance(backend, RandomBackend):
+        if seed is not None:
+            backend.seed(seed)
+        return backend
+
+    try:
+        backend_class = RNG_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown RNG backend '{backend}' (available: {', '.join(RNG_BACKENDS)})"
+        ) from None
+    return backend_class(seed)
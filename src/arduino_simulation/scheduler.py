@@ -0,0 +1,131 @@
+"""
+Arduino Interrupt Scheduler
+가상 클럭(사이클) 기준 이산 이벤트 스케줄러
+
+주요 기능:
+- 힙 기반 이벤트 대기열 (타이머 인터럽트, 핀 인터럽트, 외부 핀 입력 변화)
+- 주기 이벤트 재예약 (밀린 주기는 하나의 대기 인터럽트로 합침)
+- ISR 지연 시간 / 지터 통계 (Welford 온라인 알고리즘)
+"""
+
+import heapq
+import math
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass(order=True)
+class ScheduledEvent:
+    """대기열 이벤트 (cycle, seq 순으로 정렬)"""
+
+    cycle: int
+    seq: int
+    kind: str = field(compare=False)  # "timer", "pin_isr", "pin_change"
+    name: str = field(compare=False)
+    callback: Optional[Callable[[], Any]] = field(compare=False, default=None)
+    period: int = field(compare=False, default=0)  # 0 = 한 번만 실행
+    args: tuple = field(compare=False, default=())
+    cancelled: bool = field(compare=False, default=False)
+
+
+class EventScheduler:
+    """사이클 단위 이산 이벤트 대기열"""
+
+    def __init__(self):
+        self._heap: List[ScheduledEvent] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return sum(1 for event in self._heap if not event.cancelled)
+
+    def schedule(
+        self,
+        cycle: int,
+        kind: str,
+        name: str,
+        callback: Optional[Callable[[], Any]] = None,
+        period: int = 0,
+        args: tuple = (),
+    ) -> ScheduledEvent:
+        """cycle 시점에 이벤트 예약"""
+        self._seq += 1
+        event = ScheduledEvent(cycle, self._seq, kind, name, callback, period, args)
+        heapq.heappush(self._heap, event)
+        return event
+
+    def reschedule(self, event: ScheduledEvent, cycle: int):
+        """꺼낸 이벤트를 다른 시점에 다시 예약 (주기 이벤트)"""
+        self._seq += 1
+        event.cycle = cycle
+        event.seq = self._seq
+        heapq.heappush(self._heap, event)
+
+    def cancel(self, event: ScheduledEvent):
+        """예약 취소 (대기열에서는 꺼낼 때 제거)"""
+        event.cancelled = True
+
+    @property
+    def next_cycle(self) -> float:
+        """다음 이벤트 시점 (없으면 inf)"""
+        heap = self._heap
+        while heap and heap[0].cancelled:
+            heapq.heappop(heap)
+        return heap[0].cycle if heap else math.inf
+
+    def pop(self) -> ScheduledEvent:
+        """가장 이른 이벤트 꺼내기 (next_cycle 확인 후 호출)"""
+        return heapq.heappop(self._heap)
+
+    def events(self) -> List[ScheduledEvent]:
+        """대기 중인 이벤트 목록 (시점 순)"""
+        return sorted(event for event in self._heap if not event.cancelled)
+
+    def getstate(self) -> Tuple[Tuple[ScheduledEvent, ...], int]:
+        """대기열 상태 캡처 (이벤트는 복사본)"""
+        return tuple(replace(event) for event in self.events()), self._seq
+
+    def setstate(self, state: Tuple[Tuple[ScheduledEvent, ...], int]):
+        """getstate()로 캡처한 대기열 복원"""
+        events, self._seq = state
+        self._heap = [replace(event) for event in events]
+        heapq.heapify(self._heap)
+
+
+@dataclass
+class LatencyStats:
+    """ISR 지연 시간 통계 (사이클 단위, Welford 온라인 평균/분산)"""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: Optional[int] = None
+    max: int = 0
+    overruns: int = 0  # 주기 인터럽트가 밀려서 합쳐진 횟수
+
+    def add(self, latency: int):
+        self.count += 1
+        delta = latency - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (latency - self.mean)
+        self.min = latency if self.min is None else min(self.min, latency)
+        self.max = max(self.max, latency)
+
+    @property
+    def jitter(self) -> float:
+        """지연 시간 표준편차 (사이클)"""
+        return math.sqrt(self.m2 / self.count) if self.count > 1 else 0.0
+
+    def to_dict(self, clock_speed_hz: int) -> Dict[str, Any]:
+        """통계 요약 (사이클 및 마이크로초)"""
+        cycles_to_us = 1_000_000 / clock_speed_hz
+        return {
+            "count": self.count,
+            "latency_mean_cycles": self.mean,
+            "latency_min_cycles": self.min or 0,
+            "latency_max_cycles": self.max,
+            "jitter_cycles": self.jitter,
+            "latency_mean_us": self.mean * cycles_to_us,
+            "latency_max_us": self.max * cycles_to_us,
+            "jitter_us": self.jitter * cycles_to_us,
+            "overruns": self.overruns,
+        }
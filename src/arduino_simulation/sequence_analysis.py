@@ -0,0 +1,126 @@
+"""
+Sequence Analysis
+0/1/2 시퀀스의 분포, 3x3 전이 횟수, 연속 위반 수를 한 번의 벡터 연산으로 집계
+
+전이는 bincount(prev * 3 + curr)로 계산하며, 위반 수는 전이 행렬의 대각선 합이다.
+청크 단위로 update()하거나 merge()로 합쳐도 전체를 한 번에 집계한 결과와 같다.
+0..2 밖의 값은 기존 count(i) 집계처럼 분포/전이에서 빼고 out_of_range로만 센다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+STATES = 3
+
+
+@dataclass
+class SequenceCounts:
+    """시퀀스 집계 결과 (청크 간 병합 가능)"""
+
+    distribution: np.ndarray = field(
+        default_factory=lambda: np.zeros(STATES, dtype=np.int64)
+    )
+    transitions: np.ndarray = field(
+        default_factory=lambda: np.zeros((STATES, STATES), dtype=np.int64)
+    )
+    first: Optional[int] = None  # 병합 시 경계 전이 계산용
+    last: Optional[int] = None
+    out_of_range: int = 0  # 0..2 밖의 값 수 (분포/전이에서 제외)
+
+    @property
+    def total(self) -> int:
+        return int(self.distribution.sum())
+
+    @property
+    def violations(self) -> int:
+        """연속으로 같은 숫자가 나온 횟수"""
+        return int(np.trace(self.transitions))
+
+    def update(self, sequence: Iterable[int]) -> "SequenceCounts":
+        """시퀀스 이어서 집계 (직전 update의 마지막 값과의 전이 포함)"""
+        values = np.asarray(sequence, dtype=np.int64).ravel()
+        if values.size == 0:
+            return self
+        valid = (values >= 0) & (values < STATES)
+        if not valid.all():
+            self.out_of_range += int(values.size - np.count_nonzero(valid))
+
+        self.distribution += np.bincount(values[valid], minlength=STATES)
+        pairs = values[:-1] * STATES + values[1:]
+        self.transitions += np.bincount(
+            pairs[valid[:-1] & valid[1:]], minlength=STATES**2
+        ).reshape(STATES, STATES)
+        self._add_boundary(int(values[0]))
+        if self.first is None:
+            self.first = int(values[0])
+        self.last = int(values[-1])
+        return self
+
+    def merge(self, other: "SequenceCounts") -> "SequenceCounts":
+        """뒤따르는 구간의 집계 합치기"""
+        if other.first is None:
+            return self
+        self.distribution += other.distribution
+        self.transitions += other.transitions
+        self.out_of_range += other.out_of_range
+        self._add_boundary(other.first)
+        if self.first is None:
+            self.first = other.first
+        self.last = other.last
+        return self
+
+    def _add_boundary(self, first: int):
+        """직전 구간의 마지막 값에서 다음 구간의 첫 값으로의 전이"""
+        if self.last is not None and 0 <= self.last < STATES and 0 <= first < STATES:
+            self.transitions[self.last, first] += 1
+
+    def distribution_dict(self) -> Dict[int, int]:
+        """{숫자: 횟수}"""
+        return {i: int(count) for i, count in enumerate(self.distribution)}
+
+    def transition_dict(self) -> Dict[str, int]:
+        """{"이전->현재": 횟수} (나온 전이만)"""
+        return {
+            f"{prev}->{curr}": int(self.transitions[prev, curr])
+            for prev in range(STATES)
+            for curr in range(STATES)
+            if self.transitions[prev, curr]
+        }
+
+    def transition_rows(self) -> Dict[int, Dict[int, int]]:
+        """{이전: {현재: 횟수}} (나온 적 없는 이전 숫자는 빈 딕셔너리)"""
+        return {
+            prev: (
+                {curr: int(count) for curr, count in enumerate(row)}
+                if row.any()
+                else {}
+            )
+            for prev, row in enumerate(self.transitions)
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON 저장용 상태 (체크포인트)"""
+        return {
+            "distribution": self.distribution.tolist(),
+            "transitions": self.transitions.tolist(),
+            "first": self.first,
+            "last": self.last,
+            "out_of_range": self.out_of_range,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "SequenceCounts":
+        return cls(
+            distribution=np.array(state["distribution"], dtype=np.int64),
+            transitions=np.array(state["transitions"], dtype=np.int64),
+            first=state["first"],
+            last=state["last"],
+            out_of_range=state.get("out_of_range", 0),
+        )
+
+
+def analyze_sequence(sequence: Iterable[int]) -> SequenceCounts:
+    """시퀀스 하나 집계"""
+    return SequenceCounts().update(sequence)
@@ -0,0 +1,249 @@
+"""
+Arduino Serial Simulation
+보드 하드웨어 TX 버퍼(64바이트)와 baud rate 전송 시간을 반영한 Serial 서브시스템
+
+주요 기능:
+- 고정 크기 TX 링 버퍼 (버퍼가 가득 차면 Serial.print()가 블로킹)
+- baud rate 기반 전송 시간 계산 (시작/정지 비트 포함 바이트당 10비트)
+- 교체 가능한 출력 싱크: discard, memory(링), file, pipe, console
+"""
+
+import sys
+from collections import deque
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+TX_BUFFER_SIZE = 64  # Arduino HardwareSerial 기본 TX 버퍼
+BITS_PER_BYTE = 10  # 8N1: 시작 비트 1 + 데이터 8 + 정지 비트 1
+COPY_CYCLES_PER_BYTE = 12  # 버퍼로 1바이트 복사하는 CPU 비용 (비용 모델이 없을 때)
+
+
+# ==================== 출력 싱크 ====================
+
+
+class SerialSink:
+    """Serial 출력 싱크 기본 클래스 (기본 동작: 버림)"""
+
+    name = "discard"
+
+    def write(self, text: str):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def history(self) -> List[str]:
+        """보관 중인 출력 (보관하지 않는 싱크는 빈 리스트)"""
+        return []
+
+    def clear(self):
+        pass
+
+
+class DiscardSink(SerialSink):
+    """모든 출력을 버리는 싱크 (대량 시뮬레이션용)"""
+
+
+class MemorySink(SerialSink):
+    """최근 출력만 보관하는 고정 크기 메모리 링"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1000):
+        self._ring = deque(maxlen=max_entries)
+
+    def write(self, text: str):
+        self._ring.append(text)
+
+    def history(self) -> List[str]:
+        return list(self._ring)
+
+    def clear(self):
+        self._ring.clear()
+
+
+class PipeSink(SerialSink):
+    """파일 객체(표준 출력, 서브프로세스 stdin 등)로 전달하는 싱크"""
+
+    name = "pipe"
+
+    def __init__(self, stream: TextIO, close_stream: bool = False):
+        self.stream = stream
+        self._close_stream = close_stream
+
+    def write(self, text: str):
+        self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        self.flush()
+        if self._close_stream:
+            self.stream.close()
+
+
+class FileSink(PipeSink):
+    """파일에 이어 쓰는 싱크"""
+
+    name = "file"
+
+    def __init__(self, path: str):
+        super().__init__(open(path, "a", encoding="utf-8"), close_stream=True)
+        self.path = path
+
+
+class TeeSink(SerialSink):
+    """여러 싱크로 동시에 출력"""
+
+    name = "tee"
+
+    def __init__(self, *sinks: SerialSink):
+        self.sinks = sinks
+
+    def write(self, text: str):
+        for sink in self.sinks:
+            sink.write(text)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+    def history(self) -> List[str]:
+        for sink in self.sinks:
+            entries = sink.history()
+            if entries:
+                return entries
+        return []
+
+    def clear(self):
+        for sink in self.sinks:
+            sink.clear()
+
+
+def create_serial_sink(spec: Union[str, SerialSink, TextIO] = "console") -> SerialSink:
+    """
+    싱크 생성 편의 함수
+    "console"(메모리 링 + 표준 출력, 기본값), "discard", "memory",
+    "file:<경로>", SerialSink 인스턴스 또는 파일 객체(pipe)
+    """
+    if isinstance(spec, SerialSink):
+        return spec
+    if not isinstance(spec, str):
+        return PipeSink(spec)
+    if spec == "console":
+        return TeeSink(MemorySink(), PipeSink(sys.stdout))
+    if spec == "discard":
+        return DiscardSink()
+    if spec == "memory":
+        return MemorySink()
+    if spec.startswith("file:"):
+        return FileSink(spec[len("file:") :])
+    raise ValueError(f"Unknown serial sink '{spec}'")
+
+
+# ==================== Serial 포트 ====================
+
+
+class SerialPort:
+    """
+    UART TX 경로 시뮬레이션
+    버퍼에 남은 전송 시간을 사이클 단위로 추적하여 O(1)로 블로킹 시간 계산:
+    쓰기 후 버퍼에 남는 전송 시간이 buffer_size 바이트 분량을 넘으면
+    그 차이만큼 CPU가 대기한다.
+    """
+
+    def __init__(
+        self,
+        clock_speed_hz: int,
+        sink: Optional[SerialSink] = None,
+        baud_rate: int = 9600,
+        tx_buffer_size: int = TX_BUFFER_SIZE,
+        copy_cycles_per_byte: int = COPY_CYCLES_PER_BYTE,
+    ):
+        self.clock_speed_hz = clock_speed_hz
+        self.copy_cycles_per_byte = copy_cycles_per_byte
+        self.sink = sink if sink is not None else DiscardSink()
+        self.tx_buffer_size = tx_buffer_size
+        self.begin(baud_rate)
+
+    def begin(self, baud_rate: int):
+        """Serial.begin() - baud rate 설정 및 버퍼/통계 초기화"""
+        self.baud_rate = baud_rate
+        self.cycles_per_byte = BITS_PER_BYTE * self.clock_speed_hz // baud_rate
+        self._tx_done_cycle = 0  # 마지막으로 대기열에 들어간 바이트의 전송 완료 시점
+        self.bytes_written = 0
+        self.blocked_cycles = 0
+        self.sink.clear()
+
+    def pending_bytes(self, now_cycle: int) -> int:
+        """TX 버퍼에 남아있는 (아직 전송되지 않은) 바이트 수"""
+        remaining = max(0, self._tx_done_cycle - now_cycle)
+        return -(-remaining // self.cycles_per_byte)
+
+    def available_for_write(self, now_cycle: int) -> int:
+        """Serial.availableForWrite()"""
+        return max(0, self.tx_buffer_size - self.pending_bytes(now_cycle))
+
+    def write(self, text: str, now_cycle: int) -> int:
+        """
+        Serial.print() - 텍스트를 싱크로 보내고 CPU가 소모한 사이클 반환
+        (버퍼 복사 비용 + 버퍼가 가득 찼을 때의 블로킹 시간)
+        """
+        byte_count = len(text.encode("utf-8"))
+        self.sink.write(text)
+        self.bytes_written += byte_count
+
+        wire_cycles = byte_count * self.cycles_per_byte
+        self._tx_done_cycle = max(self._tx_done_cycle, now_cycle) + wire_cycles
+
+        buffer_window = self.tx_buffer_size * self.cycles_per_byte
+        stall = max(0, self._tx_done_cycle - buffer_window - now_cycle)
+        self.blocked_cycles += stall
+
+        return byte_count * self.copy_cycles_per_byte + stall
+
+    def flush(self, now_cycle: int) -> int:
+        """Serial.flush() - 전송 완료까지 대기한 사이클 반환"""
+        self.sink.flush()
+        stall = max(0, self._tx_done_cycle - now_cycle)
+        self.blocked_cycles += stall
+        return stall
+
+    def getstate(self) -> tuple:
+        """전송 상태 캡처 (싱크 내용은 포함하지 않음)"""
+        return (
+            self.baud_rate,
+            self.cycles_per_byte,
+            self._tx_done_cycle,
+            self.bytes_written,
+            self.blocked_cycles,
+        )
+
+    def setstate(self, state: tuple):
+        """getstate()로 캡처한 전송 상태 복원"""
+        (
+            self.baud_rate,
+            self.cycles_per_byte,
+            self._tx_done_cycle,
+            self.bytes_written,
+            self.blocked_cycles,
+        ) = state
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Serial 전송 통계"""
+        return {
+            "baud_rate": self.baud_rate,
+            "sink": self.sink.name,
+            "bytes_written": self.bytes_written,
+            "blocked_cycles": self.blocked_cycles,
+            "transmit_time_seconds": (
+                self.bytes_written * self.cycles_per_byte / self.clock_speed_hz
+            ),
+        }
@@ -9,17 +9,19 @@ Arduino Simulation Runner
 - 성능 벤치마킹
 """
 
-import json
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields, replace
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
 import pandas as pd
 import plotly.express as px
+from checkpoint import load_checkpoint
+from latency_histogram import LatencyHistogram
 from random_generator_sim import create_simulation
+from results_io import save_results_file
 
 
 @dataclass
@@ -33,6 +35,17 @@ class SimulationConfig:
     output_dir: str = "src/results"
     parallel_workers: int = 1
     progress_callback: Optional[Callable] = None
+    clock_mode: str = "realtime"  # "realtime" 또는 "virtual" (delay() 미대기)
+    time_dilation: float = 0.0  # 가상 클럭에서 시뮬레이션 1초당 실제 sleep 초
+    rng_backend: str = "mt19937"  # mt19937, newlib, avr, esp32, board(보드 기본)
+    instrumentation: str = "full"  # "off", "aggregate", "full"
+    serial_sink: str = "console"  # "console", "discard", "memory", "file:<경로>"
+    engine: str = "scalar"  # "scalar" 또는 "numpy" (청크 단위 벡터 엔진)
+    checkpoint_every: int = 0  # N회마다 체크포인트 저장 (0 = 종료 시에만)
+    checkpoint_path: Optional[str] = None  # 지정하면 체크포인트 저장 (재개/연장용)
+    timing_mode: str = "every"  # 생성 시간 측정: "every", "sampled", "block", "off"
+    timing_interval: int = 64  # sampled: N회 중 1회 측정, block: N회 묶음 측정
+    results_format: str = "json"  # 결과 파일 형식: "json", "npz"(열 배열), "both"
 
 
 @dataclass
@@ -65,21 +78,41 @@ class SimulationRunner:
         print(f"Config: {self.config.iterations:,} iterations, seed={self.config.seed}")
 
     def run_single_simulation(
-        self, config: "Optional[SimulationConfig]" = None
+        self,
+        config: "Optional[SimulationConfig]" = None,
+        resume_from: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """단일 시뮬레이션 실행"""
+        """단일 시뮬레이션 실행 (resume_from: 불러온 체크포인트에서 이어서 실행)"""
         if config is None:
             config = self.config
 
         print("\n=== Single Simulation ===")
         print(f"Iterations: {config.iterations:,}")
         print(f"Seed: {config.seed}")
+        if config.checkpoint_every and not config.checkpoint_path:
+            config = replace(
+                config,
+                checkpoint_path=str(
+                    Path(config.output_dir)
+                    / f"checkpoint_{config.seed}_{time.strftime('%Y%m%d_%H%M%S')}.json"
+                ),
+            )
 
         # 시뮬레이션 환경 생성
-        arduino, simulator = create_simulation(seed=config.seed)
+        arduino, simulator = create_simulation(
+            seed=config.seed,
+            clock_mode=config.clock_mode,
+            time_dilation=config.time_dilation,
+            rng_backend=config.rng_backend,
+            instrumentation=config.instrumentation,
+            serial_sink=config.serial_sink,
+            timing_mode=config.timing_mode,
+            timing_interval=config.timing_interval,
+        )
 
-        # Arduino setup 시뮬레이션
-        simulator.simulate_arduino_setup()
+        # Arduino setup 시뮬레이션 (재개 시에는 체크포인트가 RNG/카운터 상태 복원)
+        if resume_from is None:
+            simulator.simulate_arduino_setup()
 
         # 진행 상태 초기화
         self.progress = SimulationProgress(
@@ -91,11 +124,19 @@ class SimulationRunner:
         try:
             # 대량 시뮬레이션 실행
             results = simulator.run_batch_simulation(
-                iterations=config.iterations, show_progress=config.show_progress
+                iterations=config.iterations,
+                show_progress=config.show_progress,
+                engine=config.engine,
+                checkpoint_path=config.checkpoint_path,
+                checkpoint_every=config.checkpoint_every,
+                resume_from=resume_from,
+                checkpoint_metadata={"simulation_config": self._config_state(config)},
             )
 
             # 추가 메타데이터
             results["simulation_config"] = asdict(config)
+            if config.checkpoint_path:
+                results["checkpoint_file"] = config.checkpoint_path
             results["runner_info"] = {
                 "runner_version": "1.0.0",
                 "execution_timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -112,6 +153,47 @@ class SimulationRunner:
         finally:
             self.is_running = False
 
+    def resume_simulation(
+        self, checkpoint_path: str, additional_iterations: int = 0
+    ) -> Dict[str, Any]:
+        """
+        체크포인트에서 중단된 시뮬레이션 재개
+        additional_iterations > 0이면 저장된 목표 반복 수를 그만큼 늘려 실행
+        """
+        checkpoint = load_checkpoint(checkpoint_path)
+        saved_config = checkpoint["metadata"].get("simulation_config", {})
+        known = {f.name for f in fields(SimulationConfig)}
+        config = replace(
+            self.config,
+            **{name: value for name, value in saved_config.items() if name in known},
+        )
+        config = replace(
+            config,
+            iterations=checkpoint["iterations"] + additional_iterations,
+            checkpoint_path=str(checkpoint_path),
+        )
+
+        print(
+            f"\nResuming from {checkpoint_path} "
+            f"({checkpoint['done']:,}/{config.iterations:,} iterations done)"
+        )
+        return self.run_single_simulation(config, resume_from=checkpoint)
+
+    def extend_simulation(
+        self, checkpoint_path: str, additional_iterations: int
+    ) -> Dict[str, Any]:
+        """완료된 실행의 최종 체크포인트에서 N회 더 실행 (한 번에 실행한 결과와 동일)"""
+        return self.resume_simulation(checkpoint_path, additional_iterations)
+
+    @staticmethod
+    def _config_state(config: "SimulationConfig") -> Dict[str, Any]:
+        """체크포인트에 저장할 설정 (콜백 제외)"""
+        return {
+            name: value
+            for name, value in asdict(config).items()
+            if name != "progress_callback"
+        }
+
     def run_multiple_simulations(
         self, seeds: List[int], config: "Optional[SimulationConfig]" = None
     ) -> List[Dict[str, Any]]:
@@ -136,6 +218,15 @@ class SimulationRunner:
                 show_progress=config.show_progress,
                 save_results=config.save_results,
                 output_dir=config.output_dir,
+                clock_mode=config.clock_mode,
+                time_dilation=config.time_dilation,
+                rng_backend=config.rng_backend,
+                instrumentation=config.instrumentation,
+                serial_sink=config.serial_sink,
+                engine=config.engine,
+                timing_mode=config.timing_mode,
+                timing_interval=config.timing_interval,
+                results_format=config.results_format,
             )
 
             # 시뮬레이션 실행
@@ -176,13 +267,33 @@ class SimulationRunner:
                 show_progress=False,  # 병렬 실행 시 진행률 표시 비활성화
                 save_results=False,  # 개별 저장 비활성화
                 output_dir=config.output_dir,
+                clock_mode=config.clock_mode,
+                time_dilation=config.time_dilation,
+                rng_backend=config.rng_backend,
+                instrumentation=config.instrumentation,
+                serial_sink=config.serial_sink,
+                engine=config.engine,
+                timing_mode=config.timing_mode,
+                timing_interval=config.timing_interval,
+                results_format=config.results_format,
             )
 
-            arduino, simulator = create_simulation(seed=seed)
+            arduino, simulator = create_simulation(
+                seed=seed,
+                clock_mode=sim_config.clock_mode,
+                time_dilation=sim_config.time_dilation,
+                rng_backend=sim_config.rng_backend,
+                instrumentation=sim_config.instrumentation,
+                serial_sink=sim_config.serial_sink,
+                timing_mode=sim_config.timing_mode,
+                timing_interval=sim_config.timing_interval,
+            )
             simulator.simulate_arduino_setup()
 
             result = simulator.run_batch_simulation(
-                iterations=sim_config.iterations, show_progress=False
+                iterations=sim_config.iterations,
+                show_progress=False,
+                engine=sim_config.engine,
             )
 
             result["simulation_config"] = asdict(sim_config)
@@ -272,9 +383,25 @@ class SimulationRunner:
                 for r in results_list
                 if key in r["performance_metrics"]
             ]
-            if values:
+            if values and all(isinstance(v, (int, float)) for v in values):
                 performance_metrics[key] = sum(values) / len(values)
 
+        # 생성 시간 백분위는 평균이 아니라 히스토그램을 병합해서 계산
+        histograms = [
+            LatencyHistogram.from_state(r["latency_histogram"])
+            for r in results_list
+            if "latency_histogram" in r
+        ]
+        if histograms:
+            merged = histograms[0]
+            for histogram in histograms[1:]:
+                merged.merge(histogram)
+            latency = merged.summary_us()
+            for name in ("min", "p50", "p90", "p99", "p99.9", "max"):
+                key = f"{name.replace('.', '_')}_generation_time_microseconds"
+                performance_metrics[key] = latency[name]
+            performance_metrics["avg_generation_time_microseconds"] = latency["mean"]
+
         return {
             "combined_analysis": {
                 "total_simulations": len(results_list),
@@ -328,24 +455,22 @@ class SimulationRunner:
         """단일 시뮬레이션 결과 저장"""
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         seed = results.get("hardware_simulation", {}).get("random_seed", "unknown")
-        filename = f"{self.config.output_dir}/simulation_single_{seed}_{timestamp}.json"
+        stem = f"{self.config.output_dir}/simulation_single_{seed}_{timestamp}"
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        filenames = save_results_file(results, stem, self.config.results_format)
 
-        print(f"Results saved to: {filename}")
-        return filename
+        print(f"Results saved to: {', '.join(filenames)}")
+        return filenames[0]
 
     def _save_combined_results(self, results: Dict[str, Any]) -> str:
         """통합 시뮬레이션 결과 저장"""
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         num_sims = results.get("combined_analysis", {}).get("total_simulations", 0)
-        filename = f"{self.config.output_dir}/simulation_combined_{num_sims}sims_{timestamp}.json"
-
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        stem = (
+            f"{self.config.output_dir}/simulation_combined_{num_sims}sims_{timestamp}"
+        )
 
-        return filename
+        return save_results_file(results, stem, self.config.results_format)[0]
 
     def stop_simulation(self):
         """실행 중인 시뮬레이션 중단"""
@@ -0,0 +1,156 @@
+"""
+Arduino Call Stack Simulation
+함수 호출 프레임의 SRAM 점유 모델
+
+SRAM 구성: 전역/static 변수(sram_usage)는 아래에서, 스택은 위에서 자라며
+두 영역이 만나면 스택 오버플로우 (AVR에서는 전역 변수가 조용히 덮어써짐)
+
+주요 기능:
+- 프레임 push/pop 및 현재/최대 깊이, 스택 바이트 추적
+- 샘플(숫자 생성 1회)별 최대 깊이 / 최대 SRAM 사용량 히스토그램
+- 남은 SRAM을 넘는 프레임 수 (오버플로우) 집계
+- 같은 크기 프레임을 쌓았다 모두 반환하는 샘플 여러 개를 NumPy로 일괄 기록
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+@dataclass
+class CallStack:
+    """시뮬레이션 콜 스택 (바이트 단위)"""
+
+    depth: int = 0
+    bytes: int = 0
+    max_depth: int = 0
+    max_bytes: int = 0
+    overflows: int = 0  # 남은 SRAM을 넘어선 프레임 push 횟수
+    samples: int = 0
+    depth_histogram: List[int] = field(default_factory=lambda: [0])
+    sram_histogram: Dict[int, int] = field(default_factory=dict)
+    _sample_depth: int = 0  # 현재 샘플 구간의 최대 깊이
+    _sample_bytes: int = 0
+
+    def push(self, frame_bytes: int, free_bytes: int) -> bool:
+        """프레임 push (free_bytes: 전역 변수를 제외한 남은 SRAM), 넘치면 False"""
+        self.depth += 1
+        self.bytes += frame_bytes
+        if self.depth > self._sample_depth:
+            self._sample_depth = self.depth
+        if self.bytes > self._sample_bytes:
+            self._sample_bytes = self.bytes
+        if self.bytes > free_bytes:
+            self.overflows += 1
+            return False
+        return True
+
+    def pop(self, frame_bytes: int):
+        self.depth -= 1
+        self.bytes -= frame_bytes
+
+    def end_sample(self, static_bytes: int):
+        """샘플 구간의 최대 깊이와 최대 SRAM 사용량(전역 + 스택)을 히스토그램에 기록"""
+        depth = self._sample_depth
+        histogram = self.depth_histogram
+        if depth >= len(histogram):
+            histogram.extend([0] * (depth + 1 - len(histogram)))
+        histogram[depth] += 1
+
+        sram = static_bytes + self._sample_bytes
+        self.sram_histogram[sram] = self.sram_histogram.get(sram, 0) + 1
+
+        self.max_depth = max(self.max_depth, depth)
+        self.max_bytes = max(self.max_bytes, self._sample_bytes)
+        self.samples += 1
+        self._sample_depth = self.depth
+        self._sample_bytes = self.bytes
+
+    def record_samples(
+        self,
+        frames: np.ndarray,
+        frame_bytes: int,
+        static_bytes: int,
+        free_bytes: int,
+    ):
+        """
+        샘플마다 frame_bytes 프레임을 frames[i]개 push했다가 모두 pop하고 end_sample()한
+        것과 같은 결과를 한 번에 기록 (현재 쌓인 프레임은 그대로)
+        """
+        frames = np.asarray(frames, dtype=np.int64).ravel()
+        if frames.size == 0:
+            return
+
+        depths = self.depth + frames
+        stack_bytes = self.bytes + frames * frame_bytes
+        # 첫 샘플에는 직전 end_sample() 이후의 최대값도 포함
+        depths[0] = max(depths[0], self._sample_depth)
+        stack_bytes[0] = max(stack_bytes[0], self._sample_bytes)
+
+        # j번째 push 후 스택이 self.bytes + j * frame_bytes > free_bytes이면 오버플로우
+        if frame_bytes > 0:
+            first_overflow = max((free_bytes - self.bytes) // frame_bytes + 1, 1)
+            self.overflows += int(np.maximum(frames - first_overflow + 1, 0).sum())
+        elif self.bytes > free_bytes:
+            self.overflows += int(frames.sum())
+
+        counts = np.bincount(depths).tolist()
+        histogram = self.depth_histogram
+        if len(counts) > len(histogram):
+            histogram.extend([0] * (len(counts) - len(histogram)))
+        for depth, count in enumerate(counts):
+            histogram[depth] += count
+
+        sram_values, sram_counts = np.unique(
+            static_bytes + stack_bytes, return_counts=True
+        )
+        for sram, count in zip(sram_values.tolist(), sram_counts.tolist()):
+            self.sram_histogram[sram] = self.sram_histogram.get(sram, 0) + count
+
+        self.max_depth = max(self.max_depth, int(depths.max()))
+        self.max_bytes = max(self.max_bytes, int(stack_bytes.max()))
+        self.samples += frames.size
+        self._sample_depth = self.depth
+        self._sample_bytes = self.bytes
+
+    def clear_stats(self):
+        """통계만 초기화 (현재 쌓인 프레임은 유지)"""
+        self.max_depth = self.max_bytes = self.overflows = self.samples = 0
+        self.depth_histogram = [0]
+        self.sram_histogram = {}
+        self._sample_depth = self.depth
+        self._sample_bytes = self.bytes
+
+    def copy(self) -> "CallStack":
+        return CallStack(
+            self.depth,
+            self.bytes,
+            self.max_depth,
+            self.max_bytes,
+            self.overflows,
+            self.samples,
+            list(self.depth_histogram),
+            dict(self.sram_histogram),
+            self._sample_depth,
+            self._sample_bytes,
+        )
+
+    def to_dict(self, static_bytes: int, sram_bytes: int) -> Dict[str, Any]:
+        """스택 사용 요약 (peak_sram: 전역 변수 + 최대 스택)"""
+        peak_sram = static_bytes + self.max_bytes
+        return {
+            "samples": self.samples,
+            "max_depth": self.max_depth,
+            "peak_stack_bytes": self.max_bytes,
+            "peak_sram_bytes": peak_sram,
+            "peak_sram_percent": peak_sram / sram_bytes * 100,
+            "headroom_bytes": sram_bytes - peak_sram,
+            "overflows": self.overflows,
+            "depth_histogram": {
+                depth: count
+                for depth, count in enumerate(self.depth_histogram)
+                if count
+            },
+            "sram_histogram": dict(sorted(self.sram_histogram.items())),
+        }
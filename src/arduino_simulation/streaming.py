@@ -0,0 +1,44 @@
+"""
+Streaming Generation
+생성기를 전체 시퀀스를 만들지 않고 NumPy 청크 단위로 읽는 이터레이터
+
+청크는 필요할 때 하나씩 생성되므로(지연 생성) 분석기/저장기가 고정 메모리로
+소비할 수 있고, iterations=None이면 끝없이 생성한다 (소크 테스트용).
+"""
+
+from typing import Callable, Iterable, Iterator, Optional
+
+import numpy as np
+
+DEFAULT_STREAM_CHUNK_SIZE = 1 << 16
+
+
+def iter_generated_chunks(
+    generate: Callable[[int], int],
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    iterations: Optional[int] = None,
+    previous: int = -1,
+) -> Iterator[np.ndarray]:
+    """
+    generate(이전 숫자)를 반복 호출해 chunk_size개씩 uint8 배열로 yield
+    (iterations=None이면 무한, 마지막 청크는 더 짧을 수 있음)
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    remaining = iterations
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        values = [0] * size
+        for i in range(size):
+            previous = generate(previous)
+            values[i] = previous
+        yield np.array(values, dtype=np.uint8)
+        if remaining is not None:
+            remaining -= size
+
+
+def iter_numbers_from_chunks(chunks: Iterable[np.ndarray]) -> Iterator[int]:
+    """청크 스트림을 숫자 하나씩 풀어서 yield"""
+    for chunk in chunks:
+        yield from chunk.tolist()
@@ -0,0 +1,35 @@
+"""
+Generation Timing
+생성 시간 측정 방식 및 타이머 호출 오버헤드 보정
+
+perf_counter_ns() 두 번의 호출 비용은 룩업 한 번과 비슷하므로
+매번 측정하면 측정 자체가 결과를 왜곡한다. SAMPLED는 N회 중 1회만,
+BLOCK은 N회 묶음 전체를 측정해 나누며, 기록값에서는 보정한 타이머 오버헤드를 뺀다.
+"""
+
+import time
+from enum import Enum
+from functools import lru_cache
+
+DEFAULT_TIMING_INTERVAL = 64
+
+
+class TimingMode(Enum):
+    """생성 시간 측정 방식"""
+
+    EVERY = "every"  # 매 생성마다 측정 (기존 동작)
+    SAMPLED = "sampled"  # N회 중 1회만 측정
+    BLOCK = "block"  # N회 묶음을 측정해 1회 평균으로 기록
+    OFF = "off"  # 측정 안 함
+
+
+@lru_cache(maxsize=None)
+def timer_overhead_ns(samples: int = 2001) -> int:
+    """연속한 perf_counter_ns() 두 호출 간격의 중앙값 (측정 1회에 더해지는 시간)"""
+    clock = time.perf_counter_ns
+    deltas = []
+    for _ in range(samples):
+        start = clock()
+        deltas.append(clock() - start)
+    deltas.sort()
+    return deltas[len(deltas) // 2]
@@ -0,0 +1,190 @@
+"""
+Packed Trit Sequence
+0/1/2 시퀀스를 바이트당 5개(3^5 = 243)로 압축 저장하는 컨테이너
+
+list[int]는 원소당 8바이트 포인터 + int 객체가 필요하지만
+TritSequence는 원소당 0.2바이트 (10^9개 약 200MB)
+
+- append / extend (NumPy 벡터 압축)
+- 인덱싱, 슬라이싱 (TritSequence 반환), 반복, count()
+- np.asarray(seq) 또는 to_numpy()로 uint8 배열, packed로 압축 바이트 뷰
+"""
+
+from typing import Iterable, Iterator, List, Union
+
+import numpy as np
+
+TRITS_PER_BYTE = 5
+_POWERS = 3 ** np.arange(TRITS_PER_BYTE, dtype=np.uint8)  # 1, 3, 9, 27, 81
+# 압축 바이트 -> 5개 값 (243 x 5), 바이트별 0/1/2 개수 (243 x 3)
+_UNPACK = (np.arange(3**TRITS_PER_BYTE)[:, None] // _POWERS % 3).astype(np.uint8)
+_DIGIT_COUNTS = np.stack([(_UNPACK == v).sum(axis=1) for v in range(3)], axis=1)
+_PLACE = [int(p) for p in _POWERS]
+
+
+def pack_trits(values: np.ndarray) -> np.ndarray:
+    """0/1/2 배열을 바이트당 5개로 압축 (꼬리는 0으로 채움)"""
+    values = np.asarray(values, dtype=np.uint8).ravel()
+    padded = np.zeros(-(-values.size // TRITS_PER_BYTE) * TRITS_PER_BYTE, np.uint8)
+    padded[: values.size] = values
+    groups = padded.reshape(-1, TRITS_PER_BYTE)
+    packed = groups[:, 0].copy()
+    for k in range(1, TRITS_PER_BYTE):
+        packed += groups[:, k] * _POWERS[k]
+    return packed
+
+
+def unpack_trits(packed: np.ndarray, length: int) -> np.ndarray:
+    """압축 바이트에서 앞쪽 length개 값 복원"""
+    return _UNPACK[packed].ravel()[:length]
+
+
+class TritSequence:
+    """0/1/2 값만 담는 압축 시퀀스"""
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._packed = np.zeros(16, dtype=np.uint8)
+        self._length = 0
+        self._partial = 0  # 채우는 중인 마지막 바이트 값 (append 시 NumPy 접근 최소화)
+        self.extend(values)
+
+    def _reserve(self, length: int):
+        needed = -(-length // TRITS_PER_BYTE)
+        if needed > self._packed.size:
+            grown = np.zeros(max(needed, self._packed.size * 2), dtype=np.uint8)
+            grown[: self._packed.size] = self._packed
+            self._packed = grown
+
+    def append(self, value: int):
+        if not 0 <= value <= 2:
+            raise ValueError(f"TritSequence values must be 0, 1 or 2 (got {value})")
+        digit = self._length % TRITS_PER_BYTE
+        self._partial += value * _PLACE[digit]
+        self._length += 1
+        if digit == TRITS_PER_BYTE - 1:
+            self._store_partial()
+            self._partial = 0
+
+    def _store_partial(self):
+        self._reserve(self._length)
+        self._packed[(self._length - 1) // TRITS_PER_BYTE] = self._partial
+
+    def _flush(self):
+        """채우는 중인 바이트를 배열에 기록"""
+        if self._length % TRITS_PER_BYTE:
+            self._store_partial()
+
+    def _load_partial(self):
+        """배열에 직접 기록한 뒤 채우는 중인 바이트 값 동기화"""
+        if self._length % TRITS_PER_BYTE:
+            self._partial = int(self._packed[self._length // TRITS_PER_BYTE])
+        else:
+            self._partial = 0
+
+    def extend(self, values: Iterable[int]):
+        """여러 값 추가 (배열은 바이트 경계부터 한 번에 압축)"""
+        if isinstance(values, TritSequence):
+            values = values.to_numpy()
+        values = np.asarray(
+            values if isinstance(values, np.ndarray) else list(values), dtype=np.int64
+        ).ravel()
+        if values.size == 0:
+            return
+        if values.min() < 0 or values.max() > 2:
+            raise ValueError("TritSequence values must be 0, 1 or 2")
+
+        # 채우던 바이트를 먼저 마저 채움
+        head = min(-self._length % TRITS_PER_BYTE, values.size)
+        for value in values[:head].tolist():
+            self.append(value)
+        values = values[head:]
+        if values.size == 0:
+            return
+
+        start = self._length // TRITS_PER_BYTE
+        self._reserve(self._length + values.size)
+        packed = pack_trits(values)
+        self._packed[start : start + packed.size] = packed
+        self._length += values.size
+        self._load_partial()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[int, "TritSequence"]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step == 1 and start % TRITS_PER_BYTE == 0 and stop > start:
+                # 바이트 경계에서 시작하면 압축 상태 그대로 복사
+                result = TritSequence()
+                first, last = start // TRITS_PER_BYTE, -(-stop // TRITS_PER_BYTE)
+                result._packed = self.packed[first:last].copy()
+                result._length = stop - start
+                tail = result._length % TRITS_PER_BYTE
+                if tail:
+                    result._packed[-1] %= 3**tail
+                result._load_partial()
+                return result
+            return TritSequence(self.to_numpy()[key])
+
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("TritSequence index out of range")
+        index, digit = divmod(key, TRITS_PER_BYTE)
+        return int(_UNPACK[self.packed[index], digit])
+
+    def __iter__(self) -> Iterator[int]:
+        # 블록 단위로 풀어서 반복 (전체를 한 번에 풀지 않음)
+        block = TRITS_PER_BYTE << 14
+        for start in range(0, self._length, block):
+            yield from self[start : start + block].to_numpy().tolist()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TritSequence):
+            return self._length == other._length and bool(
+                np.array_equal(self.packed, other.packed)
+            )
+        try:
+            return len(other) == self._length and self.tolist() == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        preview = self[:10].tolist()
+        suffix = ", ..." if self._length > 10 else ""
+        return f"TritSequence({preview}{suffix}, length={self._length:,})"
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self.to_numpy()
+        return values if dtype is None else values.astype(dtype)
+
+    @property
+    def packed(self) -> np.ndarray:
+        """압축 바이트 뷰 (읽기 전용)"""
+        self._flush()
+        view = self._packed[: self.nbytes].view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def nbytes(self) -> int:
+        """실제 사용 중인 압축 바이트 수"""
+        return -(-self._length // TRITS_PER_BYTE)
+
+    def to_numpy(self) -> np.ndarray:
+        """uint8 배열로 복원"""
+        return unpack_trits(self.packed, self._length)
+
+    def tolist(self) -> List[int]:
+        return self.to_numpy().tolist()
+
+    def count(self, value: int) -> int:
+        """값 개수 (풀지 않고 바이트 히스토그램으로 계산)"""
+        if value not in (0, 1, 2):
+            return 0
+        byte_counts = np.bincount(self.packed, minlength=3**TRITS_PER_BYTE)
+        total = int(byte_counts @ _DIGIT_COUNTS[:, value])
+        if value == 0:
+            total -= self.nbytes * TRITS_PER_BYTE - self._length  # 꼬리 채움 0 제외
+        return total
@@ -0,0 +1,38 @@
+"""
+Unit tests for the ADC noise simulation
+"""
+
+import sys
+from pathlib import Path
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from adc_sim import AdcNoiseModel
+from arduino_mock import ArduinoUnoR4WiFiMock
+
+
+class TestAdc:
+
+    def test_burst_matches_repeated_reads(self):
+        """테스트: analogReadBurst()가 analogRead() 반복 호출과 같은 값"""
+        model = AdcNoiseModel(quantization=True, drift_std=0.05, block_size=256)
+        single = ArduinoUnoR4WiFiMock(seed=5, serial_sink="discard", adc_noise=model)
+        burst = ArduinoUnoR4WiFiMock(seed=5, serial_sink="discard", adc_noise=model)
+        single.analog_pins_value[0] = burst.analog_pins_value[0] = 2048
+
+        expected = [single.analogRead(0) for _ in range(1000)]
+        assert burst.analogReadBurst(0, 700).tolist() == expected[:700]
+        assert [burst.analogRead(0) for _ in range(300)] == expected[700:]
+        assert burst.function_calls["analogRead"] == 1000
+
+    def test_readings_are_clamped_to_adc_range(self):
+        """테스트: 노이즈가 더해져도 0 ~ adc_max_value 범위 유지"""
+        arduino = ArduinoUnoR4WiFiMock(seed=5, serial_sink="discard")
+        arduino.analog_pins_value[1] = arduino.specs.adc_max_value
+
+        readings = arduino.analogReadBurst(1, 10_000)
+        assert readings.min() >= arduino.specs.adc_max_value - 20
+        assert readings.max() == arduino.specs.adc_max_value
+        assert arduino.analogRead(1) <= arduino.specs.adc_max_value
@@ -0,0 +1,335 @@
+"""
+Unit tests for the Arduino Uno R4 WiFi mock
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import (
+    ArduinoUnoR4WiFiMock,
+    ClockMode,
+    InstrumentationLevel,
+    InterruptMode,
+    MockPool,
+    PinMode,
+    ResetScope,
+)
+from board_profiles import get_board_profile
+from eeprom_sim import ERASED_VALUE
+
+
+class TestVirtualClock:
+
+    def test_delay_does_not_sleep(self):
+        """테스트: 가상 클럭에서는 delay()가 실제로 대기하지 않음"""
+        arduino = ArduinoUnoR4WiFiMock(seed=1, clock_mode=ClockMode.VIRTUAL)
+
+        start = time.perf_counter()
+        arduino.delay(10_000)
+        assert time.perf_counter() - start < 1.0
+
+    def test_millis_follows_cycle_clock(self):
+        """테스트: millis()/micros()가 누적 사이클에서 계산됨"""
+        arduino = ArduinoUnoR4WiFiMock(seed=1, clock_mode="virtual")
+
+        arduino.delay(250)
+        assert arduino.millis() == 250
+        assert 250_000 <= arduino.micros() < 250_010
+        assert arduino.get_simulated_time_seconds() >= 0.25
+
+    def test_clock_survives_counter_reset(self):
+        """테스트: 성능 카운터 리셋 후에도 가상 시간은 단조 증가"""
+        arduino = ArduinoUnoR4WiFiMock(seed=1, clock_mode=ClockMode.VIRTUAL)
+
+        arduino.delay(100)
+        arduino.reset_performance_counters()
+        assert arduino.instruction_count == 0
+        assert arduino.millis() >= 100
+
+
+class TestRandomStreams:
+
+    def test_same_seed_same_sequence(self):
+        """테스트: 같은 시드의 인스턴스는 같은 시퀀스 생성"""
+        a = ArduinoUnoR4WiFiMock(seed=42)
+        b = ArduinoUnoR4WiFiMock(seed=42)
+
+        assert [a.random_range(0, 3) for _ in range(50)] == [
+            b.random_range(0, 3) for _ in range(50)
+        ]
+
+    def test_instances_are_isolated(self):
+        """테스트: 인터리빙 호출이 다른 인스턴스 시퀀스에 영향 없음"""
+        reference = ArduinoUnoR4WiFiMock(seed=7)
+        expected = [reference.random_range(0, 3) for _ in range(50)]
+
+        a = ArduinoUnoR4WiFiMock(seed=7)
+        b = ArduinoUnoR4WiFiMock(seed=8)
+        interleaved = []
+        for _ in range(50):
+            interleaved.append(a.random_range(0, 3))
+            b.random_range(0, 3)
+            b.analogRead(0)
+
+        assert interleaved == expected
+
+    def test_state_capture_and_restore(self):
+        """테스트: 생성기 상태 캡처 후 복원하면 같은 값 재생성"""
+        arduino = ArduinoUnoR4WiFiMock(seed=3)
+        state = arduino.get_random_state()
+        first = [arduino.random_range(0, 100) for _ in range(20)]
+
+        arduino.set_random_state(state)
+        assert [arduino.random_range(0, 100) for _ in range(20)] == first
+
+    def test_batch_matches_single_calls(self):
+        """테스트: random_range_batch()가 단일 호출 n번과 같은 값/카운터 생성"""
+        single = ArduinoUnoR4WiFiMock(seed=11)
+        batch = ArduinoUnoR4WiFiMock(seed=11)
+
+        for low, high, n in [(0, 3, 1000), (0, 100, 257), (5, 6, 10), (3, 3, 4)]:
+            expected = [single.random_range(low, high) for _ in range(n)]
+            assert batch.random_range_batch(low, high, n).tolist() == expected
+
+        # 이후 스트림도 이어서 동일해야 함
+        assert batch.random_range(0, 1000) == single.random_range(0, 1000)
+        assert batch.function_calls == single.function_calls
+        assert batch.instruction_count == single.instruction_count
+
+
+class TestInstrumentation:
+
+    def _exercise(self, arduino):
+        arduino.pinMode(2, PinMode.OUTPUT)
+        values = [arduino.random_range(0, 3) for _ in range(100)]
+        for value in values:
+            arduino.digitalWrite(2, value)
+            arduino.digitalRead(2)
+        arduino.millis()
+        arduino.micros()
+        return values
+
+    def test_aggregate_matches_full_totals(self):
+        """테스트: AGGREGATE 모드가 FULL과 같은 통계를 지연 집계"""
+        full = ArduinoUnoR4WiFiMock(seed=5, clock_mode=ClockMode.VIRTUAL)
+        lazy = ArduinoUnoR4WiFiMock(
+            seed=5, clock_mode=ClockMode.VIRTUAL, instrumentation="aggregate"
+        )
+
+        assert self._exercise(lazy) == self._exercise(full)
+        full_stats = full.get_performance_stats()
+        lazy_stats = lazy.get_performance_stats()
+        assert lazy_stats["function_calls"] == full_stats["function_calls"]
+        assert lazy_stats["instruction_count"] == full_stats["instruction_count"]
+        assert lazy.millis() == full.millis()
+
+    def test_off_skips_hot_path_counters(self):
+        """테스트: OFF 모드는 같은 값을 생성하지만 핫 패스를 계측하지 않음"""
+        full = ArduinoUnoR4WiFiMock(seed=5)
+        fast = ArduinoUnoR4WiFiMock(seed=5, instrumentation=InstrumentationLevel.OFF)
+
+        assert self._exercise(fast) == self._exercise(full)
+        assert "random" not in fast.get_performance_stats()["function_calls"]
+
+        fast.set_instrumentation(InstrumentationLevel.FULL)
+        fast.random_range(0, 3)
+        assert fast.get_performance_stats()["function_calls"]["random"] == 1
+
+    def test_timer_fires_on_time_at_every_level(self):
+        """테스트: AGGREGATE에서도 타이머가 FULL과 같은 시점에 실행, OFF는 예약 거부"""
+        fired = {}
+        for level in ("full", "aggregate"):
+            arduino = ArduinoUnoR4WiFiMock(
+                seed=1, clock_mode=ClockMode.VIRTUAL, instrumentation=level
+            )
+            ticks = fired[level] = []
+            arduino.attachTimerInterrupt(
+                10, lambda a=arduino, t=ticks: t.append(a.instruction_count)
+            )
+            for _ in range(10000):
+                arduino.random_range(0, 3)
+        assert len(fired["full"]) > 400
+        assert fired["aggregate"] == fired["full"]
+
+        fast = ArduinoUnoR4WiFiMock(seed=1, instrumentation=InstrumentationLevel.OFF)
+        with pytest.raises(ValueError):  # OFF는 타이머 거부
+            fast.attachTimerInterrupt(10, lambda: None)
+        arduino.detachTimerInterrupt(0)
+        arduino.set_pin_input(2, 1, delay_us=5)
+        with pytest.raises(ValueError):  # 대기 중인 이벤트가 있으면 OFF 거부
+            arduino.set_instrumentation(InstrumentationLevel.OFF)
+
+
+class TestSnapshot:
+
+    def test_restore_replays_identical_draws(self):
+        """테스트: 스냅샷 복원 후 같은 random() 시퀀스와 카운터 재현"""
+        arduino = ArduinoUnoR4WiFiMock(seed=7, serial_sink="discard")
+        arduino.pinMode(13, PinMode.OUTPUT)
+        arduino.digitalWrite(13, 1)
+        arduino.allocate_sram(128)
+        snap = arduino.snapshot()
+
+        first = [arduino.random_range(0, 3) for _ in range(1000)]
+        arduino.digitalWrite(13, 0)
+        arduino.allocate_sram(64)
+
+        arduino.restore(snap)
+        assert arduino.digital_pins_value[13] == 1
+        assert arduino.sram_usage == 128
+        assert [arduino.random_range(0, 3) for _ in range(1000)] == first
+
+    def test_eeprom_is_copy_on_write(self):
+        """테스트: EEPROM은 스냅샷과 공유되다가 쓰기 시에만 복사"""
+        arduino = ArduinoUnoR4WiFiMock(
+            seed=7, serial_sink="discard", eeprom_fill_value=ERASED_VALUE
+        )
+        arduino.EEPROM_write(0, 1)
+        snap = arduino.snapshot()
+        # 쓰기가 없으면 다음 스냅샷도 같은 버퍼를 공유
+        assert arduino.snapshot().eeprom[0] is snap.eeprom[0]
+
+        branch = arduino.fork(snap)
+        branch.EEPROM_write(0, 2)
+        arduino.EEPROM_update(1, 3)
+
+        snap_data, _ = snap.eeprom
+        assert snap_data[0] == 1 and snap_data[1] == 0xFF
+        assert branch.EEPROM_read(0) == 2 and branch.EEPROM_read(1) == 0xFF
+        assert arduino.EEPROM_read(0) == 1 and arduino.EEPROM_read(1) == 3
+
+
+class TestInterrupts:
+
+    def test_timer_interrupt_runs_during_delay(self):
+        """테스트: delay() 중에도 타이머 ISR이 제시간에 실행"""
+        arduino = ArduinoUnoR4WiFiMock(
+            seed=1, clock_mode=ClockMode.VIRTUAL, serial_sink="discard"
+        )
+        ticks = []
+        arduino.attachTimerInterrupt(1000, lambda: ticks.append(arduino.micros()))
+
+        start = time.perf_counter()
+        arduino.delay(100)
+        assert time.perf_counter() - start < 1.0
+
+        assert len(ticks) == 100
+        assert ticks[0] == 1000 and ticks[-1] == 100_000
+        stats = arduino.get_interrupt_stats()["timer0"]
+        assert stats["count"] == 100 and stats["latency_max_cycles"] == 0
+
+    def test_pending_interrupt_waits_for_interrupts(self):
+        """테스트: noInterrupts() 구간의 핀 인터럽트는 interrupts() 때 지연 실행"""
+        arduino = ArduinoUnoR4WiFiMock(
+            seed=1, clock_mode=ClockMode.VIRTUAL, serial_sink="discard"
+        )
+        hits = []
+        arduino.pinMode(2, PinMode.INPUT)
+        arduino.attachInterrupt(2, lambda: hits.append(1), InterruptMode.RISING)
+
+        arduino.noInterrupts()
+        arduino.set_pin_input(2, 1)
+        arduino.delayMicroseconds(10)
+        assert hits == []
+
+        arduino.interrupts()
+        assert hits == [1]
+        latency = arduino.get_interrupt_stats()["pin2"]["latency_max_us"]
+        assert latency >= 10
+
+
+class TestMockPool:
+
+    def test_reset_matches_fresh_mock(self):
+        """테스트: reset() 후에는 새로 생성한 Mock과 같은 난수/카운터/메모리 상태"""
+        arduino = ArduinoUnoR4WiFiMock(seed=3, serial_sink="discard", verbose=False)
+        first = [arduino.random_range(0, 3) for _ in range(50)]
+        arduino.randomSeed(99)
+        arduino.digitalWrite(13, 1)
+        arduino.EEPROM_write(0, 7)
+        arduino.allocate_sram(100)
+        arduino.attachTimerInterrupt(100, lambda: None)
+
+        arduino.reset()
+
+        assert [arduino.random_range(0, 3) for _ in range(50)] == first
+        fresh = ArduinoUnoR4WiFiMock(seed=3, serial_sink="discard", verbose=False)
+        [fresh.random_range(0, 3) for _ in range(50)]
+        assert arduino.get_performance_stats()["instruction_count"] == (
+            fresh.get_performance_stats()["instruction_count"]
+        )
+        assert arduino.digital_pins_value[13] == 0
+        assert arduino.EEPROM_read(0) == 0
+        assert arduino.sram_usage == 0
+        assert len(arduino.scheduler) == 0
+
+    def test_reset_scope_keeps_other_state(self):
+        """테스트: COUNTERS만 초기화하면 RNG 스트림과 핀 상태는 이어짐"""
+        arduino = ArduinoUnoR4WiFiMock(seed=3, serial_sink="discard", verbose=False)
+        reference = ArduinoUnoR4WiFiMock(seed=3, serial_sink="discard", verbose=False)
+        expected = [reference.random_range(0, 100) for _ in range(20)]
+
+        [arduino.random_range(0, 100) for _ in range(10)]
+        arduino.pinMode(13, PinMode.OUTPUT)
+        arduino.digitalWrite(13, 1)
+        arduino.reset(ResetScope.COUNTERS)
+
+        assert arduino.instruction_count == 0
+        assert not arduino.function_calls
+        assert arduino.digital_pins_value[13] == 1
+        assert [arduino.random_range(0, 100) for _ in range(10)] == expected[10:]
+
+    def test_pool_reuses_instances_quietly(self, capsys):
+        """테스트: 풀은 반납된 Mock을 재사용하고 아무것도 출력하지 않음"""
+        pool = MockPool()
+        with pool.mock(1) as arduino:
+            first = arduino
+            a = [arduino.random_range(0, 3) for _ in range(20)]
+        with pool.mock(2, board="uno") as arduino:
+            assert arduino is not first
+        with pool.mock(1) as arduino:
+            assert arduino is first
+            assert [arduino.random_range(0, 3) for _ in range(20)] == a
+
+        assert pool.created == 2
+        assert pool.reused == 1
+        assert capsys.readouterr().out == ""
+
+    def test_pool_reseeds_on_reuse(self, monkeypatch):
+        """테스트: 재사용 시 항상 새 시드 적용 (RNG 없는 scope, seed=None 포함)"""
+        pool = MockPool(scope=ResetScope.COUNTERS)
+        with pool.mock(1) as arduino:
+            [arduino.random_range(0, 100) for _ in range(10)]
+        with pool.mock(2) as arduino:
+            expected = ArduinoUnoR4WiFiMock(seed=2, verbose=False)
+            assert [arduino.random_range(0, 100) for _ in range(20)] == [
+                expected.random_range(0, 100) for _ in range(20)
+            ]
+
+        monkeypatch.setattr(time, "time", lambda: 777.5)
+        with pool.mock() as arduino:
+            assert pool.reused == 2
+            assert arduino._random_seed == 777
+            expected = ArduinoUnoR4WiFiMock(seed=777, verbose=False)
+            assert arduino.random_range(0, 100) == expected.random_range(0, 100)
+
+    def test_pool_accepts_unhashable_board_profile(self):
+        """테스트: HardwareSpecs 같은 해시 불가능한 인자도 값 기준으로 풀링"""
+        pool = MockPool()
+        with pool.mock(1, board=get_board_profile("uno")) as arduino:
+            first = arduino
+            assert arduino.specs.board_name == get_board_profile("uno").board_name
+        with pool.mock(1, board=get_board_profile("esp32")) as arduino:
+            assert arduino is not first
+        with pool.mock(1, board=get_board_profile("uno")) as arduino:
+            assert arduino is first
+
+        assert pool.created == 2
+        assert pool.reused == 1
@@ -0,0 +1,76 @@
+"""
+Unit tests for the vectorized batch engine
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from batch_engine import resolve_lookup_chain
+from random_generator_sim import RandomNumberGeneratorSim
+
+
+class TestBatchEngine:
+    LOOKUP_TABLE = [[1, 1, 2], [0, 0, 2], [0, 1, 0]]
+
+    def test_chain_matches_sequential_lookup(self):
+        """테스트: 청크 체인 계산 = 룩업 테이블을 순서대로 적용한 결과"""
+        rng = np.random.default_rng(0)
+        for n in (1, 7, 8, 9, 129, 1000):
+            for previous in (-1, 0, 1, 2):
+                candidates = rng.integers(0, 3, n)
+                expected = []
+                state = previous
+                for candidate in candidates.tolist():
+                    state = (
+                        candidate
+                        if state == -1
+                        else self.LOOKUP_TABLE[state][candidate]
+                    )
+                    expected.append(state)
+
+                result = resolve_lookup_chain(candidates, self.LOOKUP_TABLE, previous)
+                assert result.tolist() == expected
+
+    def test_numpy_engine_matches_scalar(self):
+        """테스트: 같은 시드/백엔드면 numpy 엔진 통계가 scalar 경로와 동일"""
+        for backend in ("mt19937", "newlib", "avr"):
+            runs = {}
+            for engine in ("scalar", "numpy"):
+                arduino = ArduinoUnoR4WiFiMock(
+                    seed=42, rng_backend=backend, serial_sink="discard"
+                )
+                sim = RandomNumberGeneratorSim(arduino, verbose=False)
+                results = [
+                    sim.run_batch_simulation(
+                        n, show_progress=False, engine=engine, chunk_size=777
+                    )
+                    for n in (3000, 1001)
+                ]
+                runs[engine] = (sim, results)
+
+            (scalar, scalar_results), (vector, vector_results) = runs.values()
+            for a, b in zip(scalar_results, vector_results):
+                for key in (
+                    "distribution_analysis",
+                    "constraint_verification",
+                    "transition_analysis",
+                    "sample_sequence",
+                ):
+                    assert a[key] == b[key]
+                assert (
+                    a["performance_metrics"]["arduino_instruction_count"]
+                    == b["performance_metrics"]["arduino_instruction_count"]
+                )
+            assert scalar.stats.number_frequency == vector.stats.number_frequency
+            assert scalar.stats.transition_matrix == vector.stats.transition_matrix
+            assert scalar.stats.total_count == vector.stats.total_count
+            assert scalar.arduino.random_range(0, 1000) == vector.arduino.random_range(
+                0, 1000
+            )
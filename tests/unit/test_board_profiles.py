@@ -0,0 +1,38 @@
+"""
+Unit tests for the board profiles
+"""
+
+import sys
+from pathlib import Path
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+
+
+class TestBoardProfiles:
+
+    def test_board_selects_specs_costs_and_rng(self):
+        """테스트: board 인자로 사양, 비용 테이블, RNG 종류 선택"""
+        uno = ArduinoUnoR4WiFiMock(
+            seed=1, serial_sink="discard", board="uno", rng_backend="board"
+        )
+
+        assert uno.specs.clock_speed_hz == 16_000_000
+        assert uno.specs.sram_bytes == 2 * 1024
+        assert uno.costs.board == "uno"
+        assert uno.rng.name == "avr"
+        assert uno.eeprom.size == 1024
+
+        uno.analog_pins_value[0] = 5000
+        assert uno.analogRead(0) <= 1023
+
+    def test_default_board_is_unchanged(self):
+        """테스트: 기본 보드는 Uno R4 WiFi + mt19937"""
+        arduino = ArduinoUnoR4WiFiMock(seed=1, serial_sink="discard")
+
+        assert arduino.get_hardware_info()["board_name"] == "Arduino Uno R4 WiFi"
+        assert arduino.costs.board == "uno_r4_wifi"
+        assert arduino.rng.name == "mt19937"
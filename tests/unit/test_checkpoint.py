@@ -0,0 +1,111 @@
+"""
+Unit tests for the simulation checkpoints
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from random_generator_sim import RandomNumberGeneratorSim
+
+
+class TestCheckpoint:
+
+    @staticmethod
+    def _simulator(backend="mt19937"):
+        arduino = ArduinoUnoR4WiFiMock(
+            seed=77, rng_backend=backend, serial_sink="discard", verbose=False
+        )
+        return RandomNumberGeneratorSim(arduino, verbose=False)
+
+    @staticmethod
+    def _fingerprint(sim, results):
+        return (
+            results["distribution_analysis"]["counts"],
+            results["transition_analysis"]["transitions"],
+            results["constraint_verification"]["consecutive_violations"],
+            results["sample_sequence"],
+            results["performance_metrics"]["arduino_instruction_count"],
+            results["performance_metrics"]["arduino_function_calls"],
+            sim.stats.number_frequency,
+            sim.stats.transition_matrix,
+            sim.stats.generation_latency.count,
+            sim.arduino.random_range(0, 1000),
+        )
+
+    def test_resume_after_crash_matches_uninterrupted_run(self, tmp_path):
+        """테스트: 중단 후 체크포인트에서 재개한 결과 = 한 번에 실행한 결과"""
+        for backend in ("mt19937", "newlib"):
+            reference = self._simulator(backend)
+            expected = self._fingerprint(
+                reference,
+                reference.run_batch_simulation(5000, show_progress=False),
+            )
+
+            crashed = self._simulator(backend)
+            generate = crashed.generate_random_number
+
+            def crash_at_3500(crashed=crashed, generate=generate):
+                if crashed.generation_count == 3500:
+                    raise KeyboardInterrupt
+                return generate()
+
+            crashed.generate_random_number = crash_at_3500
+            path = tmp_path / f"{backend}.json"
+            with pytest.raises(KeyboardInterrupt):
+                crashed.run_batch_simulation(
+                    5000,
+                    show_progress=False,
+                    checkpoint_path=path,
+                    checkpoint_every=1000,
+                )
+
+            for engine in ("scalar", "numpy"):
+                resumed = self._simulator(backend)
+                results = resumed.run_batch_simulation(
+                    5000, show_progress=False, engine=engine, resume_from=path
+                )
+                assert self._fingerprint(resumed, results) == expected
+
+    def test_extend_finished_run(self, tmp_path):
+        """테스트: 종료 체크포인트에서 반복 수를 늘려 이어 실행 = 처음부터 긴 실행"""
+        reference = self._simulator()
+        expected = self._fingerprint(
+            reference,
+            reference.run_batch_simulation(
+                4000, show_progress=False, engine="numpy", chunk_size=999
+            ),
+        )
+
+        path = tmp_path / "run.json"
+        first = self._simulator()
+        first.run_batch_simulation(1500, show_progress=False, checkpoint_path=path)
+
+        extended = self._simulator()
+        results = extended.run_batch_simulation(
+            4000, show_progress=False, resume_from=path
+        )
+        assert self._fingerprint(extended, results) == expected
+        assert results["simulation_info"]["total_iterations"] == 4000
+
+    def test_rejects_mismatched_backend(self, tmp_path):
+        """테스트: 다른 RNG 백엔드 Mock으로는 재개하지 않음"""
+        path = tmp_path / "run.json"
+        self._simulator("avr").run_batch_simulation(
+            100, show_progress=False, checkpoint_path=path
+        )
+
+        try:
+            self._simulator("mt19937").run_batch_simulation(
+                200, show_progress=False, resume_from=path
+            )
+        except ValueError as error:
+            assert "avr" in str(error)
+        else:
+            raise AssertionError("expected ValueError")
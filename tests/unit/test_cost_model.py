@@ -0,0 +1,38 @@
+"""
+Unit tests for the board cycle cost model
+"""
+
+import sys
+from pathlib import Path
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from cost_model import get_cost_table
+
+
+class TestCostModel:
+
+    def test_board_costs_drive_cycle_counts(self):
+        """테스트: 함수 사이클 비용이 보드별 비용 모델에서 결정됨"""
+        r4 = ArduinoUnoR4WiFiMock(seed=1, serial_sink="discard")
+        uno = ArduinoUnoR4WiFiMock(seed=1, serial_sink="discard", cost_table="uno")
+
+        r4.random_range(0, 3)
+        uno.random_range(0, 3)
+
+        assert r4.instruction_count == get_cost_table("uno_r4_wifi").function("random")
+        assert uno.instruction_count == get_cost_table("uno").function("random")
+        assert uno.instruction_count > r4.instruction_count
+
+    def test_inherited_board_and_operations(self):
+        """테스트: inherits 보드는 상위 보드 비용을 그대로 사용"""
+        uno = get_cost_table("uno")
+        nano = get_cost_table("nano")
+
+        assert nano.functions == uno.functions
+        assert nano.sum_operations(["modulo", "compare"]) == (
+            uno.operation("modulo") + uno.operation("compare")
+        )
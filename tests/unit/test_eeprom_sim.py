@@ -0,0 +1,72 @@
+"""
+Unit tests for the EEPROM backends
+"""
+
+import sys
+from pathlib import Path
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from eeprom_sim import ERASED_VALUE, MmapEEPROM, RamEEPROM
+
+
+class TestEEPROM:
+
+    def test_ram_eeprom_data_is_bytearray(self):
+        """테스트: 기본 EEPROM은 0x00이고 eeprom_data는 셀을 공유하는 bytearray"""
+        arduino = ArduinoUnoR4WiFiMock(seed=1, serial_sink="discard")
+        data = arduino.eeprom_data
+        assert isinstance(data, bytearray)
+        assert len(data) == arduino.specs.eeprom_bytes and not any(data)
+
+        arduino.EEPROM_write(0, 5)
+        data[1] = 6
+        assert data[0] == 5 and arduino.EEPROM_read(1) == 6
+
+        erased = ArduinoUnoR4WiFiMock(
+            seed=1, serial_sink="discard", eeprom_fill_value=ERASED_VALUE
+        )
+        assert erased.EEPROM_read(0) == 0xFF
+
+    def test_write_sequence_matches_scalar_updates(self):
+        """테스트: 벡터화 write_sequence가 update() 반복 호출과 같은 결과"""
+        values = [0, 1, 1, 2, 2, 2, 0, 1, 0, 0]
+        addresses = [0, 1, 0, 0, 1, 2, 2, 0, 1, 1]
+
+        scalar = RamEEPROM(16)
+        for address, value in zip(addresses, values):
+            if scalar.read(address) != value:
+                scalar.write(address, value)
+
+        batch = RamEEPROM(16)
+        programmed = batch.write_sequence(addresses, values, update=True)
+
+        assert programmed == int(scalar.write_counts.sum())
+        assert list(batch.data) == list(scalar.data)
+        assert list(batch.write_counts) == list(scalar.write_counts)
+
+    def test_mmap_eeprom_survives_power_cycle(self, tmp_path):
+        """테스트: mmap EEPROM은 Mock을 다시 만들어도 내용과 쓰기 횟수 유지"""
+        spec = f"mmap:{tmp_path / 'eeprom.bin'}"
+        first = ArduinoUnoR4WiFiMock(seed=1, serial_sink="discard", eeprom=spec)
+        first.EEPROM_put_sequence(0, [1, 2, 2, 0] * 1000)
+        first.eeprom.close()
+
+        second = ArduinoUnoR4WiFiMock(seed=1, serial_sink="discard", eeprom=spec)
+        assert isinstance(second.eeprom, MmapEEPROM)
+        assert second.EEPROM_read(0) == 0
+        assert second.eeprom.wear_report()["max_cell_writes"] == 3000
+
+    def test_write_latency_is_charged(self):
+        """테스트: 실제로 프로그래밍한 셀만 쓰기 대기 시간 청구"""
+        arduino = ArduinoUnoR4WiFiMock(seed=1, serial_sink="discard")
+        costs = arduino.function_costs
+
+        arduino.EEPROM_put(0, [1, 2, 3])
+        arduino.EEPROM_put(0, [1, 2, 3])  # 변경 없음
+
+        write_cost = costs["EEPROM.write"] + costs["EEPROM.write_latency"]
+        assert arduino.instruction_count == 6 * costs["EEPROM.read"] + 3 * write_cost
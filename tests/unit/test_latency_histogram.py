@@ -0,0 +1,53 @@
+"""
+Unit tests for the latency histogram
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from latency_histogram import LatencyHistogram
+
+
+class TestLatencyHistogram:
+
+    def test_percentiles_within_relative_error(self):
+        """테스트: 백분위 값이 정확한 값의 1% 이내"""
+        rng = np.random.default_rng(0)
+        samples = (rng.lognormal(-13, 1.5, 50_000) * 1e9).astype(np.int64)
+        histogram = LatencyHistogram()
+        for value in samples.tolist():
+            histogram.record_ns(value)
+
+        exact = np.sort(samples)
+        for p in (50, 90, 99, 99.9):
+            expected = exact[int(np.ceil(p / 100 * exact.size)) - 1]
+            assert abs(histogram.percentile_ns(p) - expected) <= expected * 0.01
+        assert histogram.max_ns == exact[-1]
+        assert histogram.summary_us()["max"] == exact[-1] / 1000
+
+    def test_merge_and_batch_match_single_histogram(self):
+        """테스트: 나눠 기록 후 병합 = 한 번에 기록, count 기록 = 같은 값 반복 기록"""
+        rng = np.random.default_rng(1)
+        samples = (rng.exponential(2e-6, 10_000) * 1e9).astype(np.int64).tolist()
+        single = LatencyHistogram()
+        for value in samples:
+            single.record_ns(value)
+
+        left, right = LatencyHistogram(), LatencyHistogram()
+        for value in samples[:3000]:
+            left.record_ns(value)
+        values, counts = np.unique(samples[3000:], return_counts=True)
+        for value, count in zip(values.tolist(), counts.tolist()):
+            right.record_ns(value, count)
+        left.merge(right)
+
+        assert left.counts == single.counts
+        assert left.summary_us() == single.summary_us()
+        restored = LatencyHistogram.from_state(left.to_state())
+        assert restored.summary_us() == single.summary_us()
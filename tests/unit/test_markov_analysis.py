@@ -0,0 +1,87 @@
+"""
+Unit tests for the Markov chain analysis
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from markov_analysis import derive_markov_model
+from multi_implementation_sim import ImplementationGenerator
+from real_arduino_sim import RealArduinoImplementationGenerator
+from sequence_analysis import SequenceCounts
+
+
+class TestMarkovAnalysis:
+
+    @staticmethod
+    def _real(impl_type):
+        impl = {"id": impl_type, "name": impl_type, "type": impl_type}
+        return derive_markov_model(
+            lambda arduino: RealArduinoImplementationGenerator(
+                impl, arduino, verbose=False
+            )
+        )
+
+    def test_exact_matrix_for_real_implementation(self):
+        """테스트: 삼항 연산자 구현의 정확한 전이 행렬, 정상 분포, 엔트로피"""
+        model = self._real("ternary_based")
+
+        expected = np.array([[0, 2, 1], [1, 0, 2], [2, 1, 0]]) / 3
+        assert np.allclose(model.transition_matrix, expected)
+        assert np.allclose(model.initial_distribution, 1 / 3)
+        assert np.allclose(model.stationary_distribution, 1 / 3)
+        assert model.violation_rate == 0
+        h = -(2 / 3 * np.log2(2 / 3) + 1 / 3 * np.log2(1 / 3))
+        assert abs(model.entropy_rate_bits - h) < 1e-12
+
+    def test_recursion_is_truncated_not_unbounded(self):
+        """테스트: 재귀 재추첨은 무시할 수 있는 확률에서 잘라내고 0.5/0.5로 수렴"""
+        model = self._real("recursive")
+
+        assert np.allclose(model.transition_matrix, (1 - np.eye(3)) / 2)
+        assert 0 < model.truncated_probability < 1e-12
+
+    def test_matches_monte_carlo_and_rejects_stateful(self):
+        """테스트: 하이브리드 구현 기대값 = 실측 근사, 패턴 구현은 마르코프 아님"""
+        impl = {"id": "h", "name": "h", "type": "hybrid"}
+        model = derive_markov_model(
+            lambda arduino: ImplementationGenerator(impl, arduino)
+        )
+        assert abs(model.violation_rate - 1 / 30) < 1e-12
+
+        generator = ImplementationGenerator(
+            impl, ArduinoUnoR4WiFiMock(seed=3, serial_sink="discard", verbose=False)
+        )
+        counts = SequenceCounts()
+        for chunk in generator.iter_chunks(iterations=30000):
+            counts.update(chunk)
+        distribution, violations = model.expected_counts(30000)
+        assert abs(counts.violations - violations) < 4 * np.sqrt(violations)
+        assert np.abs(counts.distribution - distribution).max() < 600
+
+        pattern = {"id": "p", "name": "p", "type": "pattern", "pattern": [0, 1, 2]}
+        model = derive_markov_model(
+            lambda arduino: ImplementationGenerator(pattern, arduino)
+        )
+        assert model is None
+
+    def test_out_of_range_mass_is_reported(self):
+        """테스트: Bitwise 구현의 3 반환 확률은 버리지 않고 따로 보고"""
+        impl = {"id": "bitwise", "name": "Bitwise Operations", "type": "bitwise"}
+        model = derive_markov_model(
+            lambda arduino: ImplementationGenerator(impl, arduino)
+        )
+
+        expected = np.array([[0, 2 / 3, 1 / 3], [0.5, 0, 0.5], [1, 0, 0]])
+        assert np.allclose(model.transition_matrix, expected)
+        assert abs(model.out_of_range_probability - 1 / 3) < 1e-12
+        assert model.to_dict()["out_of_range_probability"] == (
+            model.out_of_range_probability
+        )
@@ -0,0 +1,77 @@
+"""
+Unit tests for the generation dispatch
+"""
+
+import sys
+from pathlib import Path
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from multi_implementation_sim import GENERATION_METHODS, ImplementationGenerator
+from real_arduino_sim import GENERATION_METHODS as REAL_GENERATION_METHODS
+from real_arduino_sim import (
+    RealArduinoImplementationGenerator,
+    benchmark_dispatch,
+    make_legacy_dispatch,
+)
+
+
+class TestGenerationDispatch:
+
+    def _mock(self):
+        return ArduinoUnoR4WiFiMock(seed=11, serial_sink="discard", verbose=False)
+
+    def test_registry_methods_bound_once(self):
+        """테스트: 타입별 생성 메서드가 생성자에서 바인딩되고 이후 타입 문자열과 무관"""
+        for type_name, method in REAL_GENERATION_METHODS.items():
+            impl = {"id": type_name, "name": type_name, "type": type_name}
+            generator = RealArduinoImplementationGenerator(
+                impl, self._mock(), verbose=False
+            )
+            assert generator._generate == getattr(generator, method)
+
+        unknown = RealArduinoImplementationGenerator(
+            {"id": "x", "name": "x", "type": "unknown"}, self._mock(), verbose=False
+        )
+        assert unknown._generate == unknown._ternary_formula_method
+
+        impl = {"id": "f", "name": "f", "type": "formula"}
+        generator = ImplementationGenerator(impl, self._mock())
+        assert generator._generate == getattr(generator, GENERATION_METHODS["formula"])
+        reference = ImplementationGenerator(impl, self._mock())
+        expected = list(reference.iter_numbers(iterations=200))
+        generator.type = "pattern"  # 생성 후 타입을 바꿔도 디스패치는 그대로
+        assert list(generator.iter_numbers(iterations=200)) == expected
+
+    def test_benchmark_reports_every_type(self):
+        """테스트: 디스패치 벤치마크가 두 생성기의 모든 타입을 측정"""
+        rows = benchmark_dispatch(iterations=50, repeat=1)
+
+        assert {row["type"] for row in rows if row["suite"] == "real"} == set(
+            REAL_GENERATION_METHODS
+        )
+        assert {row["type"] for row in rows if row["suite"] == "simple"} <= set(
+            GENERATION_METHODS
+        )
+        assert all(row["call_ns"] > 0 and row["legacy_call_ns"] > 0 for row in rows)
+        assert all(
+            row["saved_ns"] == row["legacy_call_ns"] - row["call_ns"] for row in rows
+        )
+
+    def test_legacy_dispatch_matches_bound_methods(self):
+        """테스트: 비교용 if/elif 디스패치가 바인딩된 메서드와 같은 시퀀스 생성"""
+        for type_name in [*REAL_GENERATION_METHODS, "unknown"]:
+            impl = {"id": type_name, "name": type_name, "type": type_name}
+            bound, legacy = (
+                RealArduinoImplementationGenerator(impl, self._mock(), verbose=False)
+                for _ in range(2)
+            )
+            legacy._generate = make_legacy_dispatch(
+                legacy, REAL_GENERATION_METHODS, "_ternary_formula_method"
+            )
+            assert list(legacy.iter_numbers(iterations=300)) == list(
+                bound.iter_numbers(iterations=300)
+            )
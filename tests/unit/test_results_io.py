@@ -0,0 +1,64 @@
+"""
+Unit tests for the result file I/O
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from random_generator_sim import RandomNumberGeneratorSim
+from results_io import (
+    convert_json_results,
+    load_result_columns,
+    load_results,
+    save_results_file,
+)
+
+
+class TestResultsIO:
+
+    def _results(self):
+        sim = RandomNumberGeneratorSim(
+            ArduinoUnoR4WiFiMock(seed=5, serial_sink="discard", verbose=False),
+            verbose=False,
+        )
+        results = sim.run_batch_simulation(3000, show_progress=False)
+        return json.loads(json.dumps(results))  # JSON으로 읽은 것과 같은 형태
+
+    def test_npz_round_trip_matches_json(self, tmp_path):
+        """테스트: npz로 저장한 단일/통합 결과가 JSON과 같은 딕셔너리로 복원됨"""
+        results = self._results()
+        json_file, npz_file = save_results_file(results, tmp_path / "single", "both")
+        assert load_results(npz_file) == load_results(json_file) == results
+
+        combined = {
+            "combined_analysis": {"total_simulations": 2},
+            "individual_results": [results, results],
+        }
+        _, npz_file = save_results_file(combined, tmp_path / "combined", "both")
+        assert load_results(npz_file) == combined
+
+        columns = load_result_columns(npz_file)
+        assert columns["distribution"].shape == (2, 3)
+        assert columns["distribution"][0].sum() == 3000
+        assert columns["transitions"].shape == (2, 3, 3)
+        violations = results["constraint_verification"]["consecutive_violations"]
+        assert columns["violations"].tolist() == [violations, violations]
+        sample_size = len(results["sample_sequence"])
+        assert columns["sample_offsets"].tolist() == [0, sample_size, 2 * sample_size]
+
+    def test_convert_existing_json_results(self, tmp_path):
+        """테스트: 기존 JSON 결과 디렉토리를 npz로 변환"""
+        for i, results in enumerate([self._results(), {"simulation_info": {}}]):
+            save_results_file(results, tmp_path / f"old_{i}", "json")
+
+        converted = convert_json_results(tmp_path)
+        assert len(converted) == 2
+        for npz_file in converted:
+            json_file = Path(npz_file).with_suffix(".json")
+            assert load_results(npz_file) == load_results(json_file)
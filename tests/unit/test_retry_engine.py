@@ -0,0 +1,157 @@
+"""
+Unit tests for the retry engine
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from multi_implementation_sim import ImplementationGenerator
+from real_arduino_sim import RealArduinoImplementationGenerator
+from retry_engine import RetryEngine, expected_draws, iter_retry_chunks
+
+
+class TestRetryEngine:
+
+    def _scalar(self, values, previous, max_draws):
+        """후보 스트림을 draw()로 끝까지 소비한 출력과 통계"""
+        engine = RetryEngine(max_draws)
+        stream = iter(values)
+        outputs = []
+        while True:
+            try:
+                number = engine.draw(lambda: next(stream), previous)
+            except StopIteration:
+                return outputs, engine.stats
+            previous = (previous + 1) % 3 if number is None else number
+            outputs.append(previous)
+
+    def test_batch_matches_scalar_across_chunks(self):
+        """테스트: 런 접기 배치 결과/추첨 수 분포가 스칼라 재추첨과 같음 (폴백 포함)"""
+        rng = np.random.default_rng(3)
+        for max_draws in (100, 2, 1):
+            values = rng.integers(0, 3, 500)
+            expected, expected_stats = self._scalar(values.tolist(), 1, max_draws)
+
+            engine = RetryEngine(max_draws)
+            outputs, previous = [], 1
+            for part in np.array_split(values, [7, 8, 100, 333]):
+                chunk, collisions = engine.resolve_batch(part, previous)
+                assert len(collisions) == len(chunk)
+                outputs += chunk.tolist()
+                previous = outputs[-1] if outputs else previous
+
+            assert outputs == expected
+            assert engine.stats.outputs == expected_stats.outputs
+            assert engine.stats.fallbacks == expected_stats.fallbacks
+            histogram = engine.stats.to_dict()["histogram"]
+            assert histogram == expected_stats.to_dict()["histogram"]
+
+    def test_iter_retry_chunks_draw_metrics(self):
+        """테스트: 배치 스트림은 정확히 iterations개, 숫자당 추첨 수는 약 1.5"""
+        arduino = ArduinoUnoR4WiFiMock(seed=9, serial_sink="discard", verbose=False)
+        engine = RetryEngine()
+        chunks = list(
+            iter_retry_chunks(
+                engine, lambda n: arduino.random_range_batch(0, 3, n), 4096, 30000
+            )
+        )
+        sequence = np.concatenate(chunks)
+
+        assert sequence.size == 30000
+        assert not (sequence[1:] == sequence[:-1]).any()
+        stats = engine.stats.to_dict()
+        assert stats["outputs"] == 30000
+        assert abs(stats["mean_draws"] - expected_draws()) < 0.03
+        assert stats["p50_draws"] == 1 and 4 <= stats["p99_draws"] <= 6
+
+    def _scalar_and_batch(self, impl, make_generator, max_draws, **mock_options):
+        """같은 시드에서 generate_number() 반복과 iter_chunks() 배치 경로 실행 결과"""
+        runs = []
+        for batch in (False, True):
+            arduino = ArduinoUnoR4WiFiMock(
+                seed=6, serial_sink="discard", verbose=False, **mock_options
+            )
+            generator = make_generator(impl, arduino)
+            generator.retry_engine = RetryEngine(max_draws)
+            if batch:
+                chunks = list(generator.iter_chunks(chunk_size=97, iterations=4000))
+                assert [len(c) for c in chunks[:-1]] == [97] * (len(chunks) - 1)
+                sequence = np.concatenate(chunks).tolist()
+            else:
+                previous, sequence = -1, []
+                for _ in range(4000):
+                    previous = generator.generate_number(previous)
+                    sequence.append(previous)
+            stats = arduino.get_performance_stats()
+            runs.append(
+                (
+                    sequence,
+                    stats["instruction_count"],
+                    stats["function_calls"],
+                    stats["stack"],
+                    generator.retry_engine.stats.to_dict(),
+                )
+            )
+        return runs
+
+    def test_batch_chunks_match_scalar_generation(self):
+        """테스트: 재귀/재시도 배치 경로가 숫자 단위 생성과 출력/사이클/스택 동일"""
+        recursive = {"id": "r", "name": "r", "type": "recursive"}
+        overflowing = dict(recursive, stack_frame_bytes=600)  # Uno SRAM 2KB 초과
+        retry = {"id": "t", "name": "t", "type": "retry"}
+
+        def real(impl, arduino):
+            return RealArduinoImplementationGenerator(impl, arduino, verbose=False)
+
+        for max_draws in (100, 2):
+            scalar, batch = self._scalar_and_batch(recursive, real, max_draws)
+            assert scalar == batch
+            scalar, batch = self._scalar_and_batch(
+                overflowing, real, max_draws, board="uno"
+            )
+            assert scalar == batch
+            scalar, batch = self._scalar_and_batch(
+                retry, ImplementationGenerator, max_draws
+            )
+            assert scalar == batch
+        assert batch[4]["fallbacks"] > 0
+
+    def test_batch_path_keeps_timers_on_time(self):
+        """테스트: 예약된 타이머가 있으면 숫자 단위 경로로 생성해 ISR 횟수 유지"""
+        impl = {"id": "r", "name": "r", "type": "recursive"}
+        fired = []
+        for batch in (False, True):
+            arduino = ArduinoUnoR4WiFiMock(seed=2, serial_sink="discard", verbose=False)
+            calls = [0]
+            arduino.attachTimerInterrupt(50, lambda c=calls: c.__setitem__(0, c[0] + 1))
+            generator = RealArduinoImplementationGenerator(impl, arduino, verbose=False)
+            if batch:
+                list(generator.iter_chunks(iterations=2000))
+            else:
+                previous = -1
+                for _ in range(2000):
+                    previous = generator.generate_number(previous)
+            fired.append(calls[0])
+        assert fired[0] == fired[1] > 0
+
+    def test_recursive_method_is_iterative_with_fallback(self):
+        """테스트: 재귀 구현은 스택 프레임을 모두 돌려놓고 깊이 제한 폴백을 집계"""
+        impl = {"id": "r", "name": "r", "type": "recursive"}
+        arduino = ArduinoUnoR4WiFiMock(seed=4, serial_sink="discard", verbose=False)
+        generator = RealArduinoImplementationGenerator(impl, arduino, verbose=False)
+        generator.retry_engine = RetryEngine(max_draws=1)  # 충돌하면 바로 폴백
+
+        sequence = np.concatenate(list(generator.iter_chunks(iterations=3000)))
+        assert not (sequence[1:] == sequence[:-1]).any()
+
+        stats = generator.get_implementation_stats()["retry_draws"]
+        assert stats["outputs"] == 3000
+        assert 800 < stats["fallbacks"] < 1200  # 약 1/3
+        assert arduino.stack.depth == 0
@@ -0,0 +1,95 @@
+"""
+Unit tests for the Arduino random() backends
+"""
+
+import sys
+from pathlib import Path
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from rng_backends import (
+    AvrLibcRandomBackend,
+    Esp32RandomBackend,
+    NewlibRandomBackend,
+    create_rng_backend,
+)
+
+
+class TestRngBackends:
+
+    def test_avr_matches_minimal_standard_sequence(self):
+        """테스트: AVR-libc 백엔드가 Park-Miller 최소 표준 시퀀스 재현"""
+        backend = AvrLibcRandomBackend()
+        assert [backend.random() for _ in range(3)] == [16807, 282475249, 1622650073]
+
+    def test_newlib_matches_lcg_definition(self):
+        """테스트: newlib 백엔드가 64비트 LCG 정의와 일치"""
+        backend = NewlibRandomBackend(seed=12345)
+        state = 12345
+        for _ in range(5):
+            state = (state * 6364136223846793005 + 1) % 2**64
+            assert backend.random() == (state >> 32) & 0x7FFFFFFF
+
+    def test_zero_seed_is_ignored(self):
+        """테스트: Arduino randomSeed(0)은 상태를 바꾸지 않음"""
+        for name in ("newlib", "avr"):
+            seeded = create_rng_backend(name, 99)
+            seeded.seed(0)
+            assert seeded.random() == create_rng_backend(name, 99).random()
+
+    def test_vectorized_path_is_bit_exact(self):
+        """테스트: 벡터화 경로와 스칼라 경로가 동일한 출력 생성"""
+        for name in ("newlib", "avr"):
+            for seed in (1, 12345, 2**31 + 7, 0xFFFFFFFF):
+                scalar = create_rng_backend(name, seed)
+                vector = create_rng_backend(name, seed)
+
+                expected = [scalar.random_range(0, 3) for _ in range(70_000)]
+                assert vector.random_range_batch(0, 3, 70_000).tolist() == expected
+                assert vector.random_range(10, 1000) == scalar.random_range(10, 1000)
+
+    def test_esp32_seeded_matches_wmath(self):
+        """테스트: 시드 후 esp32 백엔드가 WMath.cpp의 rand() 곱셈-시프트와 일치"""
+        backend = Esp32RandomBackend(seed=12345)
+        state = 12345
+        for howbig in (3, 7, 1000, 2**31 - 1) * 5:
+            threshold = (-howbig % 2**32) % howbig
+            while True:
+                state = (state * 6364136223846793005 + 1) % 2**64
+                m = ((state >> 32) & 0x7FFFFFFF) * howbig
+                if m % 2**32 >= threshold:
+                    break
+            assert backend.random_range(0, howbig) == m >> 32
+
+    def test_esp32_seeded_range_never_reaches_upper_half(self):
+        """테스트: 31비트 rand()라 시드 후 random(0, 3)은 0 또는 1만 반환"""
+        values = Esp32RandomBackend(seed=7).random_range_batch(0, 3, 10_000)
+        assert set(values.tolist()) == {0, 1}
+
+    def test_esp32_zero_seed_keeps_hardware_rng(self):
+        """테스트: randomSeed(0)이면 하드웨어 RNG 경로 유지 (전 범위 출력)"""
+        backend = Esp32RandomBackend()
+        backend.seed(0)
+        assert backend.getstate()[2] is True
+        assert set(backend.random_range_batch(0, 3, 10_000).tolist()) == {0, 1, 2}
+
+    def test_esp32_vectorized_path_is_bit_exact(self):
+        """테스트: esp32 벡터화 경로가 스칼라 경로와 동일 (거절 포함)"""
+        for seed in (1, 12345, 0xFFFFFFFF):
+            scalar = Esp32RandomBackend(seed)
+            vector = Esp32RandomBackend(seed)
+            expected = [scalar.random_range(0, 3) for _ in range(20_000)]
+            assert vector.random_range_batch(0, 3, 20_000).tolist() == expected
+            assert vector.getstate() == scalar.getstate()
+
+    def test_mock_uses_selected_backend(self):
+        """테스트: Mock의 random()이 선택한 백엔드를 사용"""
+        arduino = ArduinoUnoR4WiFiMock(seed=42, rng_backend="newlib")
+        backend = NewlibRandomBackend(seed=42)
+
+        assert [arduino.random_range(0, 3) for _ in range(10)] == [
+            backend.random() % 3 for _ in range(10)
+        ]
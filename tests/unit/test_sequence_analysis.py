@@ -0,0 +1,55 @@
+"""
+Unit tests for the sequence statistics
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from sequence_analysis import SequenceCounts, analyze_sequence
+
+
+class TestSequenceAnalysis:
+
+    def test_counts_match_python_passes(self):
+        """테스트: 분포/전이/위반 수가 기존 Python 루프 계산과 동일"""
+        sequence = np.random.default_rng(3).integers(0, 3, 5000).tolist()
+        counts = analyze_sequence(sequence)
+
+        transitions = {}
+        for prev, curr in zip(sequence, sequence[1:]):
+            key = f"{prev}->{curr}"
+            transitions[key] = transitions.get(key, 0) + 1
+
+        assert counts.distribution_dict() == {i: sequence.count(i) for i in range(3)}
+        assert counts.transition_dict() == transitions
+        assert counts.violations == sum(a == b for a, b in zip(sequence, sequence[1:]))
+
+    def test_chunked_update_and_merge_include_boundaries(self):
+        """테스트: 청크로 나눠 update/merge해도 전체 집계와 동일"""
+        sequence = np.random.default_rng(4).integers(0, 3, 1000)
+        whole = analyze_sequence(sequence)
+
+        streamed = SequenceCounts()
+        merged = SequenceCounts()
+        for chunk in np.array_split(sequence, 7):
+            streamed.update(chunk)
+            merged.merge(analyze_sequence(chunk))
+
+        for counts in (streamed, merged):
+            assert (counts.transitions == whole.transitions).all()
+            assert (counts.distribution == whole.distribution).all()
+
+    def test_out_of_range_values_are_counted_separately(self):
+        """테스트: 0..2 밖의 값은 실패 대신 분포/전이에서 빼고 따로 집계"""
+        sequence = [0, 3, 1, 1, 2, 3, 0, 0]
+        counts = analyze_sequence(sequence[:4]).merge(analyze_sequence(sequence[4:]))
+
+        assert counts.distribution_dict() == {i: sequence.count(i) for i in range(3)}
+        assert counts.transition_dict() == {"1->1": 1, "1->2": 1, "0->0": 1}
+        assert counts.violations == 2 and counts.out_of_range == 2
@@ -0,0 +1,45 @@
+"""
+Unit tests for the simulated Serial port
+"""
+
+import sys
+from pathlib import Path
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock, ClockMode
+from serial_sim import MemorySink
+
+
+class TestSerial:
+
+    def test_print_blocks_only_when_tx_buffer_full(self):
+        """테스트: 64바이트 TX 버퍼가 찰 때만 Serial.print()가 블로킹"""
+        arduino = ArduinoUnoR4WiFiMock(
+            seed=1, clock_mode=ClockMode.VIRTUAL, serial_sink="discard"
+        )
+        arduino.Serial_begin(9600)
+
+        arduino.Serial_print("x" * 64)
+        assert arduino.serial.blocked_cycles == 0
+        assert arduino.Serial_availableForWrite() == 0
+
+        arduino.Serial_print("y")
+        assert arduino.serial.blocked_cycles > 0
+
+        arduino.Serial_flush()
+        assert arduino.Serial_availableForWrite() == 64
+        # 65바이트 * 10비트 / 9600 baud
+        assert arduino.millis() >= 65 * 10 * 1000 // 9600
+
+    def test_memory_sink_is_bounded(self):
+        """테스트: 메모리 싱크는 최근 출력만 보관"""
+        arduino = ArduinoUnoR4WiFiMock(seed=1, serial_sink=MemorySink(max_entries=5))
+
+        for i in range(100):
+            arduino.Serial_println(i)
+
+        assert arduino.serial_output == [f"{i}\n" for i in range(95, 100)]
+        assert arduino.serial.bytes_written == sum(len(f"{i}\n") for i in range(100))
@@ -0,0 +1,56 @@
+"""
+Unit tests for the call stack simulation
+"""
+
+import sys
+from pathlib import Path
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from real_arduino_sim import RealArduinoImplementationGenerator
+
+
+class TestCallStack:
+
+    def _run(self, arduino, impl_type, iterations=2000, **config):
+        impl = {"id": impl_type, "name": impl_type, "type": impl_type, **config}
+        generator = RealArduinoImplementationGenerator(impl, arduino, verbose=False)
+        previous = -1
+        for _ in range(iterations):
+            previous = generator.generate_number(previous)
+        return arduino.get_stack_stats()
+
+    def test_recursive_frames_charge_sram(self):
+        """테스트: 재귀 호출마다 프레임이 쌓이고 생성 1회마다 최대 깊이 기록"""
+        arduino = ArduinoUnoR4WiFiMock(seed=1, serial_sink="discard", board="uno")
+        stack = self._run(arduino, "recursive")
+        frame = arduino.specs.call_frame_bytes + arduino.specs.int_size
+
+        assert arduino.stack.depth == 0
+        assert stack["samples"] == 2000
+        assert sum(stack["depth_histogram"].values()) == 2000
+        assert stack["max_depth"] > 2
+        assert stack["depth_histogram"][1] > stack["depth_histogram"][2]
+        assert stack["peak_stack_bytes"] == stack["max_depth"] * frame
+        peak_sram = arduino.sram_usage + stack["peak_stack_bytes"]
+        assert stack["peak_sram_bytes"] == peak_sram
+        assert stack["overflows"] == 0
+
+    def test_lambda_uses_two_frames(self):
+        """테스트: 람다 방식은 외부 함수 + 람다 호출로 항상 깊이 2"""
+        arduino = ArduinoUnoR4WiFiMock(seed=1, serial_sink="discard")
+        stack = self._run(arduino, "lambda_based", iterations=100)
+
+        assert stack["depth_histogram"] == {2: 100}
+        assert stack["max_depth"] == 2
+
+    def test_stack_overflow_is_counted(self):
+        """테스트: 프레임이 남은 SRAM을 넘으면 오버플로우로 집계"""
+        arduino = ArduinoUnoR4WiFiMock(seed=1, serial_sink="discard", board="uno")
+        stack = self._run(arduino, "recursive", stack_frame_bytes=1024)
+
+        assert stack["overflows"] > 0
+        assert stack["headroom_bytes"] < 0
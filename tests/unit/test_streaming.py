@@ -0,0 +1,84 @@
+"""
+Unit tests for the chunked streaming
+"""
+
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from multi_implementation_sim import ImplementationGenerator
+from random_generator_sim import RandomNumberGeneratorSim
+from real_arduino_sim import RealArduinoImplementationGenerator
+from sequence_analysis import analyze_sequence
+
+
+class TestStreaming:
+
+    @staticmethod
+    def _arduino(seed=9):
+        return ArduinoUnoR4WiFiMock(seed=seed, serial_sink="discard", verbose=False)
+
+    def test_simulator_chunks_match_batch_run(self):
+        """테스트: iter_chunks() 스트림 = 대량 실행과 같은 시퀀스와 통계"""
+        reference = RandomNumberGeneratorSim(self._arduino(), verbose=False)
+        results = reference.run_batch_simulation(3000, show_progress=False)
+
+        for engine in ("scalar", "numpy"):
+            sim = RandomNumberGeneratorSim(self._arduino(), verbose=False)
+            sim.arduino.reset_performance_counters()
+            chunks = list(sim.iter_chunks(512, iterations=3000, engine=engine))
+
+            assert [chunk.size for chunk in chunks] == [512] * 5 + [440]
+            assert chunks[0].dtype == np.uint8
+            sequence = np.concatenate(chunks)
+            assert sequence[:50].tolist() == results["sample_sequence"]
+            assert (
+                analyze_sequence(sequence).distribution_dict()
+                == results["distribution_analysis"]["counts"]
+            )
+            assert sim.stats.transition_matrix == reference.stats.transition_matrix
+            assert (
+                sim.arduino.instruction_count == reference.arduino.instruction_count
+            )
+
+    def test_generators_stream_lazily_without_bound(self):
+        """테스트: iterations=None이면 끝없이 생성하고 읽은 만큼만 생성"""
+        sim = RandomNumberGeneratorSim(self._arduino(), verbose=False)
+        numbers = list(itertools.islice(sim.iter_numbers(chunk_size=100), 250))
+        assert len(numbers) == 250
+        assert sim.generation_count == 300  # 세 번째 청크까지만 생성
+
+        impl = {"id": "t", "name": "t", "type": "ternary_based"}
+        arduino = self._arduino()
+        real = RealArduinoImplementationGenerator(impl, arduino, verbose=False)
+        streamed = list(itertools.islice(real.iter_numbers(chunk_size=64), 500))
+
+        arduino = self._arduino()
+        real = RealArduinoImplementationGenerator(impl, arduino, verbose=False)
+        previous, expected = -1, []
+        for _ in range(500):
+            previous = real.generate_number(previous)
+            expected.append(previous)
+        assert streamed == expected
+
+    def test_implementation_generator_chunks(self):
+        """테스트: ImplementationGenerator 스트림 = generate_number() 반복 결과"""
+        impl = {"id": "lut", "name": "lut", "type": "lookup_table"}
+        impl["lookup_table"] = [[1, 1, 2], [0, 0, 2], [0, 1, 0]]
+
+        generator = ImplementationGenerator(impl, self._arduino())
+        streamed = np.concatenate(list(generator.iter_chunks(100, iterations=1234)))
+
+        generator = ImplementationGenerator(impl, self._arduino())
+        previous, expected = -1, []
+        for _ in range(1234):
+            previous = generator.generate_number(previous)
+            expected.append(previous)
+        assert streamed.tolist() == expected
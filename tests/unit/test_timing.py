@@ -0,0 +1,61 @@
+"""
+Unit tests for the generation timing modes
+"""
+
+import sys
+from pathlib import Path
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from arduino_mock import ArduinoUnoR4WiFiMock
+from random_generator_sim import RandomNumberGeneratorSim
+from timing import TimingMode, timer_overhead_ns
+
+
+class TestTimingModes:
+
+    @staticmethod
+    def _run(mode, iterations=1000, engine="scalar"):
+        arduino = ArduinoUnoR4WiFiMock(seed=4, serial_sink="discard", verbose=False)
+        sim = RandomNumberGeneratorSim(
+            arduino, verbose=False, timing_mode=mode, timing_interval=64
+        )
+        return sim.run_batch_simulation(
+            iterations, show_progress=False, engine=engine, chunk_size=300
+        )
+
+    def test_modes_change_only_latency_samples(self):
+        """테스트: 측정 방식은 측정 횟수만 바꾸고 생성 결과는 그대로"""
+        results = {mode: self._run(mode) for mode in TimingMode}
+
+        samples = {
+            mode: r["performance_metrics"]["timed_samples"]
+            for mode, r in results.items()
+        }
+        assert samples[TimingMode.EVERY] == 1000
+        assert samples[TimingMode.SAMPLED] == 16  # ceil(1000 / 64)
+        assert samples[TimingMode.BLOCK] == 1000  # 묶음 평균을 생성 수만큼 기록
+        assert samples[TimingMode.OFF] == 0
+
+        reference = results[TimingMode.EVERY]
+        for r in results.values():
+            assert r["sample_sequence"] == reference["sample_sequence"]
+            assert (
+                r["distribution_analysis"]["counts"]
+                == reference["distribution_analysis"]["counts"]
+            )
+
+    def test_overhead_is_calibrated_and_subtracted(self):
+        """테스트: 타이머 오버헤드를 한 번 보정하고 기록값은 음수가 되지 않음"""
+        overhead = timer_overhead_ns()
+        assert overhead >= 0
+        assert timer_overhead_ns() == overhead  # 캐시
+
+        metrics = self._run("every")["performance_metrics"]
+        assert metrics["timer_overhead_ns"] == overhead
+        assert metrics["min_generation_time_microseconds"] >= 0
+
+        off = self._run("off", engine="numpy")["performance_metrics"]
+        assert off["timed_samples"] == 0 and off["timer_overhead_ns"] == 0
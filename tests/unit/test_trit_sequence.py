@@ -0,0 +1,44 @@
+"""
+Unit tests for the packed trit sequence
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add simulation source to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src" / "arduino_simulation"))
+
+from trit_sequence import TritSequence
+
+
+class TestTritSequence:
+
+    def test_append_extend_and_slicing(self):
+        """테스트: append/extend 혼합 후 인덱싱, 슬라이싱, 반복이 list와 동일"""
+        values = np.random.default_rng(5).integers(0, 3, 1003).tolist()
+        sequence = TritSequence()
+        for value in values[:7]:
+            sequence.append(value)
+        sequence.extend(values[7:900])
+        for value in values[900:]:
+            sequence.append(value)
+
+        assert len(sequence) == len(values)
+        assert list(sequence) == values
+        assert sequence[-1] == values[-1]
+        assert sequence[10:523].tolist() == values[10:523]
+        assert sequence[::7].tolist() == values[::7]
+        assert [sequence.count(i) for i in range(3)] == [
+            values.count(i) for i in range(3)
+        ]
+        assert np.array_equal(np.asarray(sequence), values)
+
+    def test_packs_five_values_per_byte(self):
+        """테스트: 5개 값당 1바이트로 저장"""
+        sequence = TritSequence(np.random.default_rng(6).integers(0, 3, 1_000_000))
+
+        assert sequence.nbytes == 200_000
+        assert sequence.packed.max() < 243